@@ -10,6 +10,8 @@ Functions / Call sites
 ----------------------
 * :func:`_apply_strip_patch_strategy` — invoked from ``publish.run`` after the
   workspace is staged, to enforce ``publish.strip_patches`` settings.
+* :func:`_strip_manifest_patches` — the in-memory half of the strategy, which
+  mutates a parsed manifest without touching the filesystem.
 * Supporting helpers (_load_manifest_document, _resolve_patch_tables, etc.)
   encapsulate TOML parsing/writing and patch-table cleanup.
 
@@ -35,7 +37,6 @@ import typing as typ
 
 from tomlkit import parse as parse_toml
 from tomlkit.exceptions import TOMLKitError
-from tomlkit.toml_document import TOMLDocument
 
 from lading import config as config_module
 from lading.exceptions import LadingError
@@ -43,18 +44,12 @@ from lading.exceptions import LadingError
 if typ.TYPE_CHECKING:  # pragma: no cover - typing helpers only
     from pathlib import Path
 
+    from tomlkit.toml_document import TOMLDocument
+
     from lading.commands.publish_plan import PublishPlan
 
 StripPatchesSetting = config_module.StripPatchesSetting
 
-type _ManifestValidation = (
-    tuple[
-        TOMLDocument,
-        tuple[cabc.MutableMapping[str, object], cabc.MutableMapping[str, object]],
-    ]
-    | None
-)
-
 
 class PublishPreparationError(LadingError):
     """Publish staging failed to prepare required assets.
@@ -132,18 +127,16 @@ def _resolve_patch_tables(
             return None
 
 
-def _validate_and_load_manifest(
+def _load_staged_manifest(
     staging_root: Path, strategy: StripPatchesSetting
-) -> _ManifestValidation:
-    """Load and validate the manifest for patch stripping."""
+) -> TOMLDocument | None:
+    """Load the staged manifest unless stripping is disabled or it is absent."""
     if strategy is False:
         return None
     manifest_path = staging_root / "Cargo.toml"
     if not manifest_path.exists():
         return None
-    document = _load_manifest_document(manifest_path)
-    patch_tables = _resolve_patch_tables(document)
-    return None if patch_tables is None else (document, patch_tables)
+    return _load_manifest_document(manifest_path)
 
 
 def _cleanup_empty_patch_tables(
@@ -166,6 +159,8 @@ def _apply_strategy_to_patches(
 ) -> bool:
     """Apply the strip patch strategy and return True if modified."""
     match strategy:
+        case False:
+            return False
         case "all":
             return patch_table.pop("crates-io", None) is not None
         case "per-crate":
@@ -175,27 +170,32 @@ def _apply_strategy_to_patches(
             raise PublishPreparationError(message)
 
 
+def _strip_manifest_patches(
+    document: TOMLDocument,
+    strategy: StripPatchesSetting,
+    publishable_names: tuple[str, ...],
+) -> bool:
+    """Apply ``strategy`` to ``document`` in place; return ``True`` if modified."""
+    patch_tables = _resolve_patch_tables(document)
+    if patch_tables is None:
+        return False
+    patch_table, crates_io = patch_tables
+    if not _apply_strategy_to_patches(
+        strategy, patch_table, crates_io, publishable_names
+    ):
+        return False
+    _cleanup_empty_patch_tables(document, patch_table, crates_io)
+    return True
+
+
 def _apply_strip_patch_strategy(
     staging_root: Path,
     plan: PublishPlan,
     strategy: StripPatchesSetting,
 ) -> None:
     """Modify the staged manifest according to ``publish.strip_patches``."""
-    validation = _validate_and_load_manifest(staging_root, strategy)
-    if validation is None:
+    document = _load_staged_manifest(staging_root, strategy)
+    if document is None:
         return
-    document, patch_tables = validation
-    patch_table, crates_io = patch_tables
-    manifest_path = staging_root / "Cargo.toml"
-
-    modified = _apply_strategy_to_patches(
-        strategy,
-        patch_table,
-        crates_io,
-        plan.publishable_names,
-    )
-    if not modified:
-        return
-
-    _cleanup_empty_patch_tables(document, patch_table, crates_io)
-    _write_manifest_document(manifest_path, document)
+    if _strip_manifest_patches(document, strategy, plan.publishable_names):
+        _write_manifest_document(staging_root / "Cargo.toml", document)
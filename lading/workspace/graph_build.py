@@ -401,12 +401,35 @@ def _extract_readme_workspace_flag(package_table: object) -> bool:
 
 
 def _manifest_uses_workspace_readme(manifest_path: Path) -> bool:
-    """Return ``True`` when ``readme.workspace`` is set in ``manifest_path``."""
+    """Return ``True`` when ``readme.workspace`` is set in ``manifest_path``.
+
+    Parameters
+    ----------
+    manifest_path : Path
+        Crate manifest to inspect.
+
+    Returns
+    -------
+    bool
+        ``True`` when the manifest opts into the workspace readme. Manifests
+        whose text never mentions ``readme`` return ``False`` unparsed.
+
+    Raises
+    ------
+    WorkspaceModelError
+        When the manifest cannot be read, or mentions ``readme`` but is not
+        valid TOML. A malformed manifest without a ``readme`` key is not
+        parsed and so does not raise.
+    """
     try:
         text = manifest_path.read_text(encoding="utf-8")
     except FileNotFoundError as exc:  # pragma: no cover - defensive guard
         message = f"manifest not found: {manifest_path}"
         raise WorkspaceModelError(message) from exc
+    # cargo metadata has already parsed every member manifest, so skipping
+    # the TOML parse here cannot hide an otherwise unreported syntax error.
+    if "readme" not in text:
+        return False
     try:
         document = parse(text)
     except TOMLKitError as exc:
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import collections.abc as cabc
+import itertools
 import typing as typ
 from pathlib import Path
 
@@ -33,6 +34,17 @@ def _publish_plan_lines(cli_run: CliRunResult) -> list[str]:
     return [line.strip() for line in cli_run["stdout"].splitlines() if line.strip()]
 
 
+def _lines_after_header(lines: list[str], header: str) -> list[str]:
+    """Return the publish plan ``lines`` following ``header``."""
+    # A single ``index`` call both proves the header exists and locates it.
+    try:
+        section_index = lines.index(header)
+    except ValueError:
+        message = f"Expected {header!r} in publish plan output: {lines!r}"
+        raise AssertionError(message) from None
+    return lines[section_index + 1 :]
+
+
 def _extract_staging_root_from_plan(lines: list[str]) -> Path:
     """Return the staging root path parsed from publish plan ``lines``."""
     staging_line = next(
@@ -93,10 +105,7 @@ def _extract_crate_names_from_invocations(
 
 def _has_contiguous_args(args: tuple[str, ...], first: str, second: str) -> bool:
     """Return True when ``first`` is immediately followed by ``second``."""
-    return any(
-        args[index] == first and args[index + 1] == second
-        for index in range(len(args) - 1)
-    )
+    return (first, second) in itertools.pairwise(args)
 
 
 def _has_ordered_args_non_contiguous(
@@ -39,6 +39,7 @@ from .test_publish_helpers import (
     _get_patch_entries,
     _get_required_invocations,
     _has_contiguous_args,
+    _lines_after_header,
     _load_staged_manifest,
     _publish_plan_lines,
     _split_names,
@@ -290,10 +291,8 @@ def then_publish_lists_crates_in_order(cli_run: CliRunResult, crate_names: str)
     expected = _split_names(crate_names)
     lines = _publish_plan_lines(cli_run)
     header = f"Crates to publish ({len(expected)}):"
-    assert header in lines
-    section_index = lines.index(header)
     publish_lines: list[str] = []
-    for line in lines[section_index + 1 :]:
+    for line in _lines_after_header(lines, header):
         if not line.startswith("- "):
             break
         publish_lines.append(line[2:])
@@ -464,9 +463,7 @@ def then_publish_reports_none(cli_run: CliRunResult) -> None:
 def then_publish_reports_manifest_skip(cli_run: CliRunResult, crate_name: str) -> None:
     """Assert the publish plan lists ``crate_name`` under manifest skips."""
     lines = _publish_plan_lines(cli_run)
-    assert "Skipped (publish = false):" in lines
-    section_index = lines.index("Skipped (publish = false):")
-    skipped = lines[section_index + 1 :]
+    skipped = _lines_after_header(lines, "Skipped (publish = false):")
     assert f"- {crate_name}" in skipped
 
 
@@ -480,9 +477,7 @@ def then_publish_reports_configuration_skip(
 ) -> None:
     """Assert the publish plan lists ``crate_name`` under configuration skips."""
     lines = _publish_plan_lines(cli_run)
-    assert "Skipped via publish.exclude:" in lines
-    section_index = lines.index("Skipped via publish.exclude:")
-    skipped = lines[section_index + 1 :]
+    skipped = _lines_after_header(lines, "Skipped via publish.exclude:")
     assert f"- {crate_name}" in skipped
 
 
@@ -497,20 +492,18 @@ def then_publish_reports_multiple_configuration_skips(
     """Assert the publish plan lists all configuration exclusions."""
     expected_names = [name.strip() for name in crate_names.split(",") if name.strip()]
     lines = _publish_plan_lines(cli_run)
-    assert "Skipped via publish.exclude:" in lines
-    section_index = lines.index("Skipped via publish.exclude:")
-    skipped = lines[section_index + 1 :]
-    for name in expected_names:
-        assert f"- {name}" in skipped
+    skipped = set(_lines_after_header(lines, "Skipped via publish.exclude:"))
+    expected_entries = {f"- {name}" for name in expected_names}
+    assert expected_entries <= skipped, expected_entries - skipped
 
 
 @then(parsers.parse('the publish command reports missing exclusion "{name}"'))
 def then_publish_reports_missing_exclusion(cli_run: CliRunResult, name: str) -> None:
     """Assert the publish plan reports the missing exclusion ``name``."""
     lines = _publish_plan_lines(cli_run)
-    assert "Configured exclusions not found in workspace:" in lines
-    section_index = lines.index("Configured exclusions not found in workspace:")
-    missing = lines[section_index + 1 :]
+    missing = _lines_after_header(
+        lines, "Configured exclusions not found in workspace:"
+    )
     assert f"- {name}" in missing
 
 
@@ -20,6 +20,7 @@ pytest_plugins = (
     "tests.bdd.steps.test_publish_when_steps",
     "tests.bdd.steps.test_publish_then_steps",
     "tests.e2e.steps.test_e2e_steps",
+    "tests.helpers.bump_fixtures",
 )
 
 
@@ -40,6 +41,30 @@ def repo_root() -> Path:
     return Path(__file__).resolve().parent.parent
 
 
+@pytest.fixture
+def resolved_tmp_path(tmp_path: Path) -> Path:
+    """Return ``tmp_path`` with symlinks resolved.
+
+    Parameters
+    ----------
+    tmp_path : Path
+        Per-test temporary directory provided by pytest.
+
+    Returns
+    -------
+    Path
+        Canonical form of ``tmp_path``, resolved once per test so helpers
+        and assertions share the same path without repeated ``realpath``
+        calls.
+
+    Examples
+    --------
+    >>> def test_root_is_canonical(resolved_tmp_path):  # doctest: +SKIP
+    ...     assert resolved_tmp_path == resolved_tmp_path.resolve()
+    """
+    return tmp_path.resolve()
+
+
 @pytest.fixture(autouse=True)
 def _restore_workspace_env() -> cabc.Iterator[None]:
     """Ensure tests do not leak ``LADING_WORKSPACE_ROOT`` between runs."""
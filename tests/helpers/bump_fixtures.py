@@ -0,0 +1,61 @@
+"""Shared bump workspace fixtures, registered via ``pytest_plugins``.
+
+``bump_workspace`` gives each test a private copy of a two-crate workspace
+that is built once per session by ``bump_workspace_template``.
+"""
+
+from __future__ import annotations
+
+import typing as typ
+
+import pytest
+
+from tests.helpers.workspace_builders import _clone_workspace, _make_workspace
+
+if typ.TYPE_CHECKING:
+    from pathlib import Path
+
+    from lading.workspace import WorkspaceGraph
+
+
+@pytest.fixture(scope="session")
+def bump_workspace_template(tmp_path_factory: pytest.TempPathFactory) -> WorkspaceGraph:
+    """Build the two-crate bump workspace once per session.
+
+    Parameters
+    ----------
+    tmp_path_factory : pytest.TempPathFactory
+        Factory used to allocate the session-wide template directory.
+
+    Returns
+    -------
+    WorkspaceGraph
+        The template workspace; tests must copy it rather than modify it.
+    """
+    return _make_workspace(tmp_path_factory.mktemp("bump_workspace_template"))
+
+
+@pytest.fixture
+def bump_workspace(
+    tmp_path: Path, bump_workspace_template: WorkspaceGraph
+) -> WorkspaceGraph:
+    """Return a private copy of the two-crate bump workspace under ``tmp_path``.
+
+    Parameters
+    ----------
+    tmp_path : Path
+        Per-test directory that receives the copied workspace.
+    bump_workspace_template : WorkspaceGraph
+        Session-wide template produced by ``_make_workspace``.
+
+    Returns
+    -------
+    WorkspaceGraph
+        A workspace rooted at ``tmp_path`` that the test may freely modify.
+
+    Examples
+    --------
+    >>> def test_root_matches(bump_workspace, tmp_path):  # doctest: +SKIP
+    ...     assert bump_workspace.workspace_root == tmp_path
+    """
+    return _clone_workspace(bump_workspace_template, tmp_path)
@@ -0,0 +1,54 @@
+"""Monkeypatch helpers for the loaders consulted by ``bump`` and ``publish``."""
+
+from __future__ import annotations
+
+import typing as typ
+
+from lading import config as config_module
+from lading import workspace as workspace_module
+
+if typ.TYPE_CHECKING:
+    import collections.abc as cabc
+    from pathlib import Path
+
+    import pytest
+
+    from lading.workspace import WorkspaceGraph
+
+
+def patch_run_dependencies(
+    monkeypatch: pytest.MonkeyPatch,
+    *,
+    current_configuration: cabc.Callable[[], config_module.LadingConfig] | None = None,
+    load_configuration: cabc.Callable[[Path], config_module.LadingConfig] | None = None,
+    load_workspace: cabc.Callable[[Path], WorkspaceGraph] | None = None,
+) -> None:
+    """Replace the loaders a command consults when arguments are omitted.
+
+    Parameters
+    ----------
+    monkeypatch : pytest.MonkeyPatch
+        Fixture used to install (and later undo) the replacements.
+    current_configuration : Callable[[], LadingConfig] | None
+        Stand-in for :func:`lading.config.current_configuration`.
+    load_configuration : Callable[[Path], LadingConfig] | None
+        Stand-in for :func:`lading.config.load_configuration`.
+    load_workspace : Callable[[Path], WorkspaceGraph] | None
+        Stand-in for :func:`lading.workspace.load_workspace`.
+
+    Examples
+    --------
+    >>> patch_run_dependencies(  # doctest: +SKIP
+    ...     monkeypatch, load_workspace=lambda _root: workspace
+    ... )
+    """
+    # Patch the imported module objects directly rather than dotted strings,
+    # which monkeypatch would otherwise resolve by import on every call.
+    replacements = (
+        (config_module, "current_configuration", current_configuration),
+        (config_module, "load_configuration", load_configuration),
+        (workspace_module, "load_workspace", load_workspace),
+    )
+    for target, name, replacement in replacements:
+        if replacement is not None:
+            monkeypatch.setattr(target, name, replacement)
@@ -3,17 +3,19 @@
 from __future__ import annotations
 
 import dataclasses as dc
+import functools
+import re
+import shutil
 import textwrap
+import tomllib
 import typing as typ
+from pathlib import Path
 
-from tomlkit import parse as parse_toml
+import msgspec
 
 from lading import config as config_module
 from lading.workspace import WorkspaceCrate, WorkspaceDependency, WorkspaceGraph
 
-if typ.TYPE_CHECKING:
-    from pathlib import Path
-
 
 @dc.dataclass(frozen=True, slots=True)
 class _CrateSpec:
@@ -106,9 +108,33 @@ def _make_workspace(tmp_path: Path) -> WorkspaceGraph:
     ]
 
 
+def _clone_workspace(template: WorkspaceGraph, root: Path) -> WorkspaceGraph:
+    """Copy ``template`` onto ``root`` and return the graph rebased there."""
+    # Files are copied rather than hard-linked: bump rewrites manifests in
+    # place, which would otherwise leak edits back into the shared template.
+    source = template.workspace_root
+    shutil.copytree(source, root, dirs_exist_ok=True)
+    crates = tuple(
+        msgspec.structs.replace(
+            crate,
+            manifest_path=root / crate.manifest_path.relative_to(source),
+            root_path=root / crate.root_path.relative_to(source),
+        )
+        for crate in template.crates
+    )
+    return WorkspaceGraph(workspace_root=root, crates=crates)
+
+
+def _parse_manifest(path: Path) -> dict[str, typ.Any]:
+    """Return the parsed manifest at ``path``."""
+    # Assertions only read manifests, so the C-accelerated ``tomllib`` is used
+    # instead of building tomlkit's format-preserving document tree.
+    return tomllib.loads(path.read_text(encoding="utf-8"))
+
+
 def _load_version(path: Path, table: tuple[str, ...]) -> str:
     """Return the version string stored at ``table`` within ``path``."""
-    document = parse_toml(path.read_text(encoding="utf-8"))
+    document = _parse_manifest(path)
     current = document
     try:
         for key in table:
@@ -120,6 +146,33 @@ def _load_version(path: Path, table: tuple[str, ...]) -> str:
         raise KeyError(message) from error
 
 
+@functools.lru_cache(maxsize=64)
+def _version_pattern(table: tuple[str, ...], version: str) -> re.Pattern[bytes]:
+    """Compile a matcher for ``version = "<version>"`` directly under ``table``."""
+    header = re.escape(".".join(table).encode())
+    value = re.escape(version.encode())
+    # Only lines between the ``[table]`` header and the next header count, so a
+    # dependency pinned to the same version elsewhere cannot satisfy the match.
+    return re.compile(
+        rb"^\["
+        + header
+        + rb"\][ \t]*$(?:(?!^\[).)*?^[ \t]*version[ \t]*=[ \t]*\""
+        + value
+        + rb'"',
+        re.MULTILINE | re.DOTALL,
+    )
+
+
+def _has_version(path: Path, table: tuple[str, ...], version: str) -> bool:
+    """Return whether ``table`` within ``path`` records ``version``."""
+    # The byte-level match settles the common case; anything it cannot confirm
+    # (dotted keys, inline tables, a genuine mismatch) falls back to the full
+    # TOML parse via ``_load_version``.
+    if _version_pattern(table, version).search(path.read_bytes()):
+        return True
+    return _load_version(path, table) == version
+
+
 def _make_config(
     *,
     exclude: tuple[str, ...] = (),
@@ -135,6 +188,11 @@ def _make_config(
     return config_module.LadingConfig(bump=bump_config)
 
 
+# ``LadingConfig`` is frozen, so bump tests that only need the defaults share
+# one instance; derive variants via ``_make_config(...)``.
+_DEFAULT_CONFIG = _make_config()
+
+
 def _create_alpha_crate(workspace_root: Path) -> WorkspaceCrate:
     """Create the alpha crate and return its workspace representation."""
     alpha_dir = workspace_root / "crates" / "alpha"
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-__all__ = ["ErrorScenario", "build_test_package", "create_test_manifest"]
+__all__ = ["MetadataScenario", "build_test_package", "create_test_manifest"]
 
 import dataclasses as dc
 import textwrap
@@ -13,13 +13,18 @@ if typ.TYPE_CHECKING:
 
 
 @dc.dataclass(frozen=True, slots=True)
-class ErrorScenario:
-    """Test scenario for cargo metadata error cases."""
+class MetadataScenario:
+    """Test scenario for a single ``cargo metadata`` invocation outcome.
 
+    ``expected_message`` is ``None`` for successful invocations and otherwise
+    names the text the raised :class:`CargoMetadataError` should contain.
+    """
+
+    test_id: str
     exit_code: int
-    stdout: str
-    stderr: str
-    expected_message: str
+    stdout: str | bytes
+    stderr: str | bytes
+    expected_message: str | None = None
 
 
 class DependencyEntry(typ.TypedDict, total=False):
@@ -3,7 +3,8 @@
 Publish tests rely on the workspace/config factory fixtures and the
 ``disable_publish_preflight`` stub. Bump tests rely on
 ``stub_lockfile_regeneration``, which is scoped to the modules listed in
-``_LOCKFILE_STUB_MODULES``.
+``_LOCKFILE_STUB_MODULES``. The shared bump workspace fixtures live in
+:mod:`tests.helpers.bump_fixtures`.
 """
 
 from __future__ import annotations
@@ -28,6 +29,8 @@ from lading.workspace import WorkspaceCrate, WorkspaceDependency, WorkspaceGraph
 # mechanics.
 _LOCKFILE_STUB_MODULES = frozenset({
     "test_bump_manifest_updates",
+    "test_bump_no_changes",
+    "test_bump_workspace_dependencies",
     "test_bump_documentation_updates",
     "test_bump_lockfile_rebuild",
     "test_bump_rebuild_lockfiles_resolution",
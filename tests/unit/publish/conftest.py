@@ -12,6 +12,7 @@ import pytest
 from lading import config as config_module
 from lading.commands import publish, publish_preflight
 from lading.workspace import WorkspaceCrate, WorkspaceDependency, WorkspaceGraph
+from tests.helpers.loader_patches import patch_run_dependencies
 
 if typ.TYPE_CHECKING:
     import collections.abc as cabc
@@ -20,6 +21,7 @@ __all__ = [
     "CARGO_PACKAGE",
     "CARGO_PUBLISH",
     "CARGO_PUBLISH_DRY_RUN",
+    "DEFAULT_CONFIG",
     "INDEX_MISSING_STDERR_BETA",
     "INDEX_MISSING_STDERR_EXTERNAL",
     "INDEX_MISSING_STDERR_UNPARSEABLE",
@@ -37,6 +39,7 @@ __all__ = [
     "make_n_crate_chain",
     "make_preflight_config",
     "make_workspace",
+    "patch_run_dependencies",
     "plan_with_crates",
     "prepare_staging_root",
     "publish_plan_and_prep",
@@ -148,6 +151,11 @@ def make_config(
     )
 
 
+# ``LadingConfig`` and its tables are frozen, so tests that only need the
+# defaults share one instance; derive variants via ``make_config(...)``.
+DEFAULT_CONFIG = make_config()
+
+
 def make_crate(
     root: Path,
     name: str,
@@ -437,7 +445,7 @@ def publish_plan_and_prep(
     workspace_root = tmp_path / "workspace"
     crates = make_dependency_chain(workspace_root)
     plan = publish.plan_publication(
-        make_workspace(workspace_root, *crates), make_config()
+        make_workspace(workspace_root, *crates), DEFAULT_CONFIG
     )
     staging_root = prepare_staging_root(plan, tmp_path)
     preparation = publish.PublishPreparation(
@@ -470,6 +478,12 @@ def use_real_invoke(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setattr(publish, "_invoke", ORIGINAL_INVOKE)
 
 
+@pytest.fixture
+def use_real_preflight(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Restore the original pre-flight checks for tests that exercise them."""
+    monkeypatch.setattr(publish_preflight, "_run_preflight_checks", ORIGINAL_PREFLIGHT)
+
+
 class CallTrackingRunner:
     """Track command invocations while returning successful results."""
 
@@ -3,12 +3,13 @@
 from __future__ import annotations
 
 import collections.abc as cabc
+import dataclasses as dc
 import typing as typ
 from pathlib import Path
 
-from lading.commands import publish, publish_preflight
+from lading.commands import publish
 
-from .conftest import ORIGINAL_PREFLIGHT, make_crate, make_workspace
+from .conftest import make_crate, make_workspace
 
 if typ.TYPE_CHECKING:
     import pytest
@@ -16,25 +17,49 @@ if typ.TYPE_CHECKING:
     from lading import config as config_module
     from lading.workspace import WorkspaceGraph
 
-CallRecord = tuple[tuple[str, ...], Path | None, cabc.Mapping[str, str] | None]
-RecordedCommands = list[CallRecord]
 
+class CallRecord(typ.NamedTuple):
+    """Command, working directory, and environment passed to ``_invoke``."""
 
-def _setup_preflight_test(
+    command: tuple[str, ...]
+    cwd: Path | None
+    env: cabc.Mapping[str, str] | None
+
+
+def _make_preflight_workspace(
+    root: Path, crate_names: cabc.Sequence[str] | None = None
+) -> WorkspaceGraph:
+    """Build a workspace under ``root`` containing ``crate_names``."""
+    selected_crates = ("alpha",) if crate_names is None else tuple(crate_names)
+    return make_workspace(root, *(make_crate(root, name) for name in selected_crates))
+
+
+@dc.dataclass(frozen=True)
+class PreflightHarness:
+    """Commands recorded while running ``publish.run`` against a workspace."""
+
+    first_calls: cabc.Mapping[tuple[str, str], CallRecord]
+
+    @property
+    def cargo_test(self) -> tuple[tuple[str, ...], Path | None]:
+        """Captured ``cargo test`` command and its working directory."""
+        call = self.first_calls["cargo", "test"]
+        return call.command, call.cwd
+
+
+def _run_recorded_preflight(
     monkeypatch: pytest.MonkeyPatch,
-    tmp_path: Path,
+    workspace: WorkspaceGraph,
     configuration: config_module.LadingConfig,
-    crate_names: cabc.Sequence[str] | None = None,
-) -> tuple[Path, WorkspaceGraph, RecordedCommands]:
-    """Execute ``publish.run`` with optional crates and capture command calls."""
-    monkeypatch.setattr(publish_preflight, "_run_preflight_checks", ORIGINAL_PREFLIGHT)
-    root = tmp_path / "workspace"
-    root.mkdir()
-    selected_crates = ("alpha",) if crate_names is None else tuple(crate_names)
-    workspace = make_workspace(
-        root, *(make_crate(root, name) for name in selected_crates)
-    )
-    calls: RecordedCommands = []
+    options: publish.PublishOptions | None = None,
+) -> PreflightHarness:
+    """Execute ``publish.run`` against ``workspace`` and capture command calls."""
+    # Callers request ``use_real_preflight`` so the genuine checks run.
+    # ``publish.run`` stages a copy of the workspace elsewhere, so the source
+    # tree is left untouched and may be shared between calls.
+    # Index the first call per ``(program, subcommand)`` as it is recorded so
+    # assertions look commands up directly instead of scanning every call.
+    first_calls: dict[tuple[str, str], CallRecord] = {}
 
     def recording_invoke(
         command: cabc.Sequence[str],
@@ -43,21 +68,25 @@ def _setup_preflight_test(
         env: cabc.Mapping[str, str] | None = None,
     ) -> tuple[int, str, str]:
         """Record the invocation and return a successful result."""
-        calls.append((tuple(command), cwd, env))
+        record = CallRecord(tuple(command), cwd, env)
+        subcommand = command[1] if len(command) > 1 else ""
+        first_calls.setdefault((command[0], subcommand), record)
         return 0, "", ""
 
     monkeypatch.setattr(publish, "_invoke", recording_invoke)
-    publish.run(root, configuration, workspace)
-    return root, workspace, calls
-
-
-def _extract_cargo_test_call(
-    calls: RecordedCommands,
-) -> tuple[tuple[str, ...], Path | None]:
-    """Return the captured cargo test command and working directory."""
-    command, cwd, _env = next(
-        entry
-        for entry in calls
-        if entry[0][0] == "cargo" and len(entry[0]) > 1 and entry[0][1] == "test"
+    publish.run(
+        workspace.workspace_root,
+        configuration,
+        workspace,
+        options=options,
     )
-    return command, cwd
+    return PreflightHarness(first_calls=first_calls)
+
+
+def _target_dir(arguments: cabc.Iterable[str]) -> Path | None:
+    """Return the path passed via ``--target-dir=`` in ``arguments``, if any."""
+    for argument in arguments:
+        flag, separator, value = argument.partition("=")
+        if flag == "--target-dir" and separator:
+            return Path(value)
+    return None
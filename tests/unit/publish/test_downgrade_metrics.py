@@ -14,9 +14,9 @@ from lading.commands.cargo_output_adapter import CargoIndexLookupFailure
 from lading.utils import metrics
 
 from .conftest import (
+    DEFAULT_CONFIG,
     INDEX_MISSING_STDERR_BETA,
     INDEX_MISSING_STDERR_EXTERNAL,
-    make_config,
     make_dependency_chain,
     make_workspace,
 )
@@ -46,7 +46,7 @@ def _invoke_handler(
     workspace_root = tmp_path / "workspace"
     crates = make_dependency_chain(workspace_root)
     plan = publish.plan_publication(
-        make_workspace(workspace_root, *crates), make_config()
+        make_workspace(workspace_root, *crates), DEFAULT_CONFIG
     )
     failure = CargoIndexLookupFailure(
         crate_name="beta",
@@ -157,7 +157,7 @@ def test_full_publish_run_records_and_emits_downgrade_metric(
     caplog.set_level(logging.INFO, logger="lading.utils.metrics")
     root = tmp_path / "workspace"
     workspace = make_workspace(root, *make_dependency_chain(root))
-    configuration = make_config()
+    configuration = DEFAULT_CONFIG
 
     publish.run(
         root,
@@ -54,8 +54,8 @@ import pytest
 from lading.commands import publish
 
 from .conftest import (
+    DEFAULT_CONFIG,
     CallTrackingRunner,
-    make_config,
     make_dependency_chain,
     make_failing_runner,
     make_workspace,
@@ -384,7 +384,7 @@ def test_publish_crates_continue_when_version_already_uploaded(
     workspace_root = tmp_path / "workspace"
     alpha, beta, _gamma = make_dependency_chain(workspace_root)
     plan = publish.plan_publication(
-        make_workspace(workspace_root, alpha, beta), make_config()
+        make_workspace(workspace_root, alpha, beta), DEFAULT_CONFIG
     )
     staging_root = prepare_staging_root(plan, tmp_path)
     preparation = publish.PublishPreparation(
@@ -32,12 +32,12 @@ from lading.commands import publish
 from lading.commands.cargo_output_adapter import CargoIndexLookupFailure
 
 from .conftest import (
+    DEFAULT_CONFIG,
     INDEX_MISSING_STDERR_BETA,
     INDEX_MISSING_STDERR_EXTERNAL,
     PhaseContext,
     _warning_records,
     invoke_phase,
-    make_config,
     make_crate,
     make_dependency,
     make_dependency_chain,
@@ -136,7 +136,7 @@ def test_missing_dep_in_plan_allows_cargo_name_normalisation(
     alpha = make_crate(workspace_root, "alpha-crate")
     beta = make_crate(workspace_root, "beta")
     plan = publish.plan_publication(
-        make_workspace(workspace_root, alpha, beta), make_config()
+        make_workspace(workspace_root, alpha, beta), DEFAULT_CONFIG
     )
     failure = CargoIndexLookupFailure(
         crate_name="beta",
@@ -231,7 +231,7 @@ def test_missing_dep_not_in_plan_raises(
     workspace_root = tmp_path / "workspace"
     alpha, beta, _gamma = make_dependency_chain(workspace_root)
     plan = publish.plan_publication(
-        make_workspace(workspace_root, alpha, beta), make_config()
+        make_workspace(workspace_root, alpha, beta), DEFAULT_CONFIG
     )
     staging_root = prepare_staging_root(plan, tmp_path)
     preparation = publish.PublishPreparation(
@@ -273,7 +273,7 @@ def test_hyphenated_dep_in_plan_matches_with_canonicalisation(
         dependencies=(make_dependency("my_crate"),),
     )
     plan = publish.plan_publication(
-        make_workspace(workspace_root, dependency, dependent), make_config()
+        make_workspace(workspace_root, dependency, dependent), DEFAULT_CONFIG
     )
     staging_root = prepare_staging_root(plan, tmp_path)
     preparation = publish.PublishPreparation(
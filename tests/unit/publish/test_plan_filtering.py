@@ -9,7 +9,12 @@ import pytest
 from lading.commands import publish
 from lading.workspace import WorkspaceGraph
 
-from .conftest import make_config, make_crate, make_workspace
+from .conftest import (
+    DEFAULT_CONFIG,
+    make_config,
+    make_crate,
+    make_workspace,
+)
 
 if typ.TYPE_CHECKING:
     from pathlib import Path
@@ -76,7 +81,7 @@ def test_plan_publication_empty_workspace(tmp_path: Path) -> None:
     """Planner returns empty results when the workspace has no crates."""
     root = tmp_path.resolve()
     workspace = WorkspaceGraph(workspace_root=root, crates=())
-    configuration = make_config()
+    configuration = DEFAULT_CONFIG
 
     plan = publish.plan_publication(workspace, configuration)
 
@@ -8,7 +8,7 @@ from lading.commands import publish
 from lading.workspace import WorkspaceDependency
 
 from .conftest import (
-    make_config,
+    DEFAULT_CONFIG,
     make_crate,
     make_dependency,
     make_dependency_chain,
@@ -46,7 +46,7 @@ def test_plan_publication_ignores_dev_dependency_cycles(tmp_path: Path) -> None:
     )
     beta = make_crate(root, "beta", dependencies=(make_dependency("alpha"),))
     workspace = make_workspace(root, alpha, beta)
-    configuration = make_config()
+    configuration = DEFAULT_CONFIG
 
     plan = publish.plan_publication(workspace, configuration)
 
@@ -9,6 +9,7 @@ import pytest
 from lading.commands import publish, publish_plan
 
 from .conftest import (
+    DEFAULT_CONFIG,
     make_config,
     make_crate,
     make_dependency,
@@ -55,7 +56,7 @@ def test_plan_publication_detects_dependency_cycles(tmp_path: Path) -> None:
     alpha = make_crate(root, "alpha", dependencies=(make_dependency("beta"),))
     beta = make_crate(root, "beta", dependencies=(make_dependency("alpha"),))
     workspace = make_workspace(root, alpha, beta)
-    configuration = make_config()
+    configuration = DEFAULT_CONFIG
 
     with pytest.raises(publish_plan.PublishPlanError) as excinfo:
         publish.plan_publication(workspace, configuration)
@@ -11,8 +11,6 @@ import pytest
 
 from lading.commands import publish_preflight
 
-from .conftest import ORIGINAL_PREFLIGHT
-
 if typ.TYPE_CHECKING:
     from syrupy.assertion import SnapshotAssertion
 
@@ -212,11 +210,11 @@ def test_run_cargo_preflight_command_arguments(
     )
 
 
+@pytest.mark.usefixtures("use_real_preflight")
 def test_compiletest_diagnostic_details(
     monkeypatch: pytest.MonkeyPatch, tmp_path: Path
 ) -> None:
     """Failing cargo test pre-flight lists stderr artifacts with tail output."""
-    monkeypatch.setattr(publish_preflight, "_run_preflight_checks", ORIGINAL_PREFLIGHT)
     artifact = tmp_path / "ui.stderr"
     artifact.write_text("line1\nline2\nline3\n", encoding="utf-8")
 
@@ -10,7 +10,12 @@ import pytest
 
 from lading.commands import publish_preflight
 
-from .conftest import ORIGINAL_PREFLIGHT, make_config, make_preflight_config
+from .conftest import (
+    DEFAULT_CONFIG,
+    make_config,
+    make_preflight_config,
+)
+from .preflight_test_utils import _target_dir
 
 if typ.TYPE_CHECKING:
     from syrupy.assertion import SnapshotAssertion
@@ -18,11 +23,11 @@ if typ.TYPE_CHECKING:
     from lading.runtime import CommandRunner
 
 
+@pytest.mark.usefixtures("use_real_preflight")
 def test_preflight_checks_remove_all_targets_for_unit_only(
     monkeypatch: pytest.MonkeyPatch, tmp_path: Path
 ) -> None:
     """Unit-test-only mode omits --all-targets from cargo test pre-flight."""
-    monkeypatch.setattr(publish_preflight, "_run_preflight_checks", ORIGINAL_PREFLIGHT)
     monkeypatch.setattr(
         publish_preflight, "_verify_clean_working_tree", lambda *_args, **_kwargs: None
     )
@@ -55,15 +60,15 @@ def test_preflight_checks_remove_all_targets_for_unit_only(
     test_args = test_options.extra_args
     assert "--all-targets" not in test_args
     assert "--workspace" in test_args
-    assert any(arg.startswith("--target-dir=") for arg in test_args)
+    assert _target_dir(test_args) is not None
     assert test_options.unit_tests_only is True
 
 
+@pytest.mark.usefixtures("use_real_preflight")
 def test_preflight_checks_support_special_target_dir(
     monkeypatch: pytest.MonkeyPatch, tmp_path: Path
 ) -> None:
     """Target directories with spaces/symbols propagate without quoting issues."""
-    monkeypatch.setattr(publish_preflight, "_run_preflight_checks", ORIGINAL_PREFLIGHT)
     monkeypatch.setattr(
         publish_preflight, "_verify_clean_working_tree", lambda *_args, **_kwargs: None
     )
@@ -98,7 +103,7 @@ def test_preflight_checks_support_special_target_dir(
 
     root = tmp_path / "workspace"
     root.mkdir()
-    configuration = make_config()
+    configuration = DEFAULT_CONFIG
 
     publish_preflight._run_preflight_checks(
         root, allow_dirty=False, configuration=configuration
@@ -106,18 +111,15 @@ def test_preflight_checks_support_special_target_dir(
 
     assert set(recorded) == {"check", "test"}
     for args in recorded.values():
-        assert any(
-            arg.startswith("--target-dir=") and str(special_dir) in arg for arg in args
-        )
+        assert _target_dir(args) == special_dir
 
 
+@pytest.mark.usefixtures("use_real_preflight")
 def test_preflight_runs_aux_build_commands(
     monkeypatch: pytest.MonkeyPatch, tmp_path: Path
 ) -> None:
     """Auxiliary build commands execute before cargo pre-flight calls."""
-    monkeypatch.setattr(publish_preflight, "_run_preflight_checks", ORIGINAL_PREFLIGHT)
     root = tmp_path / "workspace"
-    root.mkdir()
     commands: list[tuple[tuple[str, ...], Path | None]] = []
 
     def recording_runner(
@@ -149,13 +151,12 @@ def test_preflight_runs_aux_build_commands(
     assert first_cwd == root
 
 
+@pytest.mark.usefixtures("use_real_preflight")
 def test_aux_build_failure_surfaces_error(
     monkeypatch: pytest.MonkeyPatch, tmp_path: Path
 ) -> None:
     """Failures in aux build commands abort pre-flight with context."""
-    monkeypatch.setattr(publish_preflight, "_run_preflight_checks", ORIGINAL_PREFLIGHT)
     root = tmp_path / "workspace"
-    root.mkdir()
 
     failing_command = ("cargo", "build", "--package", "lint")
 
@@ -189,13 +190,12 @@ def test_aux_build_failure_surfaces_error(
     assert "cargo build --package lint" in str(excinfo.value)
 
 
+@pytest.mark.usefixtures("use_real_preflight")
 def test_preflight_env_overrides_forwarded(
     monkeypatch: pytest.MonkeyPatch, tmp_path: Path
 ) -> None:
     """Environment overrides propagate to cargo pre-flight invocations."""
-    monkeypatch.setattr(publish_preflight, "_run_preflight_checks", ORIGINAL_PREFLIGHT)
     root = tmp_path / "workspace"
-    root.mkdir()
     captured_env: dict[str, str] = {}
 
     def env_recording_runner(
@@ -225,13 +225,12 @@ def test_preflight_env_overrides_forwarded(
     assert captured_env["DYLINT_LOCALE"] == "cy"
 
 
+@pytest.mark.usefixtures("use_real_preflight")
 def test_preflight_append_compiletest_externs(
     monkeypatch: pytest.MonkeyPatch, tmp_path: Path
 ) -> None:
     """Compiletest externs extend RUSTFLAGS for cargo test."""
-    monkeypatch.setattr(publish_preflight, "_run_preflight_checks", ORIGINAL_PREFLIGHT)
     root = tmp_path / "workspace"
-    root.mkdir()
     artifact = root / "target" / "lint" / "liblint_macro.so"
     artifact.parent.mkdir(parents=True, exist_ok=True)
     artifact.touch()
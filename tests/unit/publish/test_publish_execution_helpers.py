@@ -4,8 +4,9 @@ import importlib
 import io
 import os
 import sys
+import typing as typ
 from pathlib import Path
-from types import SimpleNamespace
+from types import MappingProxyType, SimpleNamespace
 
 import pytest
 
@@ -15,6 +16,16 @@ from lading.testing import cmd_mox_runner
 
 subprocess_runner = importlib.import_module("lading.runtime.subprocess_runner")
 
+# Drop the final byte of the euro sign so the relay sees a partial UTF-8
+# sequence at end of stream.
+_TRUNCATED_EURO = "hello\nworld\u20ac".encode()[:-1]
+
+# Zero-value invocation for paths that must return before reading it; the
+# read-only env guards against a test accidentally mutating shared state.
+_EMPTY_INVOCATION = SimpleNamespace(
+    env=MappingProxyType({}), command="", args=(), stdin=""
+)
+
 
 class _MockCmdMoxEnv:
     """Minimal cmd-mox environment module stub."""
@@ -94,10 +105,6 @@ def mock_cmd_mox_modules(tmp_path: Path) -> SimpleNamespace:
     ...     mock_cmd_mox_modules.command_runner
     """
 
-    class _Env:
-        CMOX_IPC_SOCKET_ENV = "CMOX_IPC_SOCKET"
-        CMOX_REAL_COMMAND_ENV_PREFIX = "CMOX_REAL_"
-
     class _IPC:
         class Response:
             def __init__(
@@ -143,7 +150,7 @@ def mock_cmd_mox_modules(tmp_path: Path) -> SimpleNamespace:
             return _IPC.Response(stdout="pass", stderr="through", exit_code=0)
 
     return SimpleNamespace(
-        env_module=_Env,
+        env_module=_MockCmdMoxEnv,
         ipc_module=_IPC,
         command_runner=_CommandRunner,
     )
@@ -219,10 +226,9 @@ def test_process_cmd_mox_response_rejects_missing_exit_code() -> None:
 def test_handle_cmd_mox_passthrough_returns_unmodified_response() -> None:
     """When no passthrough directive is present, the response should be returned."""
     response = SimpleNamespace()
-    invocation = SimpleNamespace(env={}, command="", args=(), stdin="")
 
     returned, streamed = cmd_mox_runner._handle_cmd_mox_passthrough(
-        response, invocation, timeout=1.0
+        response, _EMPTY_INVOCATION, timeout=1.0
     )
 
     assert returned is response
@@ -318,10 +324,21 @@ def test_handle_cmd_mox_passthrough_uses_pwd_for_cwd(
     assert captured["cwd"] == expected_cwd
 
 
-def test_invoke_via_subprocess_surfaces_spawn_errors() -> None:
+def test_invoke_via_subprocess_surfaces_spawn_errors(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
     """Failed spawns should raise PublishPreflightError with context."""
-    with pytest.raises(PublishPreflightError):
-        publish_execution._invoke(("definitely-not-a-command",))
+
+    def _fail_spawn(*args: object, **kwargs: object) -> typ.NoReturn:
+        del args, kwargs
+        raise FileNotFoundError(2, "No such file or directory")
+
+    # Inject the ENOENT directly rather than asking the OS to fork/exec a
+    # missing binary; the error mapping is what is under test.
+    monkeypatch.setattr(subprocess_runner.subprocess, "Popen", _fail_spawn)
+
+    with pytest.raises(PublishPreflightError, match="missing-program"):
+        publish_execution._invoke(("missing-program",))
 
 
 def test_invoke_via_subprocess_writes_stdin() -> None:
@@ -368,7 +385,7 @@ def test_merge_cmd_mox_path_entries_filters_shim(
 
 def test_relay_stream_decodes_and_buffers_text() -> None:
     """Stream relaying should buffer decoded text and write to sinks."""
-    source = io.BytesIO("hello\nworld\u20ac".encode()[:-1])
+    source = io.BytesIO(_TRUNCATED_EURO)
     sink = io.StringIO()
     buffer: list[str] = []
 
@@ -392,14 +409,42 @@ def test_write_to_sink_handles_broken_pipe() -> None:
     assert subprocess_runner.write_to_sink(_Broken(), "payload") is None
 
 
-def test_apply_cmd_mox_environment_and_echo(monkeypatch: pytest.MonkeyPatch) -> None:
-    """Environment updates and buffered echoing should be no-ops for empty input."""
-    monkeypatch.delenv("NEW_CMD_ENV", raising=False)
+@pytest.mark.parametrize(
+    ("env", "key", "expected"),
+    [
+        pytest.param({"NEW_CMD_ENV": "present"}, "NEW_CMD_ENV", "present", id="set"),
+        pytest.param({}, "ABSENT_CMD_ENV", None, id="empty"),
+        pytest.param(None, "ABSENT_CMD_ENV", None, id="none"),
+    ],
+)
+def test_apply_cmd_mox_environment(
+    monkeypatch: pytest.MonkeyPatch,
+    env: dict[str, str] | None,
+    key: str,
+    expected: str | None,
+) -> None:
+    """Environment updates should be merged, and empty input left a no-op."""
+    monkeypatch.delenv(key, raising=False)
+
+    cmd_mox_runner._apply_cmd_mox_environment(env)
+
+    assert os.environ.get(key) == expected
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        pytest.param("", id="empty"),
+        pytest.param("line\n", id="line"),
+    ],
+)
+def test_echo_buffered_output(payload: str) -> None:
+    """Buffered output should be echoed verbatim, and empty output skipped."""
+    sink = io.StringIO()
 
-    cmd_mox_runner._apply_cmd_mox_environment({"NEW_CMD_ENV": "present"})
-    cmd_mox_runner._echo_buffered_output("", io.StringIO())
+    cmd_mox_runner._echo_buffered_output(payload, sink)
 
-    assert os.environ["NEW_CMD_ENV"] == "present"
+    assert sink.getvalue() == payload
 
 
 def test_cmd_mox_shim_directory_without_socket(monkeypatch: pytest.MonkeyPatch) -> None:
@@ -420,5 +465,7 @@ def test_log_subprocess_environment_redacts_sensitive_values(
         "PATH": "/usr/bin",
     })
 
-    assert "PATH" in caplog.text
-    assert "<redacted>" in caplog.text
+    # A lone mapping argument is exposed as ``record.args`` itself; asserting
+    # on it pins which key was redacted rather than scanning formatted text.
+    (record,) = caplog.records
+    assert record.args == {"PATH": "/usr/bin", "TOKEN": "<redacted>"}
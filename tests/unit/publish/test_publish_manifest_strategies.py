@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import typing as typ
 from types import SimpleNamespace
 
@@ -26,8 +27,15 @@ def _make_plan(workspace_root: Path, publishable_names: tuple[str, ...]) -> Publ
     )
 
 
+@functools.cache
+def _encode_manifest(body: str) -> bytes:
+    """Return the UTF-8 encoding of ``body``, shared across repeated bodies."""
+    return body.encode("utf-8")
+
+
 def _write_manifest(path: Path, body: str) -> None:
-    path.write_text(body, encoding="utf-8")
+    """Write ``body`` to ``path`` as UTF-8 bytes."""
+    path.write_bytes(_encode_manifest(body))
 
 
 def _test_strip_patch_strategy_helper(
@@ -113,7 +121,7 @@ def test_apply_strip_patch_strategy_handles_unmodified_manifest(tmp_path: Path)
     assert "other" in document["patch"]["crates-io"]
 
 
-def test_validate_and_load_manifest_rejects_invalid_toml(tmp_path: Path) -> None:
+def test_load_staged_manifest_rejects_invalid_toml(tmp_path: Path) -> None:
     """Invalid manifests should surface PublishPreparationError with context."""
     manifest_path = tmp_path / "Cargo.toml"
     manifest_path.write_text("[patch\n", encoding="utf-8")
@@ -123,7 +131,7 @@ def test_validate_and_load_manifest_rejects_invalid_toml(tmp_path: Path) -> None
         publish_manifest._apply_strip_patch_strategy(tmp_path, plan, "all")
 
 
-def test_validate_and_load_manifest_skips_non_crates_io_patch(tmp_path: Path) -> None:
+def test_load_staged_manifest_skips_non_crates_io_patch(tmp_path: Path) -> None:
     """Patch tables without crates-io entries should be ignored."""
     manifest_path = tmp_path / "Cargo.toml"
     _write_manifest(
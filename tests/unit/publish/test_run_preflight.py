@@ -4,20 +4,30 @@ from __future__ import annotations
 
 import collections.abc as cabc
 import dataclasses as dc
+import typing as typ
 from pathlib import Path
+from types import MappingProxyType
 
 import pytest
 
-from lading.commands import publish, publish_preflight
+from lading.commands import publish
 
 from .conftest import (
-    ORIGINAL_PREFLIGHT,
+    DEFAULT_CONFIG,
     make_config,
-    make_crate,
     make_preflight_config,
-    make_workspace,
 )
-from .preflight_test_utils import _extract_cargo_test_call, _setup_preflight_test
+from .preflight_test_utils import (
+    _make_preflight_workspace,
+    _run_recorded_preflight,
+    _target_dir,
+)
+
+if typ.TYPE_CHECKING:
+    from lading import config as config_module
+    from lading.workspace import WorkspaceGraph
+
+pytestmark = pytest.mark.usefixtures("use_real_preflight")
 
 
 @dc.dataclass(frozen=True)
@@ -29,230 +39,167 @@ class _ExcludeScenario:
     unit_tests_only: bool
 
 
-EXCLUDE_SCENARIOS = (
-    pytest.param((), (), id="none"),
-    pytest.param(("alpha", "beta"), ("alpha", "beta"), id="ordered"),
-    pytest.param(("beta", "alpha"), ("alpha", "beta"), id="sorted"),
-    pytest.param((" alpha ", "beta", "alpha"), ("alpha", "beta"), id="trimmed"),
-    pytest.param(("", " ", "\t"), (), id="blank_entries"),
-    pytest.param(
-        (" \n", "\rbeta\t", "\talpha", "beta"),
-        ("alpha", "beta"),
-        id="whitespace_variants",
-    ),
-    pytest.param(
-        ("gamma", "beta", "alpha"),
-        ("alpha", "beta", "gamma"),
-        id="unsorted",
-    ),
-    pytest.param(("beta", "beta", "beta"), ("beta",), id="deduplicated"),
-    pytest.param(
-        ("alpha", "alpha", " alpha ", "\talpha\t"),
-        ("alpha",),
-        id="duplicate_whitespace",
-    ),
-    pytest.param(("alpha", "", "beta"), ("alpha", "beta"), id="mixed_blank"),
-)
+# Exclude-normalisation cases keyed by test id: the configured entries and the
+# trimmed, deduplicated, sorted ``--exclude`` values cargo should receive.
+EXCLUDE_SCENARIOS: typ.Final[
+    MappingProxyType[str, tuple[tuple[str, ...], tuple[str, ...]]]
+] = MappingProxyType({
+    "none": ((), ()),
+    "ordered": (("alpha", "beta"), ("alpha", "beta")),
+    "sorted": (("beta", "alpha"), ("alpha", "beta")),
+    "trimmed": ((" alpha ", "beta", "alpha"), ("alpha", "beta")),
+    "blank_entries": (("", " ", "\t"), ()),
+    "whitespace_variants": ((" \n", "\rbeta\t", "\talpha", "beta"), ("alpha", "beta")),
+    "unsorted": (("gamma", "beta", "alpha"), ("alpha", "beta", "gamma")),
+    "deduplicated": (("beta", "beta", "beta"), ("beta",)),
+    "duplicate_whitespace": (("alpha", "alpha", " alpha ", "\talpha\t"), ("alpha",)),
+    "mixed_blank": (("alpha", "", "beta"), ("alpha", "beta")),
+})
 
 
-def test_run_executes_preflight_checks_in_workspace(
-    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
-) -> None:
-    """Pre-flight commands run inside the resolved workspace root."""
-    monkeypatch.setattr(publish_preflight, "_run_preflight_checks", ORIGINAL_PREFLIGHT)
-    root = tmp_path / "workspace"
-    root.mkdir()
-    workspace = make_workspace(root, make_crate(root, "alpha"))
-    configuration = make_config()
+@dc.dataclass(frozen=True)
+class _PreflightEnv:
+    """Single-crate workspace with the real pre-flight checks restored."""
 
-    calls: list[tuple[tuple[str, ...], Path | None]] = []
+    root: Path
+    workspace: WorkspaceGraph
+    configuration: config_module.LadingConfig
+    monkeypatch: pytest.MonkeyPatch
 
-    def fake_invoke(
-        command: cabc.Sequence[str],
-        *,
-        cwd: Path | None = None,
-        env: cabc.Mapping[str, str] | None = None,
-    ) -> tuple[int, str, str]:
-        """Record the invocation and return a successful result."""
-        calls.append((tuple(command), cwd))
-        return 0, "", ""
+    def set_invoke(self, invoke: cabc.Callable[..., tuple[int, str, str]]) -> None:
+        """Route publish command execution through ``invoke``."""
+        self.monkeypatch.setattr(publish, "_invoke", invoke)
 
-    monkeypatch.setattr(publish, "_invoke", fake_invoke)
 
-    publish.run(
-        root,
-        configuration,
-        workspace,
-        options=publish.PublishOptions(allow_dirty=False),
+@pytest.fixture
+def preflight_env(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> _PreflightEnv:
+    """Provide a single-crate workspace wired to the real pre-flight checks."""
+    root = tmp_path / "workspace"
+    return _PreflightEnv(
+        root=root,
+        workspace=_make_preflight_workspace(root),
+        configuration=DEFAULT_CONFIG,
+        monkeypatch=monkeypatch,
     )
 
-    assert (
-        ("git", "status", "--porcelain"),
-        root,
-    ) in calls, "git cleanliness check should run in the workspace root"
-    check_call = next(
-        command
-        for command in calls
-        if command[0][0] == "cargo" and command[0][1] == "check"
-    )
-    test_call = next(
-        command
-        for command in calls
-        if command[0][0] == "cargo" and command[0][1] == "test"
+
+def test_run_executes_preflight_checks_in_workspace(
+    preflight_env: _PreflightEnv,
+) -> None:
+    """Pre-flight commands run inside the resolved workspace root."""
+    root = preflight_env.root
+    harness = _run_recorded_preflight(
+        preflight_env.monkeypatch,
+        preflight_env.workspace,
+        preflight_env.configuration,
+        publish.PublishOptions(allow_dirty=False),
     )
 
-    for command, cwd in (check_call, test_call):
-        assert cwd == root, "preflight cargo command should run in the workspace root"
-        assert command[2] == "--workspace", "preflight should target the workspace"
-        assert command[3] == "--all-targets", "preflight should cover all targets"
-        assert any(arg.startswith("--target-dir=") for arg in command[4:]), (
+    git_status = harness.first_calls["git", "status"]
+    assert git_status.command == ("git", "status", "--porcelain"), (
+        "git cleanliness check should request porcelain output"
+    )
+    assert git_status.cwd == root, (
+        "git cleanliness check should run in the workspace root"
+    )
+    for subcommand in ("check", "test"):
+        call = harness.first_calls["cargo", subcommand]
+        assert call.cwd == root, (
+            "preflight cargo command should run in the workspace root"
+        )
+        assert call.command[2] == "--workspace", "preflight should target the workspace"
+        assert call.command[3] == "--all-targets", "preflight should cover all targets"
+        assert _target_dir(call.command[4:]) is not None, (
             "preflight should pin a dedicated target directory"
         )
 
 
 # Run every exclude-normalisation scenario in both ``unit_tests_only`` modes so
 # the builder's exclude handling is verified to be identical regardless of the
-# target-narrowing flag.
+# target-narrowing flag, and the narrowing itself is checked alongside it.
 EXCLUDE_MODE_SCENARIOS = tuple(
-    pytest.param(
-        _ExcludeScenario(
-            configured_excludes=scenario.values[0],
-            expected_excludes=scenario.values[1],
-            unit_tests_only=unit_tests_only,
-        ),
-        id=f"{scenario.id}-{'unit_only' if unit_tests_only else 'all_targets'}",
+    _ExcludeScenario(
+        configured_excludes=configured,
+        expected_excludes=expected,
+        unit_tests_only=unit_tests_only,
     )
-    for scenario in EXCLUDE_SCENARIOS
+    for configured, expected in EXCLUDE_SCENARIOS.values()
     for unit_tests_only in (False, True)
 )
+EXCLUDE_MODE_IDS = tuple(
+    f"{scenario_id}-{'unit_only' if unit_tests_only else 'all_targets'}"
+    for scenario_id in EXCLUDE_SCENARIOS
+    for unit_tests_only in (False, True)
+)
+
+
+def _expected_test_arguments(target_dir: Path, scenario: _ExcludeScenario) -> list[str]:
+    """Spell out the ``cargo test`` arguments expected for ``scenario``."""
+    arguments = ["--workspace"]
+    if not scenario.unit_tests_only:
+        arguments.append("--all-targets")
+    arguments.append(f"--target-dir={target_dir}")
+    for crate_name in scenario.expected_excludes:
+        arguments.extend(("--exclude", crate_name))
+    if scenario.unit_tests_only:
+        arguments.extend(("--lib", "--bins"))
+    return arguments
+
+
+@pytest.fixture(scope="module")
+def preflight_workspace(tmp_path_factory: pytest.TempPathFactory) -> WorkspaceGraph:
+    """Build the workspace shared by the exclude scenarios."""
+    root = tmp_path_factory.mktemp("preflight_ws") / "workspace"
+    return _make_preflight_workspace(root, ("alpha", "beta", "gamma"))
+
+
+@pytest.fixture(scope="module")
+def preflight_build_root(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Provide one staging directory reused by every exclude scenario."""
+    # Without an explicit build directory each ``publish.run`` would create
+    # (and leave behind) a fresh ``mkdtemp`` staging tree; staging replaces
+    # any previous copy, so a single directory serves every case.
+    return tmp_path_factory.mktemp("preflight_build")
 
 
-@pytest.mark.parametrize("scenario", EXCLUDE_MODE_SCENARIOS)
+@pytest.mark.parametrize("scenario", EXCLUDE_MODE_SCENARIOS, ids=EXCLUDE_MODE_IDS)
 def test_run_includes_preflight_test_excludes(
     monkeypatch: pytest.MonkeyPatch,
-    tmp_path: Path,
+    preflight_workspace: WorkspaceGraph,
+    preflight_build_root: Path,
     scenario: _ExcludeScenario,
 ) -> None:
-    """Configured exclusions match the builder output and cargo invocation."""
-    configured_excludes = scenario.configured_excludes
-    expected_excludes = scenario.expected_excludes
-    unit_tests_only = scenario.unit_tests_only
+    """Configured exclusions and target narrowing reach the cargo invocation."""
     configuration = make_config(
         preflight=make_preflight_config(
-            test_exclude=configured_excludes,
-            unit_tests_only=unit_tests_only,
+            test_exclude=scenario.configured_excludes,
+            unit_tests_only=scenario.unit_tests_only,
         )
     )
-    root, _workspace, calls = _setup_preflight_test(
-        monkeypatch, tmp_path, configuration
-    )
-    args, cwd = _extract_cargo_test_call(calls)
-    assert cwd == root, "cargo test should run in the workspace root"
-    arguments = list(args[2:])
-    assert arguments[0] == "--workspace", "cargo test should target the workspace"
-    include_all_targets = "--all-targets" in arguments
-    assert include_all_targets == (not configuration.preflight.unit_tests_only), (
-        "--all-targets should be present only outside unit-tests-only mode"
-    )
-    target_argument = next(
-        value for value in arguments if value.startswith("--target-dir=")
-    )
-    target_dir = Path(target_argument.split("=", 1)[1])
-    base_arguments = list(
-        publish_preflight._compose_preflight_arguments(
-            target_dir,
-            include_all_targets=include_all_targets,
-        )
-    )
-    options = publish_preflight._CargoPreflightOptions(
-        extra_args=tuple(base_arguments),
-        test_excludes=configured_excludes,
-        unit_tests_only=configuration.preflight.unit_tests_only,
-    )
-    rebuilt_arguments = publish_preflight._build_test_arguments(
-        list(base_arguments),
-        options,
-    )
-    assert rebuilt_arguments == arguments, (
-        "builder output should match the captured cargo invocation"
-    )
-    exclude_values = tuple(
-        arguments[index + 1]
-        for index, value in enumerate(arguments[:-1])
-        if value == "--exclude"
-    )
-    assert exclude_values == expected_excludes, (
-        "exclusions should be trimmed, deduplicated, and sorted"
+    harness = _run_recorded_preflight(
+        monkeypatch,
+        preflight_workspace,
+        configuration,
+        publish.PublishOptions(build_directory=preflight_build_root),
     )
-    if not expected_excludes:
-        assert "--exclude" not in arguments, (
-            "no --exclude flag should appear when there are no exclusions"
-        )
-
-
-def test_run_honours_preflight_unit_tests_only(
-    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
-) -> None:
-    """Unit-test-only preflight mode narrows cargo test targets."""
-    configuration = make_config(preflight=make_preflight_config(unit_tests_only=True))
-    root, _workspace, calls = _setup_preflight_test(
-        monkeypatch, tmp_path, configuration
+    args, cwd = harness.cargo_test
+    assert cwd == preflight_workspace.workspace_root, (
+        "cargo test should run in the workspace root"
     )
-    args, cwd = _extract_cargo_test_call(calls)
-    assert cwd == root, "cargo test should run in the workspace root"
-    assert args[2] == "--workspace", "cargo test should target the workspace"
-    assert "--all-targets" not in args, "unit-tests-only mode should omit --all-targets"
-    assert any(part.startswith("--target-dir=") for part in args[3:]), (
-        "cargo test should pin a dedicated target directory"
+    arguments = list(args[2:])
+    target_dir = _target_dir(arguments)
+    assert target_dir is not None, "cargo test should pin a target directory"
+    # The expectation spells out ``--workspace``, the target narrowing flags,
+    # and one ``--exclude <crate>`` pair per normalised entry, so whole-list
+    # equality pins every argument and its order.
+    assert arguments == _expected_test_arguments(target_dir, scenario), (
+        "cargo test arguments should match the normalised excludes and mode"
     )
-    assert "--lib" in args, "unit-tests-only mode should test libraries"
-    assert "--bins" in args, "unit-tests-only mode should test binaries"
-    assert "--exclude" not in args, "no exclusions were configured"
-    lib_index = args.index("--lib")
-    bins_index = args.index("--bins")
-    assert bins_index == lib_index + 1, "--bins should immediately follow --lib"
 
 
-def test_run_unit_tests_only_with_excludes(
-    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
-) -> None:
-    """Exclusions are still honoured when unit-tests-only mode is enabled."""
-    configuration = make_config(
-        preflight=make_preflight_config(
-            unit_tests_only=True, test_exclude=("gamma", "alpha")
-        )
-    )
-    root, _workspace, calls = _setup_preflight_test(
-        monkeypatch,
-        tmp_path,
-        configuration,
-        crate_names=("alpha", "beta", "gamma"),
-    )
-    args, cwd = _extract_cargo_test_call(calls)
-    assert cwd == root, "cargo test should run in the workspace root"
-    assert args[2] == "--workspace", "cargo test should target the workspace"
-    assert "--all-targets" not in args, "unit-tests-only mode should omit --all-targets"
-    assert "--lib" in args, "unit-tests-only mode should test libraries"
-    assert "--bins" in args, "unit-tests-only mode should test binaries"
-    assert args[-6:] == (
-        "--exclude",
-        "alpha",
-        "--exclude",
-        "gamma",
-        "--lib",
-        "--bins",
-    ), "exclusions should be sorted and precede the --lib/--bins narrowing"
-
-
-def test_dirty_workspace_allowed_by_default(
-    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
-) -> None:
+def test_dirty_workspace_allowed_by_default(preflight_env: _PreflightEnv) -> None:
     """Publish skips git status when cleanliness enforcement is disabled."""
-    monkeypatch.setattr(publish_preflight, "_run_preflight_checks", ORIGINAL_PREFLIGHT)
-    root = tmp_path / "workspace"
-    root.mkdir()
-    workspace = make_workspace(root, make_crate(root, "alpha"))
-    configuration = make_config()
+    root = preflight_env.root
 
     def skip_git_invoke(
         command: cabc.Sequence[str],
@@ -267,24 +214,17 @@ def test_dirty_workspace_allowed_by_default(
             raise AssertionError(message)
         return 0, "", ""
 
-    monkeypatch.setattr(publish, "_invoke", skip_git_invoke)
+    preflight_env.set_invoke(skip_git_invoke)
 
-    message = publish.run(root, configuration, workspace)
+    message = publish.run(root, preflight_env.configuration, preflight_env.workspace)
 
     assert message.startswith(f"Publish plan for {root}"), (
         "summary should lead with the publish plan header"
     )
 
 
-def test_forbid_dirty_flag_enforces_cleanliness(
-    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
-) -> None:
+def test_forbid_dirty_flag_enforces_cleanliness(preflight_env: _PreflightEnv) -> None:
     """Explicit forbid-dirty option requires a clean git status."""
-    monkeypatch.setattr(publish_preflight, "_run_preflight_checks", ORIGINAL_PREFLIGHT)
-    root = tmp_path / "workspace"
-    root.mkdir()
-    workspace = make_workspace(root, make_crate(root, "alpha"))
-    configuration = make_config()
 
     def dirty_invoke(
         command: cabc.Sequence[str],
@@ -297,13 +237,13 @@ def test_forbid_dirty_flag_enforces_cleanliness(
             return 0, " M Cargo.toml\n", ""
         return 0, "", ""
 
-    monkeypatch.setattr(publish, "_invoke", dirty_invoke)
+    preflight_env.set_invoke(dirty_invoke)
 
     with pytest.raises(publish.PublishPreflightError) as excinfo:
         publish.run(
-            root,
-            configuration,
-            workspace,
+            preflight_env.root,
+            preflight_env.configuration,
+            preflight_env.workspace,
             options=publish.PublishOptions(allow_dirty=False),
         )
 
@@ -321,17 +261,11 @@ def test_forbid_dirty_flag_enforces_cleanliness(
     ids=["check_failure", "test_failure"],
 )
 def test_run_raises_when_preflight_cargo_fails(
-    monkeypatch: pytest.MonkeyPatch,
-    tmp_path: Path,
+    preflight_env: _PreflightEnv,
     failing_subcommand: str,
     expected_message: str,
 ) -> None:
     """Non-zero cargo check/test aborts the publish command."""
-    monkeypatch.setattr(publish_preflight, "_run_preflight_checks", ORIGINAL_PREFLIGHT)
-    root = tmp_path / "workspace"
-    root.mkdir()
-    workspace = make_workspace(root, make_crate(root, "alpha"))
-    configuration = make_config()
 
     def failing_invoke(
         command: cabc.Sequence[str],
@@ -346,10 +280,12 @@ def test_run_raises_when_preflight_cargo_fails(
             return 1, "", expected_message
         return 0, "", ""
 
-    monkeypatch.setattr(publish, "_invoke", failing_invoke)
+    preflight_env.set_invoke(failing_invoke)
 
     with pytest.raises(publish.PublishPreflightError) as excinfo:
-        publish.run(root, configuration, workspace)
+        publish.run(
+            preflight_env.root, preflight_env.configuration, preflight_env.workspace
+        )
 
     message = str(excinfo.value)
     assert expected_message in message, "error should surface the cargo stderr"
@@ -16,9 +16,9 @@ from .conftest import (
     CARGO_PACKAGE,
     CARGO_PUBLISH,
     CARGO_PUBLISH_DRY_RUN,
+    DEFAULT_CONFIG,
     INDEX_MISSING_STDERR_BETA,
     CallTrackingRunner,
-    make_config,
     make_dependency_chain,
     make_n_crate_chain,
     make_workspace,
@@ -54,7 +54,7 @@ def test_run_logs_when_unpublished_workspace_dependency_override_is_enabled(
     caplog.set_level(logging.INFO, logger="lading.commands.publish")
     root = tmp_path / "workspace"
     workspace = make_workspace(root, *make_dependency_chain(root))
-    configuration = make_config()
+    configuration = DEFAULT_CONFIG
 
     publish.run(
         root,
@@ -85,7 +85,7 @@ def test_run_honours_explicit_unpublished_workspace_deps_opt_out(
     """Explicit ``False`` keeps dry-run index-missing-version failures strict."""
     root = tmp_path / "workspace"
     workspace = make_workspace(root, *make_dependency_chain(root))
-    configuration = make_config()
+    configuration = DEFAULT_CONFIG
 
     with pytest.raises(publish.PublishPreflightError) as excinfo:
         publish.run(
@@ -120,7 +120,7 @@ def test_run_keeps_dry_run_publication_batched(
     caplog.set_level(logging.INFO, logger="lading.commands.publish")
     root = tmp_path / "workspace"
     workspace = make_workspace(root, *make_n_crate_chain(root, crate_count))
-    configuration = make_config()
+    configuration = DEFAULT_CONFIG
     runner = CallTrackingRunner()
 
     publish.run(
@@ -177,7 +177,7 @@ def test_run_keeps_live_publication_interleaved(
     """Live publish packages and publishes each crate before advancing."""
     root = tmp_path / "workspace"
     workspace = make_workspace(root, *make_n_crate_chain(root, crate_count))
-    configuration = make_config()
+    configuration = DEFAULT_CONFIG
     runner = CallTrackingRunner()
 
     publish.run(
@@ -208,7 +208,7 @@ def test_dry_run_batching_invariant_property(tmp_path: Path, crate_count: int) -
     """Dry-run publication packages every crate before publishing any crate."""
     root = tmp_path / f"workspace_{crate_count}"
     workspace = make_workspace(root, *make_n_crate_chain(root, crate_count))
-    configuration = make_config()
+    configuration = DEFAULT_CONFIG
     runner = CallTrackingRunner()
 
     publish.run(
@@ -247,7 +247,7 @@ def test_live_interleaving_invariant_property(tmp_path: Path, crate_count: int)
     """Live publication packages and publishes each crate before advancing."""
     root = tmp_path / f"workspace_{crate_count}"
     workspace = make_workspace(root, *make_n_crate_chain(root, crate_count))
-    configuration = make_config()
+    configuration = DEFAULT_CONFIG
     runner = CallTrackingRunner()
 
     publish.run(
@@ -12,7 +12,13 @@ from lading import config as config_module
 from lading.commands import publish
 from lading.workspace import WorkspaceGraph, WorkspaceModelError
 
-from .conftest import make_config, make_crate, make_workspace
+from .conftest import (
+    DEFAULT_CONFIG,
+    make_config,
+    make_crate,
+    make_workspace,
+    patch_run_dependencies,
+)
 
 if typ.TYPE_CHECKING:
     from syrupy.assertion import SnapshotAssertion
@@ -26,14 +32,14 @@ def test_run_normalises_workspace_root(
     monkeypatch.chdir(tmp_path)
     resolved = tmp_path / "workspace"
     plan_workspace = make_workspace(resolved)
-    configuration = make_config()
+    configuration = DEFAULT_CONFIG
 
     def fake_load(root: Path) -> WorkspaceGraph:
         """Stub workspace loader that asserts the resolved root."""
         assert root == resolved, "workspace should be loaded from the resolved root"
         return plan_workspace
 
-    monkeypatch.setattr("lading.workspace.load_workspace", fake_load)
+    patch_run_dependencies(monkeypatch, load_workspace=fake_load)
     monkeypatch.setattr(
         publish,
         "prepare_workspace",
@@ -49,28 +55,30 @@ def test_run_normalises_workspace_root(
 
 
 def test_run_uses_active_configuration(
-    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    monkeypatch: pytest.MonkeyPatch, resolved_tmp_path: Path
 ) -> None:
     """``run`` falls back to :func:`current_configuration` when needed."""
     configuration = make_config(exclude=("skip-me",))
-    monkeypatch.setattr(config_module, "current_configuration", lambda: configuration)
-    root = tmp_path.resolve()
+    root = resolved_tmp_path
     workspace = make_workspace(root, make_crate(root, "alpha"))
-    monkeypatch.setattr("lading.workspace.load_workspace", lambda _: workspace)
+    patch_run_dependencies(
+        monkeypatch,
+        current_configuration=lambda: configuration,
+        load_workspace=lambda _: workspace,
+    )
 
-    output = publish.run(tmp_path)
+    output = publish.run(root)
 
     assert "skip-me" in output, "active configuration exclusions should appear"
 
 
 def test_run_loads_configuration_when_inactive(
-    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    monkeypatch: pytest.MonkeyPatch, resolved_tmp_path: Path
 ) -> None:
     """``run`` loads configuration from disk if no active configuration exists."""
-    root = tmp_path.resolve()
+    root = resolved_tmp_path
     workspace = make_workspace(root, make_crate(root, "alpha"))
-    monkeypatch.setattr("lading.workspace.load_workspace", lambda _: workspace)
-    loaded_configuration = make_config()
+    loaded_configuration = DEFAULT_CONFIG
     load_calls: list[Path] = []
 
     def raise_not_loaded() -> config_module.LadingConfig:
@@ -83,8 +91,12 @@ def test_run_loads_configuration_when_inactive(
         load_calls.append(path)
         return loaded_configuration
 
-    monkeypatch.setattr(config_module, "current_configuration", raise_not_loaded)
-    monkeypatch.setattr(config_module, "load_configuration", capture_load)
+    patch_run_dependencies(
+        monkeypatch,
+        current_configuration=raise_not_loaded,
+        load_configuration=capture_load,
+        load_workspace=lambda _: workspace,
+    )
 
     output = publish.run(root)
 
@@ -105,9 +117,11 @@ def _normalise_summary(message: str, root: Path) -> str:
     )
 
 
-def test_run_formats_plan_summary(tmp_path: Path, snapshot: SnapshotAssertion) -> None:
+def test_run_formats_plan_summary(
+    resolved_tmp_path: Path, snapshot: SnapshotAssertion
+) -> None:
     """``run`` returns a structured summary of the publish plan."""
-    root = tmp_path.resolve()
+    root = resolved_tmp_path
     publishable = make_crate(root, "alpha")
     manifest_skipped = make_crate(root, "beta", publish_flag=False)
     config_skipped = make_crate(root, "gamma")
@@ -120,10 +134,10 @@ def test_run_formats_plan_summary(tmp_path: Path, snapshot: SnapshotAssertion) -
 
 
 def test_run_reports_no_publishable_crates(
-    tmp_path: Path, snapshot: SnapshotAssertion
+    resolved_tmp_path: Path, snapshot: SnapshotAssertion
 ) -> None:
     """``run`` highlights when no crates are eligible for publication."""
-    root = tmp_path.resolve()
+    root = resolved_tmp_path
     manifest_skipped = make_crate(root, "alpha", publish_flag=False)
     config_skipped_first = make_crate(root, "beta")
     config_skipped_second = make_crate(root, "gamma")
@@ -138,17 +152,17 @@ def test_run_reports_no_publishable_crates(
 
 
 def test_run_surfaces_missing_workspace(
-    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, resolved_tmp_path: Path
 ) -> None:
     """``run`` converts missing workspace roots into workspace model errors."""
-    configuration = make_config()
+    configuration = DEFAULT_CONFIG
 
     def raise_missing(_: Path) -> WorkspaceGraph:
         """Raise FileNotFoundError unconditionally."""
         message = "workspace missing"
         raise FileNotFoundError(message)
 
-    monkeypatch.setattr("lading.workspace.load_workspace", raise_missing)
+    patch_run_dependencies(monkeypatch, load_workspace=raise_missing)
 
     with pytest.raises(WorkspaceModelError) as excinfo:
         publish.run(tmp_path, configuration)
@@ -157,7 +171,7 @@ def test_run_surfaces_missing_workspace(
     assert "Workspace root not found" in message, (
         "missing workspace error should be explicit"
     )
-    assert str(tmp_path.resolve()) in message, (
+    assert str(resolved_tmp_path) in message, (
         "error should name the resolved workspace root"
     )
 
@@ -177,8 +191,11 @@ def test_run_surfaces_configuration_errors(
         message = "invalid configuration"
         raise config_module.ConfigurationError(message)
 
-    monkeypatch.setattr(config_module, "current_configuration", raise_not_loaded)
-    monkeypatch.setattr(config_module, "load_configuration", raise_config_error)
+    patch_run_dependencies(
+        monkeypatch,
+        current_configuration=raise_not_loaded,
+        load_configuration=raise_config_error,
+    )
 
     with pytest.raises(config_module.ConfigurationError) as excinfo:
         publish.run(tmp_path)
@@ -35,12 +35,12 @@ from lading.commands.cargo_output_adapter import (
 )
 
 from .conftest import (
+    DEFAULT_CONFIG,
     INDEX_MISSING_STDERR_BETA,
     INDEX_MISSING_STDERR_EXTERNAL,
     INDEX_MISSING_STDERR_UNPARSEABLE,
     CallTrackingRunner,
     _warning_records,
-    make_config,
     make_dependency_chain,
     make_workspace,
 )
@@ -103,7 +103,7 @@ def test_run_rejects_allow_unpublished_with_live(
     workspace_root = tmp_path / "workspace"
     crates = make_dependency_chain(workspace_root)
     workspace = make_workspace(workspace_root, *crates)
-    configuration = make_config()
+    configuration = DEFAULT_CONFIG
 
     with pytest.raises(publish.PublishPreflightError) as excinfo:
         publish.run(
@@ -247,7 +247,7 @@ def test_index_missing_out_of_plan_message_snapshot(
     workspace_root = tmp_path / "workspace"
     alpha, beta, _gamma = make_dependency_chain(workspace_root)
     plan = publish.plan_publication(
-        make_workspace(workspace_root, alpha, beta), make_config()
+        make_workspace(workspace_root, alpha, beta), DEFAULT_CONFIG
     )
 
     message = _handle_index_missing_version_message(
@@ -368,7 +368,7 @@ def test_already_published_warning_snapshot(
     workspace_root = tmp_path / "workspace"
     crates = make_dependency_chain(workspace_root)
     plan = publish.plan_publication(
-        make_workspace(workspace_root, *crates), make_config()
+        make_workspace(workspace_root, *crates), DEFAULT_CONFIG
     )
     beta = next(crate for crate in plan.publishable if crate.name == "beta")
 
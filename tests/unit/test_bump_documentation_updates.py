@@ -55,19 +55,22 @@ def test_run_updates_documentation_snippets(
     )
 
 
+_README_TRANSPOSE_SCENARIOS = (
+    _ReadmeTransposeScenario(
+        test_id="included_crate",
+    ),
+    _ReadmeTransposeScenario(
+        test_id="excluded_crate",
+        exclude=("alpha",),
+        check_version_unchanged=True,
+    ),
+)
+
+
 @pytest.mark.parametrize(
     "scenario",
-    [
-        _ReadmeTransposeScenario(
-            test_id="included_crate",
-        ),
-        _ReadmeTransposeScenario(
-            test_id="excluded_crate",
-            exclude=("alpha",),
-            check_version_unchanged=True,
-        ),
-    ],
-    ids=lambda s: s.test_id,
+    _README_TRANSPOSE_SCENARIOS,
+    ids=[case.test_id for case in _README_TRANSPOSE_SCENARIOS],
 )
 def test_run_transposes_workspace_readme_to_crates(
     tmp_path: pathlib.Path,
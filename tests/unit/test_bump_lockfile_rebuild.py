@@ -10,12 +10,14 @@ import pytest
 
 from lading import config as config_module
 from lading.commands import bump
-from tests.helpers.workspace_builders import _make_config, _make_workspace
+from tests.helpers.workspace_builders import _DEFAULT_CONFIG, _make_workspace
 
 if typ.TYPE_CHECKING:
     from _pytest.monkeypatch import MonkeyPatch
     from syrupy.assertion import SnapshotAssertion
 
+    from lading.workspace import WorkspaceGraph
+
 
 @dc.dataclass(frozen=True, slots=True)
 class _LockfileSkipScenario:
@@ -29,12 +31,12 @@ class _LockfileSkipScenario:
 
 def test_run_rebuilds_lockfiles_when_enabled(
     tmp_path: pathlib.Path,
+    bump_workspace: WorkspaceGraph,
     monkeypatch: MonkeyPatch,
     snapshot: SnapshotAssertion,
 ) -> None:
     """Lockfile regeneration runs and is reported when explicitly enabled."""
-    workspace = _make_workspace(tmp_path)
-    configuration = _make_config()
+    workspace = bump_workspace
     nested_lockfile = tmp_path / "crates/ui/Cargo.lock"
     captured: dict[str, object] = {}
     merged_manifests = ("crates/ui/Cargo.toml",)
@@ -78,7 +80,7 @@ def test_run_rebuilds_lockfiles_when_enabled(
         "1.2.3",
         options=bump.BumpOptions(
             rebuild_lockfiles=True,
-            configuration=configuration,
+            configuration=_DEFAULT_CONFIG,
             workspace=workspace,
         ),
     )
@@ -97,12 +99,12 @@ def test_run_rebuilds_lockfiles_when_enabled(
 
 def test_run_skips_lockfiles_when_disabled(
     tmp_path: pathlib.Path,
+    bump_workspace: WorkspaceGraph,
     monkeypatch: MonkeyPatch,
     snapshot: SnapshotAssertion,
 ) -> None:
     """Lockfile regeneration is suppressed when explicitly disabled."""
-    workspace = _make_workspace(tmp_path)
-    configuration = _make_config()
+    workspace = bump_workspace
     monkeypatch.setattr(
         bump.bump_lockfiles,
         "regenerate_lockfiles",
@@ -116,7 +118,7 @@ def test_run_skips_lockfiles_when_disabled(
         "1.2.3",
         options=bump.BumpOptions(
             rebuild_lockfiles=False,
-            configuration=configuration,
+            configuration=_DEFAULT_CONFIG,
             workspace=workspace,
         ),
     )
@@ -225,35 +227,36 @@ def test_run_reports_lockfiles_in_dry_run(
     assert message == snapshot
 
 
+_LOCKFILE_SKIP_SCENARIOS = (
+    _LockfileSkipScenario(
+        test_id="disabled",
+        version="1.2.3",
+        rebuild_lockfiles=False,
+        fail_message="lockfile regeneration should be skipped",
+    ),
+    _LockfileSkipScenario(
+        test_id="versions_already_match",
+        version="0.1.0",
+        rebuild_lockfiles=True,
+        fail_message="lockfiles should not be regenerated without manifest changes",
+    ),
+)
+
+
 @pytest.mark.parametrize(
     "scenario",
-    [
-        _LockfileSkipScenario(
-            test_id="disabled",
-            version="1.2.3",
-            rebuild_lockfiles=False,
-            fail_message="lockfile regeneration should be skipped",
-        ),
-        _LockfileSkipScenario(
-            test_id="versions_already_match",
-            version="0.1.0",
-            rebuild_lockfiles=True,
-            fail_message=(
-                "lockfiles should not be regenerated without manifest changes"
-            ),
-        ),
-    ],
-    ids=lambda scenario: scenario.test_id,
+    _LOCKFILE_SKIP_SCENARIOS,
+    ids=[case.test_id for case in _LOCKFILE_SKIP_SCENARIOS],
 )
 def test_run_skips_lockfile_rebuild(
     tmp_path: pathlib.Path,
+    bump_workspace: WorkspaceGraph,
     monkeypatch: MonkeyPatch,
     scenario: _LockfileSkipScenario,
     snapshot: SnapshotAssertion,
 ) -> None:
     """Lockfile regeneration is skipped when disabled or no manifests changed."""
-    workspace = _make_workspace(tmp_path)
-    configuration = _make_config()
+    workspace = bump_workspace
 
     def fail_regeneration(*args: object, **kwargs: object) -> typ.NoReturn:
         pytest.fail(scenario.fail_message)
@@ -269,7 +272,7 @@ def test_run_skips_lockfile_rebuild(
         scenario.version,
         options=bump.BumpOptions(
             rebuild_lockfiles=scenario.rebuild_lockfiles,
-            configuration=configuration,
+            configuration=_DEFAULT_CONFIG,
             workspace=workspace,
         ),
     )
@@ -4,9 +4,13 @@ from __future__ import annotations
 
 import collections.abc as cabc
 import pathlib
+import typing as typ
 
 from lading.commands import bump
-from tests.helpers.workspace_builders import _make_config, _make_workspace
+from tests.helpers.workspace_builders import _DEFAULT_CONFIG
+
+if typ.TYPE_CHECKING:
+    from lading.workspace import WorkspaceGraph
 
 
 class _RecordingLockfileRepository:
@@ -33,16 +37,19 @@ class _RecordingLockfileRepository:
         return (workspace_root / "Cargo.lock",)
 
 
-def test_run_uses_injected_lockfile_repository(tmp_path: pathlib.Path) -> None:
+def test_run_uses_injected_lockfile_repository(
+    tmp_path: pathlib.Path,
+    bump_workspace: WorkspaceGraph,
+) -> None:
     """Bump reaches lockfile operations only through the repository port."""
-    workspace = _make_workspace(tmp_path)
+    workspace = bump_workspace
     repository = _RecordingLockfileRepository()
 
     message = bump.run(
         tmp_path,
         "1.2.3",
         options=bump.BumpOptions(
-            configuration=_make_config(),
+            configuration=_DEFAULT_CONFIG,
             workspace=workspace,
             lockfile_repository=repository,
         ),
@@ -55,9 +62,10 @@ def test_run_uses_injected_lockfile_repository(tmp_path: pathlib.Path) -> None:
 
 def test_dry_run_projects_through_lockfile_repository(
     tmp_path: pathlib.Path,
+    bump_workspace: WorkspaceGraph,
 ) -> None:
     """Dry runs project lockfile paths without regenerating."""
-    workspace = _make_workspace(tmp_path)
+    workspace = bump_workspace
     repository = _RecordingLockfileRepository()
 
     bump.run(
@@ -65,7 +73,7 @@ def test_dry_run_projects_through_lockfile_repository(
         "1.2.3",
         options=bump.BumpOptions(
             dry_run=True,
-            configuration=_make_config(),
+            configuration=_DEFAULT_CONFIG,
             workspace=workspace,
             lockfile_repository=repository,
         ),
@@ -2,57 +2,72 @@
 
 from __future__ import annotations
 
+import dataclasses as dc
 from pathlib import Path
 
 import pytest
 from tomlkit import parse as parse_toml
 
 from lading.commands import bump, bump_toml
-from tests.helpers.workspace_builders import _load_version
 
 
-def test_update_manifest_writes_when_changed(tmp_path: Path) -> None:
-    """Applying a new version persists changes to disk."""
-    manifest_path = tmp_path / "Cargo.toml"
-    manifest_path.write_text('[package]\nname = "demo"\nversion = "0.1.0"\n')
-    changed = bump._update_manifest(
-        manifest_path, (("package",),), "1.0.0", bump.BumpOptions()
-    )
-    assert changed is True, "changing the version should report a change"
-    assert _load_version(manifest_path, ("package",)) == "1.0.0", (
-        "package version should be persisted to disk"
-    )
+@dc.dataclass(frozen=True, slots=True)
+class _ManifestWriteScenario:
+    """Manifest text before and after ``_update_manifest`` applies a version."""
+
+    test_id: str
+    initial_text: str
+    target_version: str
+    expected_changed: bool
+    expected_text: str
+
+
+_MANIFEST_WRITE_SCENARIOS = (
+    _ManifestWriteScenario(
+        test_id="writes_when_changed",
+        initial_text='[package]\nname = "demo"\nversion = "0.1.0"\n',
+        target_version="1.0.0",
+        expected_changed=True,
+        expected_text='[package]\nname = "demo"\nversion = "1.0.0"\n',
+    ),
+    _ManifestWriteScenario(
+        test_id="preserves_inline_comment",
+        initial_text='[package]\nversion = "0.1.0"  # keep me\n',
+        target_version="1.2.3",
+        expected_changed=True,
+        expected_text='[package]\nversion = "1.2.3"  # keep me\n',
+    ),
+    _ManifestWriteScenario(
+        test_id="skips_when_unchanged",
+        initial_text='[package]\nname = "demo"\nversion = "0.1.0"\n',
+        target_version="0.1.0",
+        expected_changed=False,
+        expected_text='[package]\nname = "demo"\nversion = "0.1.0"\n',
+    ),
+)
 
 
-def test_update_manifest_preserves_inline_comment(tmp_path: Path) -> None:
-    """Inline comments survive manifest rewrites."""
+@pytest.mark.parametrize(
+    "scenario",
+    _MANIFEST_WRITE_SCENARIOS,
+    ids=[case.test_id for case in _MANIFEST_WRITE_SCENARIOS],
+)
+def test_update_manifest_behaviours(
+    tmp_path: Path, scenario: _ManifestWriteScenario
+) -> None:
+    """``_update_manifest`` rewrites only the version and reports the change."""
     manifest_path = tmp_path / "Cargo.toml"
-    manifest_path.write_text(
-        '[package]\nversion = "0.1.0"  # keep me\n', encoding="utf-8"
-    )
+    manifest_path.write_text(scenario.initial_text, encoding="utf-8", newline="")
     changed = bump._update_manifest(
-        manifest_path, (("package",),), "1.2.3", bump.BumpOptions()
+        manifest_path, (("package",),), scenario.target_version, bump.BumpOptions()
     )
-    assert changed is True, "rewriting the version should report a change"
-    text = manifest_path.read_text(encoding="utf-8")
-    assert "# keep me" in text, "the inline comment should survive the rewrite"
-    document = parse_toml(text)
-    assert document["package"]["version"] == "1.2.3", (
-        "package version should be rewritten to the target"
-    )
-
-
-def test_update_manifest_skips_when_unchanged(tmp_path: Path) -> None:
-    """No write occurs when the manifest already records the target version."""
-    manifest_path = tmp_path / "Cargo.toml"
-    original = '[package]\nname = "demo"\nversion = "0.1.0"\n'
-    manifest_path.write_text(original)
-    changed = bump._update_manifest(
-        manifest_path, (("package",),), "0.1.0", bump.BumpOptions()
+    assert changed is scenario.expected_changed, (
+        f"unexpected change report for {scenario.test_id}"
     )
-    assert changed is False, "an already-current version should report no change"
-    assert manifest_path.read_text() == original, (
-        "the manifest file should be left byte-for-byte unchanged"
+    # Whole-text equality pins the persisted version, the surviving comments,
+    # and the byte-for-byte untouched file when nothing changes.
+    assert manifest_path.read_text(encoding="utf-8") == scenario.expected_text, (
+        f"unexpected manifest contents for {scenario.test_id}"
     )
 
 
@@ -0,0 +1,79 @@
+"""Tests for :mod:`lading.commands.bump` when every version already matches."""
+
+from __future__ import annotations
+
+import dataclasses as dc
+import typing as typ
+
+import pytest
+
+from lading.commands import bump
+from tests.helpers.workspace_builders import _DEFAULT_CONFIG
+
+if typ.TYPE_CHECKING:
+    import pathlib
+
+    from _pytest.monkeypatch import MonkeyPatch
+    from syrupy.assertion import SnapshotAssertion
+
+    from lading.workspace import WorkspaceGraph
+
+
+@dc.dataclass(frozen=True, slots=True)
+class _NoChangeScenario:
+    """Parameters describing expected output when no manifests change."""
+
+    test_id: str
+    dry_run: bool
+    expected_message: str
+
+
+_NO_CHANGE_SCENARIOS = (
+    _NoChangeScenario(
+        test_id="live",
+        dry_run=False,
+        expected_message="No manifest changes required; all versions already 0.1.0.",
+    ),
+    _NoChangeScenario(
+        test_id="dry-run",
+        dry_run=True,
+        expected_message=(
+            "Dry run; no manifest changes required; all versions already 0.1.0."
+        ),
+    ),
+)
+
+
+@pytest.mark.parametrize(
+    "scenario",
+    _NO_CHANGE_SCENARIOS,
+    ids=[case.test_id for case in _NO_CHANGE_SCENARIOS],
+)
+def test_run_reports_when_versions_already_match(
+    tmp_path: pathlib.Path,
+    bump_workspace: WorkspaceGraph,
+    scenario: _NoChangeScenario,
+    monkeypatch: MonkeyPatch,
+    snapshot: SnapshotAssertion,
+) -> None:
+    """Report the no-op message for both live and dry-run invocations."""
+    workspace = bump_workspace
+
+    def fail_regeneration(*args: object, **kwargs: object) -> typ.NoReturn:
+        pytest.fail("no-op bumps must not regenerate lockfiles")
+
+    monkeypatch.setattr(
+        bump.bump_lockfiles,
+        "regenerate_lockfiles",
+        fail_regeneration,
+    )
+    message = bump.run(
+        tmp_path,
+        "0.1.0",
+        options=bump.BumpOptions(
+            dry_run=scenario.dry_run,
+            configuration=_DEFAULT_CONFIG,
+            workspace=workspace,
+        ),
+    )
+    assert message == snapshot
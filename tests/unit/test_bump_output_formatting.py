@@ -8,10 +8,13 @@ and focused on a single responsibility.
 
 from __future__ import annotations
 
+import collections.abc as cabc
+import dataclasses as dc
 import typing as typ
 from pathlib import Path
 
 import hypothesis.strategies as st
+import pytest
 from hypothesis import given
 
 from lading.commands import bump_output
@@ -20,51 +23,90 @@ if typ.TYPE_CHECKING:
     from syrupy.assertion import SnapshotAssertion
 
 
-def test_build_changes_description_counts_sections(tmp_path: Path) -> None:
-    """Descriptions enumerate manifest and documentation counts."""
-    changes = bump_output.BumpChanges(
-        manifests=(tmp_path / "Cargo.toml", tmp_path / "member" / "Cargo.toml"),
-        documents=(tmp_path / "README.md",),
-        transposed_readmes=(tmp_path / "crates" / "alpha" / "README.md",),
-    )
-    assert (
-        bump_output._build_changes_description(changes)
-        == "2 manifest(s), 1 documentation file(s), and 1 readme file(s)"
-    ), "description should report 2 manifests, 1 documentation file, and 1 readme"
+_ROOT = Path("/ws")
 
-    changes = bump_output.BumpChanges(
-        manifests=(tmp_path / "Cargo.toml",),
-        documents=(tmp_path / "README.md",),
-        transposed_readmes=(tmp_path / "crates" / "alpha" / "README.md",),
-        lockfiles=(tmp_path / "Cargo.lock",),
-    )
-    assert bump_output._build_changes_description(changes) == (
-        "1 manifest(s), 1 documentation file(s), 1 readme file(s), and 1 lockfile(s)"
-    ), "description should report 1 manifest, 1 doc, 1 readme, and 1 lockfile"
 
+@dc.dataclass(frozen=True, slots=True)
+class _FormatterCase:
+    """A pure formatter call and the exact string it should return."""
 
-def test_format_no_changes_message_mentions_dry_run() -> None:
-    """No-change messaging adapts to dry-run context."""
-    assert (
-        bump_output._format_no_changes_message("1.2.3", dry_run=False)
-        == "No manifest changes required; all versions already 1.2.3."
-    ), "live no-change message should not mention a dry run"
-    assert (
-        bump_output._format_no_changes_message("1.2.3", dry_run=True)
-        == "Dry run; no manifest changes required; all versions already 1.2.3."
-    ), "dry-run no-change message should be prefixed with 'Dry run'"
+    test_id: str
+    formatter: cabc.Callable[..., str]
+    args: tuple[object, ...]
+    kwargs: cabc.Mapping[str, object]
+    expected: str
 
 
-def test_format_header_labels_dry_run_requests() -> None:
-    """Headers record whether the bump would be applied or was applied."""
-    assert (
-        bump_output._format_header("1 manifest(s)", "2.0.0", dry_run=False)
-        == "Updated version to 2.0.0 in 1 manifest(s):"
-    ), "live header should read as an applied update"
-    assert (
-        bump_output._format_header("1 manifest(s)", "2.0.0", dry_run=True)
-        == "Dry run; would update version to 2.0.0 in 1 manifest(s):"
-    ), "dry-run header should read as a would-be update"
+_FORMATTER_CASES = (
+    _FormatterCase(
+        test_id="description_manifests_docs_readmes",
+        formatter=bump_output._build_changes_description,
+        args=(
+            bump_output.BumpChanges(
+                manifests=(_ROOT / "Cargo.toml", _ROOT / "member" / "Cargo.toml"),
+                documents=(_ROOT / "README.md",),
+                transposed_readmes=(_ROOT / "crates" / "alpha" / "README.md",),
+            ),
+        ),
+        kwargs={},
+        expected="2 manifest(s), 1 documentation file(s), and 1 readme file(s)",
+    ),
+    _FormatterCase(
+        test_id="description_all_categories",
+        formatter=bump_output._build_changes_description,
+        args=(
+            bump_output.BumpChanges(
+                manifests=(_ROOT / "Cargo.toml",),
+                documents=(_ROOT / "README.md",),
+                transposed_readmes=(_ROOT / "crates" / "alpha" / "README.md",),
+                lockfiles=(_ROOT / "Cargo.lock",),
+            ),
+        ),
+        kwargs={},
+        expected=(
+            "1 manifest(s), 1 documentation file(s), 1 readme file(s), "
+            "and 1 lockfile(s)"
+        ),
+    ),
+    _FormatterCase(
+        test_id="no_changes_live",
+        formatter=bump_output._format_no_changes_message,
+        args=("1.2.3",),
+        kwargs={"dry_run": False},
+        expected="No manifest changes required; all versions already 1.2.3.",
+    ),
+    _FormatterCase(
+        test_id="no_changes_dry_run",
+        formatter=bump_output._format_no_changes_message,
+        args=("1.2.3",),
+        kwargs={"dry_run": True},
+        expected="Dry run; no manifest changes required; all versions already 1.2.3.",
+    ),
+    _FormatterCase(
+        test_id="header_live",
+        formatter=bump_output._format_header,
+        args=("1 manifest(s)", "2.0.0"),
+        kwargs={"dry_run": False},
+        expected="Updated version to 2.0.0 in 1 manifest(s):",
+    ),
+    _FormatterCase(
+        test_id="header_dry_run",
+        formatter=bump_output._format_header,
+        args=("1 manifest(s)", "2.0.0"),
+        kwargs={"dry_run": True},
+        expected="Dry run; would update version to 2.0.0 in 1 manifest(s):",
+    ),
+)
+
+
+@pytest.mark.parametrize(
+    "case", _FORMATTER_CASES, ids=[case.test_id for case in _FORMATTER_CASES]
+)
+def test_pure_formatters(case: _FormatterCase) -> None:
+    """Descriptions, no-change messages, and headers render exactly."""
+    assert case.formatter(*case.args, **case.kwargs) == case.expected, (
+        f"unexpected formatter output for {case.test_id}"
+    )
 
 
 def test_format_manifest_path_relative(tmp_path: Path) -> None:
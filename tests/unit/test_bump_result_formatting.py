@@ -8,10 +8,10 @@ Result-message formatting lives in ``test_bump_output_formatting``.
 from __future__ import annotations
 
 import dataclasses as dc
+import re
 from pathlib import Path
 
 import pytest
-from tomlkit import parse as parse_toml
 
 from lading.commands import bump
 from lading.workspace import WorkspaceCrate, WorkspaceDependency, WorkspaceGraph
@@ -29,6 +29,17 @@ class UpdateCrateTestParams:
     expected_alpha_version: str
 
 
+# Single-dependency crate manifest filled in by
+# ``_make_test_crate_with_dependency``.
+_CRATE_MANIFEST_TEMPLATE = (
+    "[package]\n"
+    'name = "{crate_name}"\n'
+    'version = "{crate_version}"\n\n'
+    "[dependencies]\n"
+    '{dependency_name} = "{dependency_version}"\n'
+)
+
+
 def _make_test_crate_with_dependency(
     tmp_path: Path,
     *,
@@ -39,16 +50,13 @@ def _make_test_crate_with_dependency(
     """Create a test crate manifest with a single dependency."""
     dependency_name, dependency_version = dependency
     manifest_path = tmp_path / "Cargo.toml"
-    manifest_path.write_text(
-        f"""
-        [package]
-        name = "{crate_name}"
-        version = "{crate_version}"
-
-        [dependencies]
-        {dependency_name} = "{dependency_version}"
-        """,
-        encoding="utf-8",
+    manifest_path.write_bytes(
+        _CRATE_MANIFEST_TEMPLATE.format(
+            crate_name=crate_name,
+            crate_version=crate_version,
+            dependency_name=dependency_name,
+            dependency_version=dependency_version,
+        ).encode("utf-8")
     )
     return WorkspaceCrate(
         id=f"{crate_name}-id",
@@ -69,22 +77,14 @@ def _make_test_crate_with_dependency(
     )
 
 
-def _make_workspace_with_alpha_dependency(
-    tmp_path: Path,
-    *,
-    dependency: tuple[str, str] = ("alpha", "0.1.0"),
-) -> tuple[WorkspaceCrate, WorkspaceGraph]:
-    """Create a workspace with a beta crate depending on an alpha crate."""
-    beta_crate = _make_test_crate_with_dependency(tmp_path, dependency=dependency)
-
-    alpha_manifest = tmp_path / "alpha" / "Cargo.toml"
-    alpha_manifest.parent.mkdir(parents=True, exist_ok=True)
-    alpha_manifest.write_text(
-        '[package]\nname = "alpha"\nversion = "0.1.0"\n',
-        encoding="utf-8",
-    )
-
-    alpha_crate = WorkspaceCrate(
+@pytest.fixture(scope="module")
+def alpha_crate(tmp_path_factory: pytest.TempPathFactory) -> WorkspaceCrate:
+    """Provide the alpha dependency crate shared by every update scenario."""
+    # Only beta's manifest is rewritten, so alpha's on-disk crate can be built
+    # once and referenced from each case's workspace.
+    alpha_manifest = tmp_path_factory.mktemp("alpha") / "Cargo.toml"
+    alpha_manifest.write_bytes(b'[package]\nname = "alpha"\nversion = "0.1.0"\n')
+    return WorkspaceCrate(
         id="alpha-id",
         name="alpha",
         version="0.1.0",
@@ -95,48 +95,71 @@ def _make_workspace_with_alpha_dependency(
         dependencies=(),
     )
 
+
+def _make_workspace_with_alpha_dependency(
+    tmp_path: Path,
+    alpha_crate: WorkspaceCrate,
+    *,
+    dependency: tuple[str, str] = ("alpha", "0.1.0"),
+) -> tuple[WorkspaceCrate, WorkspaceGraph]:
+    """Create a workspace with a beta crate depending on ``alpha_crate``."""
+    beta_crate = _make_test_crate_with_dependency(tmp_path, dependency=dependency)
     workspace = WorkspaceGraph(
         workspace_root=tmp_path,
         crates=(beta_crate, alpha_crate),
     )
-
     return beta_crate, workspace
 
 
+# ``_CRATE_MANIFEST_TEMPLATE`` places ``[package]`` first and declares alpha as
+# a plain string requirement, so line-anchored patterns read both values
+# without parsing the whole document.
+_PACKAGE_VERSION_RE = re.compile(r'^\s*version\s*=\s*"([^"]+)"', re.MULTILINE)
+_ALPHA_DEPENDENCY_RE = re.compile(r'^\s*alpha\s*=\s*"([^"]+)"', re.MULTILINE)
+
+
 def _parse_manifest_versions(
     manifest_path: Path,
 ) -> tuple[str, str]:
     """Return the package version and alpha dependency version from a manifest."""
-    document = parse_toml(manifest_path.read_text(encoding="utf-8"))
-    package_version = document["package"]["version"]
-    alpha_version = document["dependencies"]["alpha"].value
-    return package_version, alpha_version
+    text = manifest_path.read_text(encoding="utf-8")
+    package_match = _PACKAGE_VERSION_RE.search(text)
+    alpha_match = _ALPHA_DEPENDENCY_RE.search(text)
+    assert package_match is not None, f"no package version in {manifest_path}"
+    assert alpha_match is not None, f"no alpha requirement in {manifest_path}"
+    return package_match.group(1), alpha_match.group(1)
+
+
+_UPDATE_CRATE_PARAMS = (
+    UpdateCrateTestParams(
+        test_id="excluded_crate_skips_version_bump",
+        dependency_spec=("alpha", "0.1.0"),
+        exclude_crates=("beta",),
+        expected_package_version="0.1.0",
+        expected_alpha_version="1.2.3",
+    ),
+    UpdateCrateTestParams(
+        test_id="updates_version_and_dependencies",
+        dependency_spec=("alpha", "^0.1.0"),
+        exclude_crates=(),
+        expected_package_version="1.2.3",
+        expected_alpha_version="^1.2.3",
+    ),
+)
 
 
 @pytest.mark.parametrize(
     "params",
-    [
-        UpdateCrateTestParams(
-            test_id="excluded_crate_skips_version_bump",
-            dependency_spec=("alpha", "0.1.0"),
-            exclude_crates=("beta",),
-            expected_package_version="0.1.0",
-            expected_alpha_version="1.2.3",
-        ),
-        UpdateCrateTestParams(
-            test_id="updates_version_and_dependencies",
-            dependency_spec=("alpha", "^0.1.0"),
-            exclude_crates=(),
-            expected_package_version="1.2.3",
-            expected_alpha_version="^1.2.3",
-        ),
-    ],
-    ids=lambda p: p.test_id,
+    _UPDATE_CRATE_PARAMS,
+    ids=[case.test_id for case in _UPDATE_CRATE_PARAMS],
 )
-def test_update_crate_manifest(tmp_path: Path, params: UpdateCrateTestParams) -> None:
+def test_update_crate_manifest(
+    tmp_path: Path, alpha_crate: WorkspaceCrate, params: UpdateCrateTestParams
+) -> None:
     """Crate manifest updates handle exclusions and dependency rewrites."""
     crate, workspace = _make_workspace_with_alpha_dependency(
         tmp_path,
+        alpha_crate,
         dependency=params.dependency_spec,
     )
     context = bump._initialize_bump_context(
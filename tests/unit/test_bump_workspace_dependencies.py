@@ -0,0 +1,97 @@
+"""Tests for bump updates to ``[workspace.<section>]`` dependency entries."""
+
+from __future__ import annotations
+
+import typing as typ
+
+import pytest
+
+from lading.commands import bump
+from tests.helpers.workspace_builders import _DEFAULT_CONFIG, _parse_manifest
+
+if typ.TYPE_CHECKING:
+    import pathlib
+
+    from lading.workspace import WorkspaceGraph
+
+
+# Root manifest declaring ``alpha`` under a single ``[workspace.<section>]``
+# table; filled in per case by the workspace dependency section test.
+_WORKSPACE_DEPENDENCY_MANIFEST = (
+    "[workspace]\n"
+    'members = ["crates/alpha", "crates/beta"]\n\n'
+    "[workspace.package]\n"
+    'version = "0.1.0"\n\n'
+    "[workspace.{section}]\n"
+    "alpha = {spec}\n"
+)
+
+
+@pytest.mark.parametrize(
+    ("section", "versions"),
+    [
+        ("dependencies", ('"0.1.0"', "1.2.3", "1.2.3")),
+        ("dev-dependencies", ('"~0.1.0"', "2.0.0", "~2.0.0")),
+        ("build-dependencies", ('{ version = "0.1.0" }', "3.0.0", "3.0.0")),
+    ],
+    ids=["dependencies", "dev-dependencies", "build-dependencies"],
+)
+def test_run_updates_workspace_dependency_sections(
+    tmp_path: pathlib.Path,
+    bump_workspace: WorkspaceGraph,
+    section: str,
+    versions: tuple[str, str, str],
+) -> None:
+    """Workspace dependency entries in [workspace.<section>] are updated."""
+    version_spec, target_version, expected_version = versions
+    workspace = bump_workspace
+    manifest_path = tmp_path / "Cargo.toml"
+    manifest_path.write_bytes(
+        _WORKSPACE_DEPENDENCY_MANIFEST.format(
+            section=section, spec=version_spec
+        ).encode("ascii")
+    )
+    bump.run(
+        tmp_path,
+        target_version,
+        options=bump.BumpOptions(configuration=_DEFAULT_CONFIG, workspace=workspace),
+    )
+
+    document = _parse_manifest(manifest_path)
+    entry = document["workspace"][section]["alpha"]
+    # Handle both string format ("0.1.0") and table format ({ version = "0.1.0" })
+    actual_version = entry["version"] if isinstance(entry, dict) else entry
+    assert actual_version == expected_version, (
+        f"[workspace.{section}] alpha version not updated as expected"
+    )
+
+
+def test_run_updates_workspace_dependency_prefixes(
+    tmp_path: pathlib.Path,
+    bump_workspace: WorkspaceGraph,
+) -> None:
+    """Workspace dependency requirements preserve prefixes and extra fields."""
+    workspace = bump_workspace
+    manifest_path = tmp_path / "Cargo.toml"
+    manifest_path.write_bytes(
+        b"[workspace]\n"
+        b'members = ["crates/alpha", "crates/beta"]\n\n'
+        b"[workspace.package]\n"
+        b'version = "0.1.0"\n\n'
+        b"[workspace.dependencies]\n"
+        b'alpha = "^0.1.0"\n'
+        b'beta = { version = "~0.1.0", path = "crates/beta" }\n'
+    )
+    bump.run(
+        tmp_path,
+        "1.2.3",
+        options=bump.BumpOptions(configuration=_DEFAULT_CONFIG, workspace=workspace),
+    )
+
+    document = _parse_manifest(manifest_path)
+    assert document["workspace"]["dependencies"]["alpha"] == "^1.2.3", (
+        "alpha caret requirement not updated"
+    )
+    beta_entry = document["workspace"]["dependencies"]["beta"]
+    assert beta_entry["version"] == "~1.2.3", "beta tilde requirement not updated"
+    assert beta_entry["path"] == "crates/beta", "beta path field should be preserved"
@@ -4,7 +4,6 @@ from __future__ import annotations
 
 import collections.abc as cabc
 import json
-import textwrap
 import typing as typ
 
 import pytest
@@ -18,52 +17,74 @@ from lading.workspace import (
     load_workspace,
 )
 from lading.workspace import metadata as metadata_module
-from tests.helpers.workspace_helpers import install_cargo_stub
-from tests.helpers.workspace_metadata import ErrorScenario
+from tests.helpers.workspace_metadata import MetadataScenario
 
 _METADATA_PAYLOAD: typ.Final[dict[str, typ.Any]] = {
     "workspace_root": "./",
     "packages": [],
 }
+# Encoded once at import; the scenario table and runner doubles share it.
+_METADATA_JSON_TEXT: typ.Final[str] = json.dumps(_METADATA_PAYLOAD)
+_METADATA_JSON_BYTES: typ.Final[bytes] = _METADATA_JSON_TEXT.encode("utf-8")
+_CRATE_MANIFEST_TOML: typ.Final[str] = """\
+[package]
+name = "crate"
+version = "0.1.0"
+readme.workspace = true
+"""
+_METADATA_SCENARIOS: typ.Final[tuple[MetadataScenario, ...]] = (
+    MetadataScenario(
+        test_id="text_stdout",
+        exit_code=0,
+        stdout=_METADATA_JSON_TEXT,
+        stderr="",
+    ),
+    MetadataScenario(
+        test_id="bytes_stdout",
+        exit_code=0,
+        stdout=_METADATA_JSON_BYTES,
+        stderr=b"",
+    ),
+    MetadataScenario(
+        test_id="non_zero_exit_with_stderr",
+        exit_code=101,
+        stdout="",
+        stderr="could not read manifest",
+        expected_message="could not read manifest",
+    ),
+    MetadataScenario(
+        test_id="non_zero_exit_with_byte_stderr",
+        exit_code=101,
+        stdout=b"",
+        stderr=b"manifest missing",
+        expected_message="manifest missing",
+    ),
+    MetadataScenario(
+        test_id="non_zero_exit_empty_output",
+        exit_code=101,
+        stdout="",
+        stderr="",
+        expected_message="cargo metadata exited with status 101",
+    ),
+    MetadataScenario(
+        test_id="non_object_json",
+        exit_code=0,
+        stdout="[]",
+        stderr="",
+        expected_message="non-object",
+    ),
+    MetadataScenario(
+        test_id="malformed_json",
+        exit_code=0,
+        stdout="{]",
+        stderr="",
+        expected_message="invalid JSON",
+    ),
+)
 
 if typ.TYPE_CHECKING:
     from pathlib import Path
 
-    from cmd_mox import CmdMox
-
-
-@pytest.mark.parametrize(
-    "output_data",
-    [
-        pytest.param(
-            (json.dumps(_METADATA_PAYLOAD), ""),
-            id="text",
-        ),
-        pytest.param(
-            (json.dumps(_METADATA_PAYLOAD).encode("utf-8"), b""),
-            id="bytes",
-        ),
-    ],
-)
-def test_load_cargo_metadata_handles_stdout_variants(
-    cmd_mox: CmdMox,
-    monkeypatch: pytest.MonkeyPatch,
-    tmp_path: Path,
-    output_data: tuple[str | bytes, str | bytes],
-) -> None:
-    """Successful invocations should return parsed JSON for text and byte streams."""
-    install_cargo_stub(cmd_mox, monkeypatch)
-    stdout_data, stderr_data = output_data
-    cmd_mox.mock("cargo").with_args("metadata", "--format-version", "1").returns(
-        exit_code=0,
-        stdout=stdout_data,
-        stderr=stderr_data,
-    )
-
-    result = load_cargo_metadata(tmp_path)
-
-    assert result == _METADATA_PAYLOAD
-
 
 def test_load_cargo_metadata_suppresses_stdout_echo(tmp_path: Path) -> None:
     """Cargo metadata captures JSON without echoing it to the terminal."""
@@ -78,7 +99,7 @@ def test_load_cargo_metadata_suppresses_stdout_echo(tmp_path: Path) -> None:
     ) -> tuple[int, str, str]:
         del command, cwd, env
         echo_flags.append(echo_stdout)
-        return 0, json.dumps(_METADATA_PAYLOAD), ""
+        return 0, _METADATA_JSON_TEXT, ""
 
     result = load_cargo_metadata(tmp_path, runner=runner)
 
@@ -106,25 +127,6 @@ def test_load_cargo_metadata_missing_executable(
         load_cargo_metadata(tmp_path, runner=runner)
 
 
-def test_load_cargo_metadata_error_decodes_byte_streams(
-    cmd_mox: CmdMox,
-    monkeypatch: pytest.MonkeyPatch,
-    tmp_path: Path,
-) -> None:
-    """Failure messages should be decoded when provided as bytes."""
-    install_cargo_stub(cmd_mox, monkeypatch)
-    cmd_mox.mock("cargo").with_args("metadata", "--format-version", "1").returns(
-        exit_code=101,
-        stdout=b"",
-        stderr=b"manifest missing",
-    )
-
-    with pytest.raises(CargoMetadataError) as excinfo:
-        load_cargo_metadata(tmp_path)
-
-    assert "manifest missing" in str(excinfo.value)
-
-
 def test_metadata_coerce_text_decodes_bytes() -> None:
     """Binary output is decoded using UTF-8 with replacement semantics."""
     alpha = "\N{GREEK SMALL LETTER ALPHA}"
@@ -137,61 +139,32 @@ def test_metadata_coerce_text_decodes_bytes() -> None:
 
 @pytest.mark.parametrize(
     "scenario",
-    [
-        pytest.param(
-            ErrorScenario(
-                exit_code=101,
-                stdout="",
-                stderr="could not read manifest",
-                expected_message="could not read manifest",
-            ),
-            id="non_zero_exit_with_stderr",
-        ),
-        pytest.param(
-            ErrorScenario(
-                exit_code=101,
-                stdout="",
-                stderr="",
-                expected_message="cargo metadata exited with status 101",
-            ),
-            id="non_zero_exit_empty_output",
-        ),
-        pytest.param(
-            ErrorScenario(
-                exit_code=0,
-                stdout="[]",
-                stderr="",
-                expected_message="non-object",
-            ),
-            id="non_object_json",
-        ),
-        pytest.param(
-            ErrorScenario(
-                exit_code=0,
-                stdout="{]",
-                stderr="",
-                expected_message="invalid JSON",
-            ),
-            id="malformed_json",
-        ),
-    ],
+    _METADATA_SCENARIOS,
+    ids=[scenario.test_id for scenario in _METADATA_SCENARIOS],
 )
-def test_load_cargo_metadata_error_scenarios(
-    cmd_mox: CmdMox,
-    monkeypatch: pytest.MonkeyPatch,
-    tmp_path: Path,
-    scenario: ErrorScenario,
+def test_load_cargo_metadata_scenarios(
+    tmp_path: Path, scenario: MetadataScenario
 ) -> None:
-    """Error cases should raise :class:`CargoMetadataError` with detail."""
-    install_cargo_stub(cmd_mox, monkeypatch)
-    cmd_mox.mock("cargo").with_args("metadata", "--format-version", "1").returns(
-        exit_code=scenario.exit_code,
-        stdout=scenario.stdout,
-        stderr=scenario.stderr,
-    )
+    """Text and byte output parse; failures raise with the decoded detail."""
+
+    def runner(
+        command: tuple[str, ...],
+        *,
+        cwd: Path | None = None,
+        env: cabc.Mapping[str, str] | None = None,
+        echo_stdout: bool = True,
+    ) -> tuple[int, typ.Any, typ.Any]:
+        # Streams stay ``typ.Any`` so byte scenarios can exercise the
+        # loader's ``coerce_text`` decoding as cmd-mox responses do.
+        del command, cwd, env, echo_stdout
+        return scenario.exit_code, scenario.stdout, scenario.stderr
+
+    if scenario.expected_message is None:
+        assert load_cargo_metadata(tmp_path, runner=runner) == _METADATA_PAYLOAD
+        return
 
     with pytest.raises(CargoMetadataError) as excinfo:
-        load_cargo_metadata(tmp_path)
+        load_cargo_metadata(tmp_path, runner=runner)
 
     assert scenario.expected_message in str(excinfo.value)
 
@@ -203,16 +176,7 @@ def test_load_workspace_invokes_metadata(
     """Ensure ``load_workspace`` converts metadata into a graph."""
     crate_manifest = tmp_path / "crate" / "Cargo.toml"
     crate_manifest.parent.mkdir(parents=True)
-    crate_manifest.write_text(
-        textwrap.dedent(
-            """
-            [package]
-            name = "crate"
-            version = "0.1.0"
-            readme.workspace = true
-            """
-        ).strip()
-    )
+    crate_manifest.write_text(_CRATE_MANIFEST_TOML)
     metadata = {
         "workspace_root": str(tmp_path),
         "packages": [
@@ -243,7 +207,9 @@ def test_load_workspace_invokes_metadata(
     assert graph.crates[0].name == "crate"
 
 
-def test_load_cargo_metadata_passes_resolved_cwd(tmp_path: Path) -> None:
+def test_load_cargo_metadata_passes_resolved_cwd(
+    tmp_path: Path, resolved_tmp_path: Path
+) -> None:
     """``load_cargo_metadata`` should invoke the runner in the workspace root."""
     payload = {
         "packages": [],
@@ -266,4 +232,4 @@ def test_load_cargo_metadata_passes_resolved_cwd(tmp_path: Path) -> None:
     result = load_cargo_metadata(tmp_path, runner=runner)
 
     assert result == payload
-    assert recorded_cwd == [tmp_path.resolve()]
+    assert recorded_cwd == [resolved_tmp_path]
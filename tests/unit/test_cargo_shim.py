@@ -4,80 +4,80 @@
 
 from __future__ import annotations
 
-import importlib.util
-import typing as typ
-from importlib.machinery import SourceFileLoader
 from pathlib import Path
+from types import ModuleType
 
 import pytest
 
-if typ.TYPE_CHECKING:
-    from types import ModuleType
-
 SCRIPT_PATH = (
     Path(__file__).resolve().parents[2] / "scripts" / "publish-check" / "bin" / "cargo"
 )
 
 
 def load_cargo_shim() -> ModuleType:
-    loader = SourceFileLoader("publish_check_cargo_shim", str(SCRIPT_PATH))
-    spec = importlib.util.spec_from_loader(loader.name, loader)
-    if spec is None:
-        msg = f"Failed to load cargo shim from {SCRIPT_PATH!s}"
-        raise RuntimeError(msg)
-    module = importlib.util.module_from_spec(spec)
-    loader.exec_module(module)
+    # The shim is a single extensionless script, so executing its source in a
+    # fresh module namespace avoids the loader/spec bookkeeping of importlib.
+    module = ModuleType("publish_check_cargo_shim")
+    module.__file__ = str(SCRIPT_PATH)
+    code = compile(SCRIPT_PATH.read_text(encoding="utf-8"), str(SCRIPT_PATH), "exec")
+    exec(code, module.__dict__)  # noqa: S102 - trusted repository script
     return module
 
 
-def test_inserts_flag_before_separator() -> None:
-    shim = load_cargo_shim()
-    result = shim.rewrite_args(["test", "--", "--test-threads", "1"])
+@pytest.fixture(scope="module")
+def cargo_shim() -> ModuleType:
+    """Load the cargo shim once for every test in this module."""
+    # ``rewrite_args`` is a pure function, so executing the script per test
+    # only repeats the same disk read and module initialisation.
+    return load_cargo_shim()
+
+
+def test_inserts_flag_before_separator(cargo_shim: ModuleType) -> None:
+    result = cargo_shim.rewrite_args(["test", "--", "--test-threads", "1"])
     assert result == ["test", "--all-features", "--", "--test-threads", "1"]
 
 
-def test_appends_flag_when_no_separator() -> None:
-    shim = load_cargo_shim()
-    result = shim.rewrite_args(["check"])
+def test_appends_flag_when_no_separator(cargo_shim: ModuleType) -> None:
+    result = cargo_shim.rewrite_args(["check"])
     assert result == ["check", "--all-features"]
 
 
-def test_leaves_empty_arguments_unchanged() -> None:
-    shim = load_cargo_shim()
-    result = shim.rewrite_args([])
+def test_leaves_empty_arguments_unchanged(cargo_shim: ModuleType) -> None:
+    result = cargo_shim.rewrite_args([])
     assert result == []
 
 
-def test_leaves_only_separator_unchanged() -> None:
-    shim = load_cargo_shim()
-    result = shim.rewrite_args(["--"])
+def test_leaves_only_separator_unchanged(cargo_shim: ModuleType) -> None:
+    result = cargo_shim.rewrite_args(["--"])
     assert result == ["--"]
 
 
-def test_preserves_existing_flag_before_separator() -> None:
-    shim = load_cargo_shim()
+def test_preserves_existing_flag_before_separator(cargo_shim: ModuleType) -> None:
     args = ["test", "--all-features", "--", "--nocapture"]
-    result = shim.rewrite_args(args)
+    result = cargo_shim.rewrite_args(args)
     assert result == args
 
 
-def test_repositions_flag_after_separator() -> None:
-    shim = load_cargo_shim()
-    result = shim.rewrite_args(["test", "--", "--test-threads", "1", "--all-features"])
+def test_repositions_flag_after_separator(cargo_shim: ModuleType) -> None:
+    result = cargo_shim.rewrite_args([
+        "test",
+        "--",
+        "--test-threads",
+        "1",
+        "--all-features",
+    ])
     assert result == ["test", "--all-features", "--", "--test-threads", "1"]
 
 
-def test_ignores_non_target_commands() -> None:
-    shim = load_cargo_shim()
+def test_ignores_non_target_commands(cargo_shim: ModuleType) -> None:
     args = ["run", "--example", "demo"]
-    result = shim.rewrite_args(args)
+    result = cargo_shim.rewrite_args(args)
     assert result == args
 
 
-def test_handles_toolchain_and_global_flags() -> None:
-    shim = load_cargo_shim()
+def test_handles_toolchain_and_global_flags(cargo_shim: ModuleType) -> None:
     args = ["+nightly", "--locked", "--manifest-path", "demo/Cargo.toml", "test"]
-    result = shim.rewrite_args(args)
+    result = cargo_shim.rewrite_args(args)
     assert result == [
         "+nightly",
         "--locked",
@@ -89,9 +89,10 @@ def test_handles_toolchain_and_global_flags() -> None:
 
 
 @pytest.mark.parametrize("subcommand", ["bench", "clippy"])
-def test_inserts_flag_for_additional_subcommands(subcommand: str) -> None:
-    shim = load_cargo_shim()
-    result = shim.rewrite_args([subcommand])
+def test_inserts_flag_for_additional_subcommands(
+    cargo_shim: ModuleType, subcommand: str
+) -> None:
+    result = cargo_shim.rewrite_args([subcommand])
     assert result == [subcommand, "--all-features"]
 
 
@@ -102,9 +103,10 @@ def test_inserts_flag_for_additional_subcommands(subcommand: str) -> None:
         ("--config", "ci-config.toml"),
     ],
 )
-def test_handles_global_flags_consuming_values(flag_and_value: tuple[str, str]) -> None:
-    shim = load_cargo_shim()
+def test_handles_global_flags_consuming_values(
+    cargo_shim: ModuleType, flag_and_value: tuple[str, str]
+) -> None:
     flag, value = flag_and_value
     args = [flag, value, "test", "--", "--nocapture"]
-    result = shim.rewrite_args(args)
+    result = cargo_shim.rewrite_args(args)
     assert result == [flag, value, "test", "--all-features", "--", "--nocapture"]
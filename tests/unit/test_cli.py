@@ -9,7 +9,6 @@ Covers tri-state ``--allow-unpublished-workspace-deps`` flag resolution via
 from __future__ import annotations
 
 import collections.abc as cabc
-import dataclasses as dc
 import io
 import logging
 import os
@@ -37,33 +36,48 @@ if typ.TYPE_CHECKING:
 def _preserve_root_logger() -> cabc.Iterator[logging.Logger]:
     """Capture and restore the root logger configuration around a test."""
     root_logger = logging.getLogger()
-    prior_handlers = list(root_logger.handlers)
+    prior_handlers = tuple(root_logger.handlers)
     prior_level = root_logger.level
     prior_propagation = root_logger.propagate
     try:
         yield root_logger
     finally:
-        for handler in list(root_logger.handlers):
-            root_logger.removeHandler(handler)
-        for handler in prior_handlers:
-            root_logger.addHandler(handler)
+        # Restore the handler list in one slice assignment rather than
+        # removing and re-adding handlers one at a time. The CLI has returned
+        # by now, so no other thread is emitting through the root logger.
+        root_logger.handlers[:] = prior_handlers
         root_logger.setLevel(prior_level)
         root_logger.propagate = prior_propagation
 
 
-@dc.dataclass(frozen=True)
-class CommandDispatchCase:
+@contextmanager
+def _env(key: str, value: str | None) -> cabc.Iterator[None]:
+    """Set ``key`` to ``value`` (or unset it for ``None``) for the block."""
+    previous = os.environ.get(key)
+    if value is None:
+        os.environ.pop(key, None)
+    else:
+        os.environ[key] = value
+    try:
+        yield
+    finally:
+        if previous is None:
+            os.environ.pop(key, None)
+        else:
+            os.environ[key] = previous
+
+
+class CommandDispatchCase(typ.NamedTuple):
     """Test case for command dispatch validation."""
 
     command_module: ModuleType
     command_name: str
     return_value: str
-    cli_args: list[str]
+    cli_args_factory: cabc.Callable[[Path], list[str]]
     expected_version: str | None = None
 
 
-@dc.dataclass(frozen=True)
-class ExceptionHandlingCase:
+class ExceptionHandlingCase(typ.NamedTuple):
     """Test case for exception handling validation."""
 
     exception: BaseException
@@ -71,26 +85,30 @@ class ExceptionHandlingCase:
     expected_message: str
 
 
-@pytest.mark.parametrize(
-    ("value", "expected"),
-    [
-        (None, logging.INFO),
-        ("", logging.INFO),
-        (" info ", logging.INFO),
-        ("DEBUG", logging.DEBUG),
-        ("warning", logging.WARNING),
-    ],
+# Raw ``LADING_LOG_LEVEL`` values and the level each should resolve to.
+_LOG_LEVEL_CASES: tuple[tuple[str | None, int], ...] = (
+    (None, logging.INFO),
+    ("", logging.INFO),
+    (" info ", logging.INFO),
+    ("DEBUG", logging.DEBUG),
+    ("warning", logging.WARNING),
 )
-def test_resolve_log_level_parsing(value: str | None, expected: int) -> None:
+
+
+def test_resolve_log_level_parsing() -> None:
     """``_resolve_log_level`` should normalise supported variants."""
-    assert cli._resolve_log_level(value) == expected
+    # A single table-driven test: each case is a microsecond-scale pure call,
+    # so per-case pytest setup would dominate the runtime.
+    for raw, expected in _LOG_LEVEL_CASES:
+        resolved = cli._resolve_log_level(raw)
+        assert resolved == expected, f"{raw!r} resolved to {resolved}, not {expected}"
 
 
 def test_resolve_log_level_rejects_unknown_value() -> None:
     """Unknown log levels should raise ``SystemExit``."""
     with pytest.raises(SystemExit) as excinfo:
         cli._resolve_log_level("not-a-level")
-    message = str(excinfo.value)
+    message = excinfo.value.args[0]
     assert "Invalid" in message
     assert cli.LOG_LEVEL_ENV_VAR in message
 
@@ -101,17 +119,16 @@ def test_configure_logging_installs_named_handler(
     """``_configure_logging`` should attach a reusable root handler."""
     stream = io.StringIO()
     with _preserve_root_logger() as root_logger:
-        for handler in list(root_logger.handlers):
-            root_logger.removeHandler(handler)
+        root_logger.handlers.clear()
         monkeypatch.setenv(cli.LOG_LEVEL_ENV_VAR, "DEBUG")
         cli._configure_logging(stream)
 
-        handlers = [
-            handler
+        named_handlers = sum(
+            1
             for handler in root_logger.handlers
             if getattr(handler, "name", "") == cli._LADING_HANDLER_NAME
-        ]
-        assert len(handlers) == 1
+        )
+        assert named_handlers == 1
 
         logging.getLogger("lading").debug("probe message")
         assert "probe message" in stream.getvalue()
@@ -148,26 +165,25 @@ def test_extract_workspace_override(
     assert remaining == expected_remaining
 
 
-def test_extract_workspace_override_requires_value() -> None:
-    """Require a value whenever ``--workspace-root`` appears."""
-    with pytest.raises(SystemExit):
-        cli._extract_workspace_override(["--workspace-root"])
-
-
-def test_extract_workspace_override_requires_value_equals() -> None:
-    """Reject ``--workspace-root=`` when no value is supplied."""
+@pytest.mark.parametrize(
+    "tokens",
+    [["--workspace-root"], ["--workspace-root="]],
+    ids=["separate", "equals"],
+)
+def test_extract_workspace_override_requires_value(tokens: list[str]) -> None:
+    """Require a value whenever ``--workspace-root`` appears, in either form."""
     with pytest.raises(SystemExit):
-        cli._extract_workspace_override(["--workspace-root="])
+        cli._extract_workspace_override(tokens)
 
 
 def test_normalise_workspace_root_defaults_to_cwd(
     monkeypatch: pytest.MonkeyPatch,
     tmp_path: Path,
+    resolved_tmp_path: Path,
 ) -> None:
     """Default workspace resolution uses the current working directory."""
     monkeypatch.chdir(tmp_path)
-    resolved = normalise_workspace_root(None)
-    assert resolved == tmp_path.resolve()
+    assert normalise_workspace_root(None) == resolved_tmp_path
 
 
 def _make_workspace(root: Path) -> WorkspaceGraph:
@@ -186,52 +202,110 @@ def _make_workspace(root: Path) -> WorkspaceGraph:
     return WorkspaceGraph(workspace_root=root, crates=(crate,))
 
 
+@pytest.fixture
+def workspace_graph(resolved_tmp_path: Path) -> WorkspaceGraph:
+    """Provide the representative CLI workspace rooted at the resolved tmp path."""
+    return _make_workspace(resolved_tmp_path)
+
+
+@pytest.fixture
+def patched_workspace(
+    monkeypatch: pytest.MonkeyPatch, workspace_graph: WorkspaceGraph
+) -> WorkspaceGraph:
+    """Make ``cli.load_workspace`` return ``workspace_graph`` for any root.
+
+    Parameters
+    ----------
+    monkeypatch : pytest.MonkeyPatch
+        Fixture used to replace ``cli.load_workspace``.
+    workspace_graph : WorkspaceGraph
+        Graph the patched loader returns.
+
+    Returns
+    -------
+    WorkspaceGraph
+        The graph every CLI dispatch in the test receives.
+    """
+    monkeypatch.setattr(cli, "load_workspace", lambda _root: workspace_graph)
+    return workspace_graph
+
+
+@pytest.fixture
+def record_bump_run(monkeypatch: pytest.MonkeyPatch) -> dict[str, typ.Any]:
+    """Replace ``bump.run`` with a recorder and return the captured call.
+
+    Parameters
+    ----------
+    monkeypatch : pytest.MonkeyPatch
+        Fixture used to install the recording ``bump.run``.
+
+    Returns
+    -------
+    dict[str, typ.Any]
+        Populated with ``workspace_root``, ``version``, and ``options`` once
+        the CLI dispatches ``bump``; the fake returns ``"bump summary"``.
+    """
+    captured: dict[str, typ.Any] = {}
+
+    def fake_run(
+        workspace_root: Path,
+        version: str,
+        *,
+        options: bump_command.BumpOptions,
+    ) -> str:
+        captured.update(workspace_root=workspace_root, version=version, options=options)
+        return "bump summary"
+
+    monkeypatch.setattr(bump_command, "run", fake_run)
+    return captured
+
+
+_DISPATCH_CASES: tuple[CommandDispatchCase, ...] = (
+    CommandDispatchCase(
+        command_module=bump_command,
+        command_name="bump",
+        return_value="bump summary",
+        cli_args_factory=lambda root: ["--workspace-root", str(root), "bump", "7.8.9"],
+        expected_version="7.8.9",
+    ),
+    CommandDispatchCase(
+        command_module=publish_command,
+        command_name="publish",
+        return_value="publish placeholder",
+        cli_args_factory=lambda root: ["publish", "--workspace-root", str(root)],
+    ),
+)
+
+
 @pytest.mark.usefixtures("minimal_config")
 @pytest.mark.parametrize(
-    "case",
-    [
-        CommandDispatchCase(
-            command_module=bump_command,
-            command_name="bump",
-            return_value="bump summary",
-            cli_args=["--workspace-root", "{tmp_path}", "bump", "7.8.9"],
-            expected_version="7.8.9",
-        ),
-        CommandDispatchCase(
-            command_module=publish_command,
-            command_name="publish",
-            return_value="publish placeholder",
-            cli_args=["publish", "--workspace-root", "{tmp_path}"],
-        ),
-    ],
+    "case", _DISPATCH_CASES, ids=[case.command_name for case in _DISPATCH_CASES]
 )
 def test_main_dispatches_command(
     monkeypatch: pytest.MonkeyPatch,
     tmp_path: Path,
+    resolved_tmp_path: Path,
     capsys: pytest.CaptureFixture[str],
     case: CommandDispatchCase,
+    patched_workspace: WorkspaceGraph,
 ) -> None:
     """Route subcommands through their placeholder implementations."""
     called: dict[str, typ.Any] = {}
 
-    workspace_graph = _make_workspace(tmp_path.resolve())
-
     def fake_run(*args: object, **kwargs: object) -> str:
         called["args"] = args
         called["kwargs"] = kwargs
         return case.return_value
 
     monkeypatch.setattr(case.command_module, "run", fake_run)
-    monkeypatch.setattr(cli, "load_workspace", lambda _: workspace_graph)
-    args = [arg.replace("{tmp_path}", str(tmp_path)) for arg in case.cli_args]
-    assert case.command_name in args
+    args = case.cli_args_factory(tmp_path)
     exit_code = cli.main(args)
     assert exit_code == 0
     captured_args = called["args"]
     captured_kwargs = called["kwargs"]
     if case.command_module is bump_command:
         workspace_root_arg, version_arg = captured_args
-        assert workspace_root_arg == tmp_path.resolve()
+        assert workspace_root_arg == resolved_tmp_path
         assert version_arg == case.expected_version
         options = captured_kwargs["options"]
         assert isinstance(options, bump_command.BumpOptions)
@@ -240,9 +314,9 @@ def test_main_dispatches_command(
         assert options.dry_run is False
     else:
         workspace_root_arg, configuration, workspace_model = captured_args
-        assert workspace_root_arg == tmp_path.resolve()
+        assert workspace_root_arg == resolved_tmp_path
         assert configuration.publish.strip_patches == "all"
-    assert workspace_model is workspace_graph
+    assert workspace_model is patched_workspace
     captured = capsys.readouterr()
     assert case.return_value in captured.out
 
@@ -271,7 +345,30 @@ def test_main_handles_invalid_subcommand(
     assert "Unknown command" in captured.out
 
 
-@pytest.mark.usefixtures("minimal_config")
+_SENTINEL_LOG = "Sentinel command log"
+_ELEVATED_SENTINEL_LOG = "Elevated sentinel command log"
+
+
+@pytest.fixture
+def sentinel_publish_run(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Patch ``publish.run`` to emit INFO and WARNING sentinel log records."""
+    publish_logger = logging.getLogger("lading.commands.publish")
+
+    def fake_run(
+        workspace_root: Path,
+        configuration: object,
+        workspace_model: object,
+        *,
+        options: object | None = None,
+    ) -> str:
+        publish_logger.info(_SENTINEL_LOG)
+        publish_logger.warning(_ELEVATED_SENTINEL_LOG)
+        return "done"
+
+    monkeypatch.setattr(publish_command, "run", fake_run)
+
+
+@pytest.mark.usefixtures("minimal_config", "patched_workspace", "sentinel_publish_run")
 @pytest.mark.parametrize(
     ("env_value", "sentinel_state"),
     [
@@ -281,112 +378,65 @@ def test_main_handles_invalid_subcommand(
     ],
 )
 def test_main_emits_publish_command_logs(
-    capsys: pytest.CaptureFixture[str],
-    monkeypatch: pytest.MonkeyPatch,
+    caplog: pytest.LogCaptureFixture,
     tmp_path: Path,
     env_value: str | None,
     sentinel_state: typ.Literal["present", "absent"],
 ) -> None:
     """Ensure publish logging honours ``LADING_LOG_LEVEL``."""
-    workspace_graph = _make_workspace(tmp_path.resolve())
-
-    def fake_run(
-        workspace_root: Path,
-        configuration: object,
-        workspace_model: object,
-        *,
-        options: object | None = None,
-    ) -> str:
-        logging.getLogger("lading.commands.publish").info("Sentinel command log")
-        logging.getLogger("lading.commands.publish").warning(
-            "Elevated sentinel command log"
-        )
-        return "done"
-
-    monkeypatch.setattr(publish_command, "run", fake_run)
-    monkeypatch.setattr(cli, "load_workspace", lambda _: workspace_graph)
-    sentinel = "Sentinel command log"
-    elevated = "Elevated sentinel command log"
-
-    with _preserve_root_logger():
-        if env_value is None:
-            monkeypatch.delenv(cli.LOG_LEVEL_ENV_VAR, raising=False)
-        else:
-            monkeypatch.setenv(cli.LOG_LEVEL_ENV_VAR, env_value)
-
+    # ``caplog.at_level`` would override the root level under test, so the
+    # capture handler is left at its default and the CLI-configured level
+    # alone decides which records reach it.
+    with _preserve_root_logger(), _env(cli.LOG_LEVEL_ENV_VAR, env_value):
         exit_code = cli.main(["publish", "--workspace-root", str(tmp_path)])
         assert exit_code == 0
-        captured = capsys.readouterr()
 
     if sentinel_state == "present":
-        assert sentinel in captured.err
+        assert _SENTINEL_LOG in caplog.messages
     else:
-        assert sentinel not in captured.err
-    assert elevated in captured.err
+        assert _SENTINEL_LOG not in caplog.messages
+    assert _ELEVATED_SENTINEL_LOG in caplog.messages
 
 
+@pytest.mark.usefixtures("patched_workspace")
 def test_main_uses_defaults_when_configuration_missing(
-    monkeypatch: pytest.MonkeyPatch,
     tmp_path: Path,
+    resolved_tmp_path: Path,
+    record_bump_run: dict[str, typ.Any],
 ) -> None:
     """CLI commands fall back to default configuration when no file exists."""
-    workspace_graph = _make_workspace(tmp_path.resolve())
-    monkeypatch.setattr(cli, "load_workspace", lambda _: workspace_graph)
-    captured: dict[str, typ.Any] = {}
-
-    def fake_run(
-        workspace_root: Path,
-        version: str,
-        *,
-        options: bump_command.BumpOptions,
-    ) -> str:
-        captured["workspace_root"] = workspace_root
-        captured["version"] = version
-        captured["options"] = options
-        return "ok"
-
-    monkeypatch.setattr(bump_command, "run", fake_run)
+    captured = record_bump_run
     exit_code = cli.main(["bump", "1.2.3", "--workspace-root", str(tmp_path)])
 
     assert exit_code == 0
-    assert captured["workspace_root"] == tmp_path.resolve()
+    assert captured["workspace_root"] == resolved_tmp_path
     assert captured["version"] == "1.2.3"
     options = typ.cast("bump_command.BumpOptions", captured["options"])
     assert options.configuration == config_module.LadingConfig()
 
 
-@pytest.mark.usefixtures("minimal_config")
+@pytest.mark.usefixtures("minimal_config", "patched_workspace")
 def test_main_rejects_invalid_log_level(
     monkeypatch: pytest.MonkeyPatch,
     tmp_path: Path,
 ) -> None:
     """Invalid ``LADING_LOG_LEVEL`` should abort early with a clear message."""
-    workspace_graph = _make_workspace(tmp_path.resolve())
     monkeypatch.setenv(cli.LOG_LEVEL_ENV_VAR, "not-a-level")
-    monkeypatch.setattr(cli, "load_workspace", lambda _: workspace_graph)
 
-    with _preserve_root_logger(), pytest.raises(SystemExit) as excinfo:
+    # ``_configure_logging`` resolves the level before touching the root
+    # logger, so the rejected value aborts with no handlers to restore.
+    with pytest.raises(SystemExit) as excinfo:
         cli.main(["publish", "--workspace-root", str(tmp_path)])
 
-    assert cli.LOG_LEVEL_ENV_VAR in str(excinfo.value)
+    assert cli.LOG_LEVEL_ENV_VAR in excinfo.value.args[0]
 
 
-@pytest.mark.usefixtures("minimal_config")
+@pytest.mark.usefixtures("minimal_config", "patched_workspace")
 def test_bump_cli_accepts_dry_run_flag(
-    monkeypatch: pytest.MonkeyPatch,
     tmp_path: Path,
+    record_bump_run: dict[str, typ.Any],
 ) -> None:
     """The CLI passes ``dry_run=True`` when the flag is provided."""
-    workspace_graph = _make_workspace(tmp_path.resolve())
-    captured_kwargs: dict[str, typ.Any] = {}
-
-    def fake_run(*args: object, **kwargs: object) -> str:
-        captured_kwargs.update(kwargs)
-        return "preview"
-
-    monkeypatch.setattr(bump_command, "run", fake_run)
-    monkeypatch.setattr(cli, "load_workspace", lambda _: workspace_graph)
-
     exit_code = cli.main([
         "--workspace-root",
         str(tmp_path),
@@ -396,7 +446,7 @@ def test_bump_cli_accepts_dry_run_flag(
     ])
 
     assert exit_code == 0
-    options = captured_kwargs["options"]
+    options = record_bump_run["options"]
     assert isinstance(options, bump_command.BumpOptions)
     assert options.dry_run is True
     repository = options.lockfile_repository
@@ -466,7 +516,7 @@ def test_resolve_allow_unpublished_workspace_deps_matrix(
     assert debug_records[0].getMessage() == snapshot
 
 
-@pytest.mark.usefixtures("minimal_config")
+@pytest.mark.usefixtures("minimal_config", "patched_workspace")
 @pytest.mark.parametrize(
     ("extra_args", "expected"),
     [
@@ -491,7 +541,6 @@ def test_publish_cli_passes_unpublished_workspace_deps_flag(
     expected: object,
 ) -> None:
     """The CLI resolves omitted, enabled, and disabled flag states."""
-    workspace_graph = _make_workspace(tmp_path.resolve())
     captured_options: dict[str, publish_command.PublishOptions] = {}
 
     def fake_run(
@@ -507,7 +556,6 @@ def test_publish_cli_passes_unpublished_workspace_deps_flag(
         return "publish"
 
     monkeypatch.setattr(publish_command, "run", fake_run)
-    monkeypatch.setattr(cli, "load_workspace", lambda _: workspace_graph)
 
     exit_code = cli.main([
         "--workspace-root",
@@ -552,25 +600,17 @@ def test_publish_cli_passes_unpublished_workspace_deps_flag(
         ),
     ],
 )
+@pytest.mark.usefixtures("patched_workspace")
 def test_bump_cli_forwards_raw_rebuild_lockfiles(
-    monkeypatch: pytest.MonkeyPatch,
     tmp_path: Path,
     write_config: cabc.Callable[[str], Path],
     config_body: str,
     extra_args: list[str],
     expected: object,
+    record_bump_run: dict[str, typ.Any],
 ) -> None:
     """The CLI forwards the nullable flag; resolution belongs to the command."""
     write_config(config_body)
-    workspace_graph = _make_workspace(tmp_path.resolve())
-    captured_kwargs: dict[str, typ.Any] = {}
-
-    def fake_run(*args: object, **kwargs: object) -> str:
-        captured_kwargs.update(kwargs)
-        return "bumped"
-
-    monkeypatch.setattr(bump_command, "run", fake_run)
-    monkeypatch.setattr(cli, "load_workspace", lambda _: workspace_graph)
 
     exit_code = cli.main([
         "--workspace-root",
@@ -581,25 +621,29 @@ def test_bump_cli_forwards_raw_rebuild_lockfiles(
     ])
 
     assert exit_code == 0
-    options = captured_kwargs["options"]
+    options = record_bump_run["options"]
     assert isinstance(options, bump_command.BumpOptions)
     assert options.rebuild_lockfiles is expected
 
 
+_EXCEPTION_CASES: tuple[ExceptionHandlingCase, ...] = (
+    ExceptionHandlingCase(
+        exception=KeyboardInterrupt(),
+        expected_exit_code=130,
+        expected_message="Operation cancelled",
+    ),
+    ExceptionHandlingCase(
+        exception=RuntimeError("boom"),
+        expected_exit_code=1,
+        expected_message="Unexpected error",
+    ),
+)
+
+
 @pytest.mark.parametrize(
     "case",
-    [
-        ExceptionHandlingCase(
-            exception=KeyboardInterrupt(),
-            expected_exit_code=130,
-            expected_message="Operation cancelled",
-        ),
-        ExceptionHandlingCase(
-            exception=RuntimeError("boom"),
-            expected_exit_code=1,
-            expected_message="Unexpected error",
-        ),
-    ],
+    _EXCEPTION_CASES,
+    ids=[type(case.exception).__name__ for case in _EXCEPTION_CASES],
 )
 @pytest.mark.usefixtures("minimal_config")
 def test_main_handles_exceptions(
@@ -642,64 +686,41 @@ def test_bump_command_validates_version(
 
 @pytest.mark.usefixtures("minimal_config")
 def test_bump_command_accepts_extended_semver(
-    capsys: pytest.CaptureFixture[str],
-    monkeypatch: pytest.MonkeyPatch,
     tmp_path: Path,
+    resolved_tmp_path: Path,
+    patched_workspace: WorkspaceGraph,
+    record_bump_run: dict[str, typ.Any],
 ) -> None:
     """Accept semantic versions with pre-release and build metadata."""
-    graph = _make_workspace(tmp_path.resolve())
-    monkeypatch.setattr(cli, "load_workspace", lambda _: graph)
-    captured: dict[str, object] = {}
-
-    def fake_run(
-        workspace_root: Path,
-        version: str,
-        *,
-        options: bump_command.BumpOptions,
-    ) -> str:
-        captured["workspace_root"] = workspace_root
-        captured["version"] = version
-        captured["options"] = options
-        return "ok"
-
-    monkeypatch.setattr(bump_command, "run", fake_run)
+    captured = record_bump_run
     version = "1.2.3-alpha.1+build.5"
     exit_code = cli.main(["bump", version, "--workspace-root", str(tmp_path)])
     assert exit_code == 0
-    capsys.readouterr()
-    assert captured["workspace_root"] == tmp_path.resolve()
+    assert captured["workspace_root"] == resolved_tmp_path
     assert captured["version"] == version
     options = captured["options"]
     assert isinstance(options, bump_command.BumpOptions)
     assert isinstance(options.configuration, config_module.LadingConfig)
-    assert options.workspace is graph
+    assert options.workspace is patched_workspace
     assert options.dry_run is False
 
 
 @pytest.mark.usefixtures("minimal_config")
 def test_cyclopts_invoke_uses_workspace_env(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    tmp_path: Path,
+    resolved_tmp_path: Path,
+    patched_workspace: WorkspaceGraph,
+    record_bump_run: dict[str, typ.Any],
 ) -> None:
     """Invoke the Cyclopts app directly with workspace override propagation."""
-    graph = _make_workspace(tmp_path.resolve())
-    monkeypatch.setattr(cli, "load_workspace", lambda _: graph)
-
-    def fake_run(
-        workspace_root: Path,
-        version: str,
-        *,
-        options: bump_command.BumpOptions,
-    ) -> str:
-        assert workspace_root == tmp_path.resolve()
-        assert version == "4.5.6"
-        assert isinstance(options.configuration, config_module.LadingConfig)
-        assert options.workspace is graph
-        assert options.dry_run is False
-        return "bump summary"
-
-    monkeypatch.setattr(bump_command, "run", fake_run)
     result = cli.app(["bump", "4.5.6", "--workspace-root", str(tmp_path)])
     assert result == "bump summary"
+    assert record_bump_run["workspace_root"] == resolved_tmp_path
+    assert record_bump_run["version"] == "4.5.6"
+    options = record_bump_run["options"]
+    assert isinstance(options.configuration, config_module.LadingConfig)
+    assert options.workspace is patched_workspace
+    assert options.dry_run is False
 
 
 def test_workspace_env_sets_and_restores(
@@ -713,9 +734,10 @@ def test_workspace_env_sets_and_restores(
 
 
 def test_run_with_context_branches_behave_identically(
-    monkeypatch: pytest.MonkeyPatch,
     tmp_path: Path,
+    resolved_tmp_path: Path,
     write_config: cabc.Callable[[str], Path],
+    patched_workspace: WorkspaceGraph,
 ) -> None:
     """Pre-loaded and freshly-loaded configuration take the same path.
 
@@ -724,8 +746,6 @@ def test_run_with_context_branches_behave_identically(
     downstream behaviour for each.
     """
     write_config("")
-    workspace_graph = _make_workspace(tmp_path.resolve())
-    monkeypatch.setattr(cli, "load_workspace", lambda _: workspace_graph)
     calls: list[tuple[object, ...]] = []
 
     def runner(
@@ -737,18 +757,18 @@ def test_run_with_context_branches_behave_identically(
         calls.append((root, configuration, workspace, command_runner))
         return "ran"
 
-    fresh_result = cli._run_with_context(tmp_path.resolve(), runner)
+    fresh_result = cli._run_with_context(resolved_tmp_path, runner)
 
     configuration = config_module.load_configuration(tmp_path)
     with config_module.use_configuration(configuration):
-        preloaded_result = cli._run_with_context(tmp_path.resolve(), runner)
+        preloaded_result = cli._run_with_context(resolved_tmp_path, runner)
 
     assert fresh_result == preloaded_result == "ran", (
         "both branches must return the runner's result"
     )
     assert len(calls) == 2, "the runner should execute exactly once per branch"
     fresh_call, preloaded_call = calls
-    assert fresh_call[0] == preloaded_call[0] == tmp_path.resolve(), (
+    assert fresh_call[0] == preloaded_call[0] == resolved_tmp_path, (
         "both branches must pass the resolved workspace root"
     )
     assert isinstance(fresh_call[1], config_module.LadingConfig), (
@@ -757,10 +777,10 @@ def test_run_with_context_branches_behave_identically(
     assert preloaded_call[1] is configuration, (
         "the preloaded branch must reuse the active configuration object"
     )
-    assert fresh_call[2] is workspace_graph, (
+    assert fresh_call[2] is patched_workspace, (
         "the fresh branch must pass the loaded workspace graph"
     )
-    assert preloaded_call[2] is workspace_graph, (
+    assert preloaded_call[2] is patched_workspace, (
         "the preloaded branch must pass the loaded workspace graph"
     )
 
@@ -768,7 +788,9 @@ def test_run_with_context_branches_behave_identically(
 def test_publish_via_app_matches_across_config_branches(
     monkeypatch: pytest.MonkeyPatch,
     tmp_path: Path,
+    resolved_tmp_path: Path,
     minimal_config: Path,
+    patched_workspace: WorkspaceGraph,
 ) -> None:
     """Public ``lading publish`` behaves the same for both config branches.
 
@@ -782,8 +804,6 @@ def test_publish_via_app_matches_across_config_branches(
     assert minimal_config.exists(), (
         "the minimal_config fixture must write lading.toml for the disk-loaded path"
     )
-    workspace_graph = _make_workspace(tmp_path.resolve())
-    monkeypatch.setattr(cli, "load_workspace", lambda _: workspace_graph)
     calls: list[tuple[Path, config_module.LadingConfig, WorkspaceGraph]] = []
 
     def fake_run(
@@ -819,10 +839,10 @@ def test_publish_via_app_matches_across_config_branches(
     disk_call, preloaded_call = calls
     # Identical downstream behaviour: same workspace root, same injected
     # workspace graph, and equal configuration content for both branches.
-    assert disk_call[0] == preloaded_call[0] == tmp_path.resolve(), (
+    assert disk_call[0] == preloaded_call[0] == resolved_tmp_path, (
         "both branches must pass the resolved workspace root"
     )
-    assert disk_call[2] is preloaded_call[2] is workspace_graph, (
+    assert disk_call[2] is preloaded_call[2] is patched_workspace, (
         "both branches must pass the injected workspace graph"
     )
     assert disk_call[1] == preloaded_call[1], (
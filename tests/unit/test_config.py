@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-import textwrap
+import re
+import tomllib
 import typing as typ
 
 import pytest
@@ -13,35 +14,52 @@ if typ.TYPE_CHECKING:
     from pathlib import Path
 
 
+# Written without indentation so ``_write_config`` can emit it verbatim.
+_REPRESENTATIVE_CONFIG = """\
+[bump]
+exclude = ["internal"]
+lockfile_manifests = ["crates/nested/Cargo.toml"]
+rebuild_lockfiles = false
+
+[bump.documentation]
+globs = ["README.md", "docs/**/*.md"]
+
+[publish]
+exclude = ["examples"]
+order = ["core"]
+strip_patches = "all"
+
+[preflight]
+test_exclude = ["cucumber"]
+unit_tests_only = true
+"""
+
+
 def _write_config(tmp_path: Path, body: str) -> Path:
     config_path = tmp_path / config_module.CONFIG_FILENAME
-    config_path.write_text(textwrap.dedent(body).lstrip())
+    config_path.write_text(body)
     return config_path
 
 
+@pytest.fixture(scope="module")
+def empty_configuration(
+    tmp_path_factory: pytest.TempPathFactory,
+) -> config_module.LadingConfig:
+    """Load an empty ``lading.toml`` once for the context-manager tests.
+
+    Returns
+    -------
+    config_module.LadingConfig
+        Configuration parsed from a workspace whose ``lading.toml`` is empty.
+    """
+    root = tmp_path_factory.mktemp("empty_config")
+    _write_config(root, "")
+    return config_module.load_configuration(root)
+
+
 def test_load_configuration_parses_values(tmp_path: Path) -> None:
     """Load a representative configuration document."""
-    _write_config(
-        tmp_path,
-        """
-        [bump]
-        exclude = ["internal"]
-        lockfile_manifests = ["crates/nested/Cargo.toml"]
-        rebuild_lockfiles = false
-
-        [bump.documentation]
-        globs = ["README.md", "docs/**/*.md"]
-
-        [publish]
-        exclude = ["examples"]
-        order = ["core"]
-        strip_patches = "all"
-
-        [preflight]
-        test_exclude = ["cucumber"]
-        unit_tests_only = true
-        """,
-    )
+    _write_config(tmp_path, _REPRESENTATIVE_CONFIG)
 
     configuration = config_module.load_configuration(tmp_path)
 
@@ -63,85 +81,60 @@ def test_load_configuration_parses_values(tmp_path: Path) -> None:
     "config_body",
     [
         pytest.param(
-            """
-            [publish]
-            strip_patches = true
-            """,
+            "[publish]\nstrip_patches = true\n",
             id="invalid_strip_patches_bool",
         ),
         pytest.param(
-            """
-            [publish]
-            strip_patches = "unexpected"
-            """,
+            '[publish]\nstrip_patches = "unexpected"\n',
             id="invalid_strip_patches_string",
         ),
         pytest.param(
-            """
-            [bump]
-            lockfile_manifests = [1]
-            """,
+            "[bump]\nlockfile_manifests = [1]\n",
             id="bump_invalid_lockfile_manifests",
         ),
         pytest.param(
-            """
-            [bump]
-            rebuild_lockfiles = "sometimes"
-            """,
+            '[bump]\nrebuild_lockfiles = "sometimes"\n',
             id="bump_invalid_rebuild_lockfiles",
         ),
         pytest.param(
-            """
-            [bump]
-            exclude = []
-
-            [bump.documentation]
-            unknown = "value"
-            """,
+            '[bump]\nexclude = []\n\n[bump.documentation]\nunknown = "value"\n',
             id="documentation_unknown",
         ),
         pytest.param(
-            """
-            [publish]
-            unexpected = "value"
-            """,
+            '[publish]\nunexpected = "value"\n',
             id="unknown_keys",
         ),
         pytest.param(
-            """
-            [preflight]
-            unknown = true
-            """,
+            "[preflight]\nunknown = true\n",
             id="preflight_unknown_key",
         ),
         pytest.param(
-            """
-            [preflight]
-            test_exclude = ["alpha", 1]
-            """,
+            '[preflight]\ntest_exclude = ["alpha", 1]\n',
             id="preflight_invalid_type",
         ),
         pytest.param(
-            """
-            [preflight]
-            unit_tests_only = "sometimes"
-            """,
+            '[preflight]\nunit_tests_only = "sometimes"\n',
             id="preflight_invalid_boolean",
         ),
         pytest.param(
-            """
-            [unknown]
-            value = 1
-            """,
+            "[unknown]\nvalue = 1\n",
             id="unknown_sections",
         ),
     ],
 )
-def test_load_configuration_rejects_invalid_values(
-    tmp_path: Path, config_body: str
-) -> None:
+def test_from_mapping_rejects_invalid_values(config_body: str) -> None:
     """Reject invalid configuration values and structures."""
-    _write_config(tmp_path, config_body)
+    # Every case is valid TOML, so validation is exercised on the parsed
+    # table directly; the disk round trip is covered once below.
+    mapping = tomllib.loads(config_body)
+
+    with pytest.raises(config_module.ConfigurationError):
+        config_module.LadingConfig.from_mapping(mapping)
+
+
+def test_load_configuration_rejects_invalid_values(tmp_path: Path) -> None:
+    """Validation errors propagate out of the file-backed loader."""
+    _write_config(tmp_path, "[unknown]\nvalue = 1\n")
 
     with pytest.raises(config_module.ConfigurationError):
         config_module.load_configuration(tmp_path)
@@ -228,10 +221,11 @@ def test_preflight_config_from_mapping_drops_blank_entries() -> None:
     assert configuration.test_exclude == ()
 
 
-def test_use_configuration_sets_context(tmp_path: Path) -> None:
+def test_use_configuration_sets_context(
+    empty_configuration: config_module.LadingConfig,
+) -> None:
     """The configuration context manager exposes the active configuration."""
-    _write_config(tmp_path, "")
-    configuration = config_module.load_configuration(tmp_path)
+    configuration = empty_configuration
 
     with pytest.raises(config_module.ConfigurationNotLoadedError):
         config_module.current_configuration()
@@ -263,11 +257,14 @@ def test_preflight_config_parses_extended_fields() -> None:
     assert configuration.unit_tests_only is False
 
 
+_UNKNOWN_SECTION_RE = re.compile(r"Unknown configuration section\(s\): unexpected\.")
+
+
 def test_validate_mapping_keys_reports_unknown_section() -> None:
     """Unknown keys in a configuration section should raise a clear error."""
     with pytest.raises(
         config_module.ConfigurationError,
-        match=r"Unknown configuration section\(s\): unexpected.",
+        match=_UNKNOWN_SECTION_RE,
     ):
         config_module._validate_mapping_keys(
             {"unexpected": True}, set(), "configuration section"
@@ -326,15 +323,14 @@ def test_strip_patches_rejects_true_and_unknown_values() -> None:
         config_module.current_configuration()
 
 
-def test_nested_use_configuration_contexts(tmp_path: Path) -> None:
+def test_nested_use_configuration_contexts(
+    empty_configuration: config_module.LadingConfig,
+) -> None:
     """Nested configuration contexts restore the previous configuration."""
-    _write_config(tmp_path, "")
-    config_a = config_module.load_configuration(tmp_path)
-
-    alternate_root = tmp_path.parent / f"{tmp_path.name}_alt"
-    alternate_root.mkdir()
-    _write_config(alternate_root, "")
-    config_b = config_module.load_configuration(alternate_root)
+    # The contexts compare by identity, so a freshly constructed default is a
+    # distinct configuration from the parsed one even though they are equal.
+    config_a = empty_configuration
+    config_b = config_module.LadingConfig()
 
     with config_module.use_configuration(config_a):
         assert config_module.current_configuration() is config_a
@@ -2,19 +2,52 @@
 
 from __future__ import annotations
 
+import collections
 import json
+import re
 import typing as typ
 
+import pytest
+
 from tests.e2e.helpers import workspace_builder
 
-if typ.TYPE_CHECKING:  # pragma: no cover
+if typ.TYPE_CHECKING:
     from pathlib import Path
 
+# README tokens the structure test counts in one pass: fences (with or
+# without the ``toml`` tag), the dependency header, and ``name = "x.y.z"``
+# requirement lines.
+_README_TOKEN_RE = re.compile(
+    r'```(?:toml)?|\[dependencies\]|^[\w-]+ = "[^"]+"$', re.MULTILINE
+)
+
+
+class _BuiltWorkspace(typ.NamedTuple):
+    """The non-trivial workspace and the root it was requested at."""
+
+    requested_root: Path
+    workspace: workspace_builder.NonTrivialWorkspace
+
 
-def test_create_nontrivial_workspace_writes_expected_structure(tmp_path: Path) -> None:
+@pytest.fixture(scope="module")
+def nontrivial_workspace(
+    tmp_path_factory: pytest.TempPathFactory,
+) -> _BuiltWorkspace:
+    """Build the non-trivial E2E workspace once for this module."""
+    # Both tests only read the generated files and metadata, so a single
+    # build can be shared without copying it per test.
+    workspace_root = tmp_path_factory.mktemp("e2e_builder") / "workspace"
+    return _BuiltWorkspace(
+        requested_root=workspace_root,
+        workspace=workspace_builder.create_nontrivial_workspace(workspace_root),
+    )
+
+
+def test_create_nontrivial_workspace_writes_expected_structure(
+    nontrivial_workspace: _BuiltWorkspace,
+) -> None:
     """Build the E2E workspace and verify core files exist."""
-    workspace_root = tmp_path / "workspace"
-    workspace = workspace_builder.create_nontrivial_workspace(workspace_root)
+    workspace_root, workspace = nontrivial_workspace
 
     assert workspace.root == workspace_root
     assert workspace.crate_names == ("core", "utils", "app")
@@ -23,13 +56,14 @@ def test_create_nontrivial_workspace_writes_expected_structure(tmp_path: Path) -
     assert (workspace_root / "lading.toml").exists()
 
     readme_text = (workspace_root / "README.md").read_text(encoding="utf-8")
-    assert readme_text.count("```") >= 2, (
-        "expected README to contain a fenced TOML block"
+    tokens = collections.Counter(
+        match.group() for match in _README_TOKEN_RE.finditer(readme_text)
     )
-    assert "```toml" in readme_text
-    assert "[dependencies]" in readme_text
+    assert tokens["```toml"] >= 1, "expected README to open a fenced TOML block"
+    assert tokens["```"] >= 1, "expected README to close the fenced TOML block"
+    assert tokens["[dependencies]"] >= 1
     for crate_name in workspace.crate_names:
-        assert f'{crate_name} = "{workspace.version}"' in readme_text
+        assert tokens[f'{crate_name} = "{workspace.version}"'] >= 1
 
     config_text = (workspace_root / "lading.toml").read_text(encoding="utf-8")
     assert "[bump.documentation]" in config_text
@@ -44,13 +78,12 @@ def test_create_nontrivial_workspace_writes_expected_structure(tmp_path: Path) -
 
 
 def test_create_nontrivial_workspace_metadata_payload_is_json_serialisable(
-    tmp_path: Path,
+    nontrivial_workspace: _BuiltWorkspace,
 ) -> None:
     """Ensure the workspace metadata stub is a JSON-serialisable mapping."""
-    workspace_root = tmp_path / "workspace"
-    workspace = workspace_builder.create_nontrivial_workspace(workspace_root)
+    workspace_root, workspace = nontrivial_workspace
 
-    payload = dict(workspace.cargo_metadata_payload)
+    payload = workspace.cargo_metadata_payload
     assert payload["workspace_root"] == str(workspace_root)
     assert len(payload["packages"]) == 3
     assert payload["workspace_members"] == ["core-id", "utils-id", "app-id"]
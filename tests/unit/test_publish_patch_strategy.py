@@ -9,7 +9,7 @@ import typing as typ
 import pytest
 from tomlkit import parse as parse_toml
 
-from lading.commands import publish
+from lading.commands import publish, publish_manifest
 
 if typ.TYPE_CHECKING:
     from pathlib import Path
@@ -21,13 +21,20 @@ if typ.TYPE_CHECKING:
 
 @dc.dataclass(frozen=True)
 class _PatchStrategyTestSetup:
-    """Parameters for patch strategy test setup."""
+    """Parameters for a single patch-strategy scenario.
 
-    tmp_path: Path
-    make_plan_factory: cabc.Callable[[Path, tuple[str, ...]], publish.PublishPlan]
+    ``expected_patch_entries`` lists the ``[patch.crates-io]`` keys that
+    should survive the strategy, or is ``None`` when the whole ``[patch]``
+    table should be gone. ``expected_modified`` is the value the in-memory
+    strategy should return.
+    """
+
+    test_id: str
     patch_entries: str
     publishable_names: tuple[str, ...]
     strategy: str | bool
+    expected_patch_entries: tuple[str, ...] | None
+    expected_modified: bool
 
 
 @pytest.fixture
@@ -70,109 +77,128 @@ def make_plan_factory(
     return _builder
 
 
-def _write_manifest(workspace_root: Path, body: str) -> Path:
-    manifest = workspace_root / "Cargo.toml"
-    manifest.parent.mkdir(parents=True, exist_ok=True)
-    manifest.write_text(body, encoding="utf-8")
-    return manifest
+# Workspace manifest prefix shared by every scenario; each case appends its
+# ``[patch.crates-io]`` entries.
+_BASE_MANIFEST = (
+    "[workspace]\n"
+    'members = ["crates/alpha"]\n\n'
+    "[workspace.package]\n"
+    'version = "0.1.0"\n\n'
+)
 
 
 def _base_manifest(entries: str = "") -> str:
-    return (
-        "[workspace]\n"
-        'members = ["crates/alpha"]\n\n'
-        "[workspace.package]\n"
-        'version = "0.1.0"\n\n'
-        f"{entries}"
-    )
+    return f"{_BASE_MANIFEST}{entries}"
 
 
-def _apply_strategy_and_parse(setup: _PatchStrategyTestSetup) -> TOMLDocument:
+def _apply_strategy_and_parse(
+    tmp_path: Path,
+    make_plan_factory: cabc.Callable[[Path, tuple[str, ...]], publish.PublishPlan],
+    setup: _PatchStrategyTestSetup,
+) -> TOMLDocument:
     """Set up workspace, apply patch strategy, and return parsed document."""
-    workspace_root = setup.tmp_path / "workspace"
+    workspace_root = tmp_path / "workspace"
     workspace_root.mkdir()
-    manifest_text = _base_manifest(setup.patch_entries)
-    _write_manifest(workspace_root, manifest_text)
-    plan = setup.make_plan_factory(workspace_root, setup.publishable_names)
+    (workspace_root / "Cargo.toml").write_bytes(
+        _base_manifest(setup.patch_entries).encode("utf-8")
+    )
+    plan = make_plan_factory(workspace_root, setup.publishable_names)
     publish._apply_strip_patch_strategy(workspace_root, plan, setup.strategy)
     return parse_toml((workspace_root / "Cargo.toml").read_text(encoding="utf-8"))
 
 
-def test_strip_patches_all_removes_patch_section(
-    tmp_path: Path,
-    make_plan_factory: cabc.Callable[[Path, tuple[str, ...]], publish.PublishPlan],
+_PATCH_STRATEGY_CASES = (
+    _PatchStrategyTestSetup(
+        test_id="all",
+        patch_entries='[patch.crates-io]\nalpha = { path = "crates/alpha" }\n',
+        publishable_names=("alpha",),
+        strategy="all",
+        expected_patch_entries=None,
+        expected_modified=True,
+    ),
+    _PatchStrategyTestSetup(
+        test_id="per-crate-partial",
+        patch_entries=(
+            "[patch.crates-io]\n"
+            'alpha = { path = "crates/alpha" }\n'
+            'serde = { git = "https://example.com/serde" }\n'
+        ),
+        publishable_names=("alpha",),
+        strategy="per-crate",
+        expected_patch_entries=("serde",),
+        expected_modified=True,
+    ),
+    _PatchStrategyTestSetup(
+        test_id="per-crate-empty",
+        patch_entries=(
+            "[patch.crates-io]\n"
+            'alpha = { path = "crates/alpha" }\n'
+            'beta = { path = "crates/beta" }\n'
+        ),
+        publishable_names=("alpha", "beta"),
+        strategy="per-crate",
+        expected_patch_entries=None,
+        expected_modified=True,
+    ),
+    _PatchStrategyTestSetup(
+        test_id="disabled",
+        patch_entries='[patch.crates-io]\nalpha = { path = "crates/alpha" }\n',
+        publishable_names=("alpha",),
+        strategy=False,
+        expected_patch_entries=("alpha",),
+        expected_modified=False,
+    ),
+)
+
+
+def _assert_patch_entries(
+    document: TOMLDocument, setup: _PatchStrategyTestSetup
 ) -> None:
-    """Strategy 'all' removes the entire [patch.crates-io] section."""
-    document = _apply_strategy_and_parse(
-        _PatchStrategyTestSetup(
-            tmp_path=tmp_path,
-            make_plan_factory=make_plan_factory,
-            patch_entries='[patch.crates-io]\nalpha = { path = "crates/alpha" }\n',
-            publishable_names=("alpha",),
-            strategy="all",
+    """Check that ``document`` keeps exactly the expected patch entries."""
+    if setup.expected_patch_entries is None:
+        assert "patch" not in document, (
+            f"{setup.test_id}: the [patch] table should be removed"
+        )
+    else:
+        crates_io = document["patch"]["crates-io"]
+        assert tuple(crates_io) == setup.expected_patch_entries, (
+            f"{setup.test_id}: unexpected [patch.crates-io] entries"
         )
-    )
-    assert "patch" not in document
 
 
-def test_strip_patches_per_crate_removes_publishable_only(
-    tmp_path: Path,
-    make_plan_factory: cabc.Callable[[Path, tuple[str, ...]], publish.PublishPlan],
-) -> None:
-    """Strategy 'per-crate' removes only entries for publishable crates."""
-    document = _apply_strategy_and_parse(
-        _PatchStrategyTestSetup(
-            tmp_path=tmp_path,
-            make_plan_factory=make_plan_factory,
-            patch_entries=(
-                "[patch.crates-io]\n"
-                'alpha = { path = "crates/alpha" }\n'
-                'serde = { git = "https://example.com/serde" }\n'
-            ),
-            publishable_names=("alpha",),
-            strategy="per-crate",
-        )
-    )
-    patch_table = document.get("patch", {})
-    crates_io = patch_table.get("crates-io", {})
-    assert "alpha" not in crates_io
-    assert "serde" in crates_io
+@pytest.mark.parametrize(
+    "setup",
+    _PATCH_STRATEGY_CASES,
+    ids=[case.test_id for case in _PATCH_STRATEGY_CASES],
+)
+def test_strip_patches_strategies(setup: _PatchStrategyTestSetup) -> None:
+    """Each strategy keeps exactly the expected ``[patch.crates-io]`` entries.
 
+    ``all`` drops the section, ``per-crate`` removes publishable crates and
+    cleans up the table once it is empty, and ``False`` leaves it untouched.
+    The strategy runs on the parsed document, so no manifest is written.
+    """
+    document = parse_toml(_base_manifest(setup.patch_entries))
 
-def test_strip_patches_per_crate_removes_entire_table_when_empty(
-    tmp_path: Path,
-    make_plan_factory: cabc.Callable[[Path, tuple[str, ...]], publish.PublishPlan],
-) -> None:
-    """Per-crate strategy cleans up empty patch tables after removals."""
-    document = _apply_strategy_and_parse(
-        _PatchStrategyTestSetup(
-            tmp_path=tmp_path,
-            make_plan_factory=make_plan_factory,
-            patch_entries=(
-                "[patch.crates-io]\n"
-                'alpha = { path = "crates/alpha" }\n'
-                'beta = { path = "crates/beta" }\n'
-            ),
-            publishable_names=("alpha", "beta"),
-            strategy="per-crate",
-        )
+    modified = publish_manifest._strip_manifest_patches(
+        document, setup.strategy, setup.publishable_names
+    )
+
+    assert modified is setup.expected_modified, (
+        f"{setup.test_id}: unexpected modification flag"
     )
-    assert "patch" not in document
+    _assert_patch_entries(document, setup)
 
 
-def test_strip_patches_disabled_keeps_section(
+def test_strip_patches_rewrites_staged_manifest(
     tmp_path: Path,
     make_plan_factory: cabc.Callable[[Path, tuple[str, ...]], publish.PublishPlan],
 ) -> None:
-    """Boolean false leaves the patch section untouched."""
-    document = _apply_strategy_and_parse(
-        _PatchStrategyTestSetup(
-            tmp_path=tmp_path,
-            make_plan_factory=make_plan_factory,
-            patch_entries='[patch.crates-io]\nalpha = { path = "crates/alpha" }\n',
-            publishable_names=("alpha",),
-            strategy=False,
-        )
+    """The file-backed wrapper persists the stripped manifest to disk."""
+    setup = next(
+        case for case in _PATCH_STRATEGY_CASES if case.test_id == "per-crate-partial"
     )
-    patch_table = document.get("patch", {})
-    assert "crates-io" in patch_table
+
+    document = _apply_strategy_and_parse(tmp_path, make_plan_factory, setup)
+
+    _assert_patch_entries(document, setup)
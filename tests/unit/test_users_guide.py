@@ -4,58 +4,102 @@ from __future__ import annotations
 
 from pathlib import Path
 
+import pytest
+
 from lading import config as config_module
 
 
-def test_users_guide_includes_required_sections() -> None:
+@pytest.fixture(scope="module")
+def users_guide_content() -> str:
+    """Read ``docs/users-guide.md`` once for every guide coverage test."""
+    return Path("docs/users-guide.md").read_text(encoding="utf-8")
+
+
+# Every documented table header plus each supported key in backticks; the
+# ``documentation`` key is covered by its ``[bump.documentation]`` table.
+_SUPPORTED_CONFIG_KEYS = tuple(
+    sorted(
+        (set(config_module.BUMP_TOML_KEYS) - {"documentation"})
+        | set(config_module.BUMP_DOCUMENTATION_TOML_KEYS)
+        | set(config_module.PUBLISH_TOML_KEYS)
+        | set(config_module.PREFLIGHT_TOML_KEYS)
+    )
+)
+_REQUIRED_CONFIG_TERMS = (
+    "[bump]",
+    "[bump.documentation]",
+    "[publish]",
+    "[preflight]",
+    *(f"`{key}`" for key in _SUPPORTED_CONFIG_KEYS),
+)
+_REQUIRED_CLI_TERMS = (
+    "lading bump 1.2.3 --dry-run",
+    "lading publish --forbid-dirty",
+    "lading publish --live",
+    "### `--workspace-root`",
+)
+_REQUIRED_ENV_TERMS = (
+    "`LADING_WORKSPACE_ROOT`",
+    "`LADING_LOG_LEVEL`",
+)
+
+
+def _missing_terms(content: str, terms: tuple[str, ...]) -> list[str]:
+    """Return the ``terms`` absent from ``content``."""
+    # Check each term independently: a single alternation sweep consumes the
+    # longest match, hiding any term that is a prefix of it at that position.
+    return [term for term in terms if term not in content]
+
+
+@pytest.mark.parametrize(
+    ("content", "terms"),
+    [
+        pytest.param(
+            "lading publish --live",
+            ("lading publish", "lading publish --live"),
+            id="cli_prefix",
+        ),
+        pytest.param(
+            "### `--workspace-root`",
+            ("`--workspace-root`", "### `--workspace-root`"),
+            id="heading_suffix",
+        ),
+    ],
+)
+def test_missing_terms_finds_terms_nested_in_longer_terms(
+    content: str, terms: tuple[str, ...]
+) -> None:
+    """A term contained in another present term is not reported missing."""
+    assert _missing_terms(content, terms) == []
+
+
+def test_users_guide_includes_required_sections(users_guide_content: str) -> None:
     """Ensure the user guide exists and contains the Phase 4.2 requirements."""
-    guide_path = Path("docs/users-guide.md")
-    content = guide_path.read_text(encoding="utf-8")
+    content = users_guide_content
 
     assert "## Installation" in content
     assert "## Tutorial" in content
     assert "## Configuration reference (`lading.toml`)" in content
 
 
-def test_users_guide_documents_all_supported_config_keys() -> None:
+def test_users_guide_documents_all_supported_config_keys(
+    users_guide_content: str,
+) -> None:
     """Guard against documentation drift when the config schema changes."""
-    content = Path("docs/users-guide.md").read_text(encoding="utf-8")
-
-    supported_keys = set(config_module.BUMP_TOML_KEYS) - {"documentation"}
-    supported_keys.update(config_module.BUMP_DOCUMENTATION_TOML_KEYS)
-    supported_keys.update(config_module.PUBLISH_TOML_KEYS)
-    supported_keys.update(config_module.PREFLIGHT_TOML_KEYS)
-
-    required_terms = (
-        "[bump]",
-        "[bump.documentation]",
-        "[publish]",
-        "[preflight]",
-        *(f"`{key}`" for key in sorted(supported_keys)),
-    )
+    content = users_guide_content
 
-    missing = [term for term in required_terms if term not in content]
+    missing = _missing_terms(content, _REQUIRED_CONFIG_TERMS)
     assert not missing, f"users guide missing terms: {missing}"
 
 
-def test_users_guide_documents_key_cli_flags_and_env_vars() -> None:
+def test_users_guide_documents_key_cli_flags_and_env_vars(
+    users_guide_content: str,
+) -> None:
     """Guard against documentation drift for CLI flags and environment variables."""
-    content = Path("docs/users-guide.md").read_text(encoding="utf-8")
-
-    required_cli_terms = (
-        "lading bump 1.2.3 --dry-run",
-        "lading publish --forbid-dirty",
-        "lading publish --live",
-        "### `--workspace-root`",
-    )
-
-    required_env_terms = (
-        "`LADING_WORKSPACE_ROOT`",
-        "`LADING_LOG_LEVEL`",
-    )
+    content = users_guide_content
 
-    missing_cli = [term for term in required_cli_terms if term not in content]
-    missing_env = [term for term in required_env_terms if term not in content]
+    missing_cli = _missing_terms(content, _REQUIRED_CLI_TERMS)
+    missing_env = _missing_terms(content, _REQUIRED_ENV_TERMS)
 
     assert not missing_cli, f"users guide missing CLI terms: {missing_cli}"
     assert not missing_env, f"users guide missing env var terms: {missing_env}"
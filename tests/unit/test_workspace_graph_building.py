@@ -60,31 +60,33 @@ def _build_two_crate_metadata(
     }
 
 
-def test_build_workspace_graph_constructs_models(tmp_path: Path) -> None:
+# Flush-left manifests for the two-crate model test, so
+# ``create_test_manifest`` has no indentation to strip.
+_CRATE_MANIFEST_TOML: typ.Final[str] = """\
+[package]
+name = "crate"
+version = "0.1.0"
+readme.workspace = true
+
+[dependencies]
+helper = { path = "../helper", version = "0.1.0" }
+"""
+_HELPER_MANIFEST_TOML: typ.Final[str] = """\
+[package]
+name = "helper"
+version = "0.1.0"
+readme = "README.md"
+"""
+
+
+def test_build_workspace_graph_constructs_models(
+    tmp_path: Path, resolved_tmp_path: Path
+) -> None:
     """Convert metadata payloads into strongly typed workspace models."""
     workspace_root = tmp_path
-    crate_manifest = create_test_manifest(
-        workspace_root,
-        "crate",
-        """
-        [package]
-        name = "crate"
-        version = "0.1.0"
-        readme.workspace = true
-
-        [dependencies]
-        helper = { path = "../helper", version = "0.1.0" }
-        """,
-    )
+    crate_manifest = create_test_manifest(workspace_root, "crate", _CRATE_MANIFEST_TOML)
     helper_manifest = create_test_manifest(
-        workspace_root,
-        "helper",
-        """
-        [package]
-        name = "helper"
-        version = "0.1.0"
-        readme = "README.md"
-        """,
+        workspace_root, "helper", _HELPER_MANIFEST_TOML
     )
     metadata = _build_two_crate_metadata(
         workspace_root=workspace_root,
@@ -95,7 +97,7 @@ def test_build_workspace_graph_constructs_models(tmp_path: Path) -> None:
     graph = build_workspace_graph(metadata)
 
     assert isinstance(graph, WorkspaceGraph)
-    assert graph.workspace_root == workspace_root.resolve()
+    assert graph.workspace_root == resolved_tmp_path
     crates = graph.crates_by_name
     assert set(crates) == {"crate", "helper"}
     crate = crates["crate"]
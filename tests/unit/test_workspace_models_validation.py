@@ -3,15 +3,12 @@
 from __future__ import annotations
 
 import collections.abc as cabc
-import typing as typ
+from pathlib import Path
 
 import pytest
 
-from tests.helpers.workspace_metadata import build_test_package, create_test_manifest
-
-if typ.TYPE_CHECKING:  # pragma: no cover - typing helpers only
-    from pathlib import Path
 from lading.workspace import _coercion, graph_build, models
+from tests.helpers.workspace_metadata import build_test_package, create_test_manifest
 
 
 def test_is_ordering_dependency_skips_unknown_crates() -> None:
@@ -106,6 +103,20 @@ def test_collect_workspace_crates_builds_tuple_in_member_order(tmp_path: Path) -
     assert crates[2] == crates[0]
 
 
+@pytest.fixture(scope="module")
+def alpha_manifest(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Write the alpha manifest shared by the missing-member cases."""
+    return create_test_manifest(
+        tmp_path_factory.mktemp("missing_members"),
+        "alpha",
+        """
+        [package]
+        name = "alpha"
+        version = "0.1.0"
+        """,
+    )
+
+
 @pytest.mark.parametrize(
     "workspace_member_ids",
     [
@@ -116,19 +127,10 @@ def test_collect_workspace_crates_builds_tuple_in_member_order(tmp_path: Path) -
     ],
 )
 def test_collect_workspace_crates_rejects_missing_members(
-    tmp_path: Path,
+    alpha_manifest: Path,
     workspace_member_ids: tuple[str, ...],
 ) -> None:
     """Missing member IDs should raise ``WorkspaceModelError``."""
-    alpha_manifest = create_test_manifest(
-        tmp_path,
-        "alpha",
-        """
-        [package]
-        name = "alpha"
-        version = "0.1.0"
-        """,
-    )
     package_lookup = {
         "alpha-id": build_test_package("alpha", "0.1.0", alpha_manifest),
     }
@@ -155,26 +157,27 @@ def test_build_dependencies_handles_missing_entries() -> None:
     assert dependencies == ()
 
 
-@pytest.mark.parametrize(
-    ("callable_obj", "args"),
-    [
-        pytest.param(
-            graph_build._validate_dependency_mapping,
-            ("not-a-mapping",),
-            id="mapping_not_dict",
-        ),
-        pytest.param(
-            graph_build._validate_dependency_kind,
-            ({"kind": 123},),
-            id="kind_not_string",
-        ),
-        pytest.param(
-            graph_build._validate_dependency_kind,
-            ({"kind": "unknown"},),
-            id="kind_unsupported",
-        ),
-    ],
+# Malformed dependency entries paired with the validator that must reject them.
+_DEPENDENCY_VALIDATION_CASES = (
+    pytest.param(
+        graph_build._validate_dependency_mapping,
+        ("not-a-mapping",),
+        id="mapping_not_dict",
+    ),
+    pytest.param(
+        graph_build._validate_dependency_kind,
+        ({"kind": 123},),
+        id="kind_not_string",
+    ),
+    pytest.param(
+        graph_build._validate_dependency_kind,
+        ({"kind": "unknown"},),
+        id="kind_unsupported",
+    ),
 )
+
+
+@pytest.mark.parametrize(("callable_obj", "args"), _DEPENDENCY_VALIDATION_CASES)
 def test_dependency_validation_errors(
     callable_obj: cabc.Callable[..., object], args: tuple[object, ...]
 ) -> None:
@@ -191,30 +194,61 @@ def test_lookup_workspace_target_handles_missing_entries() -> None:
     assert result is None
 
 
-def test_path_normalisation_rejects_invalid_types() -> None:
+@pytest.mark.parametrize(
+    ("callable_obj", "args"),
+    [
+        pytest.param(
+            graph_build._normalise_workspace_root, (123,), id="workspace_root"
+        ),
+        pytest.param(
+            graph_build._normalise_manifest_path, (123, "field"), id="manifest_path"
+        ),
+    ],
+)
+def test_path_normalisation_rejects_invalid_types(
+    callable_obj: cabc.Callable[..., object], args: tuple[object, ...]
+) -> None:
     """Non-path types should be rejected for manifest and root paths."""
     with pytest.raises(models.WorkspaceModelError):
-        graph_build._normalise_workspace_root(123)
-    with pytest.raises(models.WorkspaceModelError):
-        graph_build._normalise_manifest_path(123, "field")
+        callable_obj(*args)
 
 
-def test_expect_sequence_validation() -> None:
-    """Sequence validation should honour allow_none and reject scalars."""
+def test_expect_sequence_allows_none_when_permitted() -> None:
+    """Sequence validation should honour allow_none."""
     assert _coercion._expect_sequence(None, "field", allow_none=True) is None
-    with pytest.raises(models.WorkspaceModelError):
-        _coercion._expect_sequence(None, "field")
-    with pytest.raises(models.WorkspaceModelError):
-        _coercion._expect_sequence("oops", "field")
 
 
-def test_expect_string_and_non_empty_sequence_checks() -> None:
-    """String and sequence coercion should reject invalid inputs."""
+@pytest.mark.parametrize(
+    ("callable_obj", "args"),
+    [
+        pytest.param(
+            _coercion._expect_sequence, (None, "field"), id="sequence_none_disallowed"
+        ),
+        pytest.param(
+            _coercion._expect_sequence, ("oops", "field"), id="sequence_scalar"
+        ),
+        pytest.param(_coercion._expect_string, (123, "field"), id="string_not_str"),
+    ],
+)
+def test_coercion_rejects_invalid_values(
+    callable_obj: cabc.Callable[..., object], args: tuple[object, ...]
+) -> None:
+    """Sequence and string coercion should reject invalid inputs."""
     with pytest.raises(models.WorkspaceModelError):
-        _coercion._expect_string(123, "field")
-    assert _coercion._is_non_empty_sequence([]) is False
-    assert _coercion._is_non_empty_sequence("abc") is False
-    assert _coercion._is_non_empty_sequence(["a"]) is True
+        callable_obj(*args)
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        pytest.param([], False, id="empty_list"),
+        pytest.param("abc", False, id="string"),
+        pytest.param(["a"], True, id="non_empty_list"),
+    ],
+)
+def test_is_non_empty_sequence(value: object, *, expected: bool) -> None:
+    """Only non-empty, non-string sequences count as populated."""
+    assert _coercion._is_non_empty_sequence(value) is expected
 
 
 def test_coerce_publish_setting_allows_sequences_and_bools() -> None:
@@ -226,12 +260,20 @@ def test_coerce_publish_setting_allows_sequences_and_bools() -> None:
         graph_build._coerce_publish_setting("invalid", "crate")
 
 
-def test_topological_sort_dedupes_duplicate_dependencies(tmp_path: Path) -> None:
-    """Duplicate edges should not force false dependency cycles."""
-    core_manifest = tmp_path / "crates" / "core" / "Cargo.toml"
-    utils_manifest = tmp_path / "crates" / "utils" / "Cargo.toml"
-    app_manifest = tmp_path / "crates" / "app" / "Cargo.toml"
+@pytest.fixture(scope="module")
+def diamond_workspace() -> models.WorkspaceGraph:
+    """Build a workspace whose app crate repeats its core dependency edge."""
+    root = Path("/workspace")
+    core_manifest = root / "crates" / "core" / "Cargo.toml"
+    utils_manifest = root / "crates" / "utils" / "Cargo.toml"
+    app_manifest = root / "crates" / "app" / "Cargo.toml"
 
+    core_dependency = models.WorkspaceDependency(
+        package_id="core-id",
+        name="core",
+        manifest_name="core",
+        kind=None,
+    )
     core = models.WorkspaceCrate(
         id="core-id",
         name="core",
@@ -250,14 +292,7 @@ def test_topological_sort_dedupes_duplicate_dependencies(tmp_path: Path) -> None
         root_path=utils_manifest.parent,
         publish=True,
         readme_is_workspace=False,
-        dependencies=(
-            models.WorkspaceDependency(
-                package_id="core-id",
-                name="core",
-                manifest_name="core",
-                kind=None,
-            ),
-        ),
+        dependencies=(core_dependency,),
     )
     app = models.WorkspaceCrate(
         id="app-id",
@@ -268,12 +303,7 @@ def test_topological_sort_dedupes_duplicate_dependencies(tmp_path: Path) -> None
         publish=True,
         readme_is_workspace=False,
         dependencies=(
-            models.WorkspaceDependency(
-                package_id="core-id",
-                name="core",
-                manifest_name="core",
-                kind=None,
-            ),
+            core_dependency,
             models.WorkspaceDependency(
                 package_id="core-id",
                 name="core",
@@ -289,32 +319,18 @@ def test_topological_sort_dedupes_duplicate_dependencies(tmp_path: Path) -> None
         ),
     )
 
-    workspace = models.WorkspaceGraph(
-        workspace_root=tmp_path,
-        crates=(core, utils, app),
-    )
+    return models.WorkspaceGraph(workspace_root=root, crates=(core, utils, app))
+
 
-    ordered = [crate.name for crate in workspace.topologically_sorted_crates()]
+def test_topological_sort_dedupes_duplicate_dependencies(
+    diamond_workspace: models.WorkspaceGraph,
+) -> None:
+    """Duplicate edges should not force false dependency cycles."""
+    ordered = [crate.name for crate in diamond_workspace.topologically_sorted_crates()]
     assert ordered == ["core", "utils", "app"]
 
 
-def test_extract_readme_workspace_flag_handles_non_mappings(tmp_path: Path) -> None:
+def test_extract_readme_workspace_flag_handles_non_mappings() -> None:
     """Non-mapping package tables should return False."""
     assert graph_build._extract_readme_workspace_flag("invalid") is False
     assert graph_build._extract_readme_workspace_flag({"readme": "README.md"}) is False
-
-
-def test_manifest_uses_workspace_readme_detects_flag(tmp_path: Path) -> None:
-    """Manifest helper should detect readme.workspace usage."""
-    manifest_path = tmp_path / "Cargo.toml"
-    manifest_path.write_text("[package]\nname = 'demo'\nreadme.workspace = true\n")
-    assert graph_build._manifest_uses_workspace_readme(manifest_path) is True
-
-
-def test_manifest_uses_workspace_readme_reports_parse_errors(tmp_path: Path) -> None:
-    """Malformed manifests should raise WorkspaceModelError."""
-    manifest_path = tmp_path / "Cargo.toml"
-    manifest_path.write_text("[package\n", encoding="utf-8")
-
-    with pytest.raises(models.WorkspaceModelError):
-        graph_build._manifest_uses_workspace_readme(manifest_path)
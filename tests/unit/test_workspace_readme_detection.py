@@ -0,0 +1,69 @@
+"""Tests for ``readme.workspace`` detection in workspace manifests."""
+
+from __future__ import annotations
+
+import typing as typ
+
+import pytest
+
+from lading.workspace import graph_build, models
+
+if typ.TYPE_CHECKING:  # pragma: no cover - typing helpers only
+    from pathlib import Path
+
+
+class _ReadmeManifests(typ.NamedTuple):
+    """Manifests shared by the ``readme.workspace`` detection tests."""
+
+    workspace_readme: Path
+    no_readme: Path
+    malformed: Path
+
+
+@pytest.fixture(scope="module")
+def readme_manifests(tmp_path_factory: pytest.TempPathFactory) -> _ReadmeManifests:
+    """Write the readme-detection manifests once for this module."""
+    manifest_dir = tmp_path_factory.mktemp("readme_manifests")
+    workspace_readme = manifest_dir / "workspace-readme.toml"
+    workspace_readme.write_bytes(b"[package]\nname = 'demo'\nreadme.workspace = true\n")
+    no_readme = manifest_dir / "no-readme.toml"
+    no_readme.write_bytes(b"[package]\nname = 'demo'\n")
+    malformed = manifest_dir / "malformed.toml"
+    # The readme key keeps the parse from being skipped by the pre-filter.
+    malformed.write_bytes(b"[package\nreadme.workspace = true\n")
+    return _ReadmeManifests(
+        workspace_readme=workspace_readme, no_readme=no_readme, malformed=malformed
+    )
+
+
+def test_manifest_uses_workspace_readme_detects_flag(
+    readme_manifests: _ReadmeManifests,
+) -> None:
+    """Manifest helper should detect readme.workspace usage."""
+    manifest_path = readme_manifests.workspace_readme
+    assert graph_build._manifest_uses_workspace_readme(manifest_path) is True
+
+
+def test_manifest_uses_workspace_readme_skips_manifests_without_readme(
+    monkeypatch: pytest.MonkeyPatch,
+    readme_manifests: _ReadmeManifests,
+) -> None:
+    """Manifests that never mention a readme should report False unparsed."""
+
+    def _fail_parse(text: str) -> object:
+        """Fail the test if the TOML parser is reached."""
+        message = f"manifest should not be parsed: {text!r}"
+        raise AssertionError(message)
+
+    monkeypatch.setattr(graph_build, "parse", _fail_parse)
+
+    manifest_path = readme_manifests.no_readme
+    assert graph_build._manifest_uses_workspace_readme(manifest_path) is False
+
+
+def test_manifest_uses_workspace_readme_reports_parse_errors(
+    readme_manifests: _ReadmeManifests,
+) -> None:
+    """Malformed manifests should raise WorkspaceModelError."""
+    with pytest.raises(models.WorkspaceModelError):
+        graph_build._manifest_uses_workspace_readme(readme_manifests.malformed)
@@ -2,10 +2,29 @@
 
 from __future__ import annotations
 
+import typing as typ
+
 import pytest
+from cuprum import Program, UnknownProgramError, scoped, sh
 
+from lading import utils
 from lading.utils.commands import CARGO, GIT, LADING_CATALOGUE
 
+if typ.TYPE_CHECKING:
+    import collections.abc as cabc
+
+    from cuprum import SafeCmdBuilder
+
+# Programme deliberately absent from ``LADING_CATALOGUE``.
+_UNREGISTERED = Program("unregistered-program-xyz")
+# Full argv expected from the cargo builder's ``metadata`` invocation.
+_METADATA_ARGV: typ.Final[tuple[str, ...]] = (
+    "cargo",
+    "metadata",
+    "--format-version",
+    "1",
+)
+
 
 class TestLadingCatalogue:
     """Tests for the shared programme catalogue."""
@@ -14,43 +33,24 @@ class TestLadingCatalogue:
         """The catalogue should be importable from lading.utils.commands."""
         assert LADING_CATALOGUE is not None
 
-    def test_catalogue_registers_cargo(self) -> None:
-        """The catalogue should include cargo as an allowed programme."""
-        assert LADING_CATALOGUE.is_allowed(CARGO)
-
-    def test_catalogue_registers_git(self) -> None:
-        """The catalogue should include git as an allowed programme."""
-        assert LADING_CATALOGUE.is_allowed(GIT)
-
-    def test_catalogue_allowlist_contains_cargo_and_git(self) -> None:
-        """The catalogue allowlist should contain both cargo and git."""
-        allowlist = LADING_CATALOGUE.allowlist
-
-        assert CARGO in allowlist
-        assert GIT in allowlist
-
-    def test_catalogue_can_lookup_cargo(self) -> None:
-        """The catalogue should return a ProgramEntry for cargo."""
-        entry = LADING_CATALOGUE.lookup(CARGO)
+    @pytest.mark.parametrize("program", [CARGO, GIT], ids=["cargo", "git"])
+    def test_catalogue_registers_and_looks_up(self, program: Program) -> None:
+        """The catalogue should allow and resolve each lading programme."""
+        assert LADING_CATALOGUE.is_allowed(program)
+        assert program in LADING_CATALOGUE.allowlist
+        entry = LADING_CATALOGUE.lookup(program)
 
         assert entry is not None
-        assert entry.program == CARGO
+        assert entry.program == program
 
-    def test_catalogue_can_lookup_git(self) -> None:
-        """The catalogue should return a ProgramEntry for git."""
-        entry = LADING_CATALOGUE.lookup(GIT)
-
-        assert entry is not None
-        assert entry.program == GIT
+    def test_catalogue_allowlist_is_exactly_cargo_and_git(self) -> None:
+        """The allowlist should register nothing beyond cargo and git."""
+        assert LADING_CATALOGUE.allowlist == frozenset({CARGO, GIT})
 
     def test_catalogue_rejects_unregistered_program(self) -> None:
         """Unregistered programmes should raise UnknownProgramError."""
-        from cuprum import Program, UnknownProgramError
-
-        unregistered = Program("unregistered-program-xyz")
-
         with pytest.raises(UnknownProgramError):
-            LADING_CATALOGUE.lookup(unregistered)
+            LADING_CATALOGUE.lookup(_UNREGISTERED)
 
 
 class TestProgramConstants:
@@ -66,50 +66,49 @@ class TestProgramConstants:
 
     def test_programs_exported_from_utils_package(self) -> None:
         """Program constants should be accessible from lading.utils."""
-        from lading import utils
-
         assert utils.CARGO is CARGO
         assert utils.GIT is GIT
         assert utils.LADING_CATALOGUE is LADING_CATALOGUE
 
 
+@pytest.fixture(scope="class")
+def builders() -> cabc.Iterator[dict[str, SafeCmdBuilder]]:
+    """Yield cargo and git builders made inside one catalogue-scoped context.
+
+    Yields
+    ------
+    dict[str, SafeCmdBuilder]
+        Builders keyed by programme name, valid while the scope is active.
+    """
+    with scoped(allowlist=LADING_CATALOGUE.allowlist):
+        yield {
+            "cargo": sh.make(CARGO, catalogue=LADING_CATALOGUE),
+            "git": sh.make(GIT, catalogue=LADING_CATALOGUE),
+        }
+
+
 class TestScopedContext:
     """Tests for using the catalogue with cuprum's scoped context."""
 
-    def test_catalogue_can_be_used_in_scoped_context(self) -> None:
+    def test_catalogue_can_be_used_in_scoped_context(
+        self, builders: dict[str, SafeCmdBuilder]
+    ) -> None:
         """The catalogue should work with scoped() context manager."""
-        from cuprum import scoped, sh
+        assert builders["cargo"] is not None
+        assert builders["git"] is not None
 
-        with scoped(allowlist=LADING_CATALOGUE.allowlist):
-            cargo_builder = sh.make(CARGO, catalogue=LADING_CATALOGUE)
-            git_builder = sh.make(GIT, catalogue=LADING_CATALOGUE)
-
-            assert cargo_builder is not None
-            assert git_builder is not None
-
-    def test_scoped_context_allows_command_construction(self) -> None:
+    def test_scoped_context_allows_command_construction(
+        self, builders: dict[str, SafeCmdBuilder]
+    ) -> None:
         """Commands should be constructable within a scoped context."""
-        from cuprum import scoped, sh
-
-        with scoped(allowlist=LADING_CATALOGUE.allowlist):
-            cargo_builder = sh.make(CARGO, catalogue=LADING_CATALOGUE)
-            cmd = cargo_builder("metadata", "--format-version", "1")
+        cmd = builders["cargo"]("metadata", "--format-version", "1")
 
-            assert cmd.argv_with_program == (
-                "cargo",
-                "metadata",
-                "--format-version",
-                "1",
-            )
+        assert cmd.argv_with_program == _METADATA_ARGV
 
     def test_scoped_context_rejects_unregistered_program(self) -> None:
         """Unregistered programmes should raise UnknownProgramError in scope."""
-        from cuprum import Program, UnknownProgramError, scoped, sh
-
-        unregistered = Program("unregistered-program-xyz")
-
         with (
             scoped(allowlist=LADING_CATALOGUE.allowlist),
             pytest.raises(UnknownProgramError),
         ):
-            sh.make(unregistered, catalogue=LADING_CATALOGUE)
+            sh.make(_UNREGISTERED, catalogue=LADING_CATALOGUE)
@@ -20,6 +20,16 @@ else:  # pragma: no cover - typing helpers
     Path = typ.Any
     LogCaptureFixture = typ.Any
 
+# Logger handed to ``log_command_invocation`` by the invocation tests.
+_TEST_LOGGER = logging.getLogger("tests.utils.process")
+# Logger the module under test emits its empty-command warning on.
+_PROCESS_LOGGER_NAME = "lading.utils.process"
+
+# Messages shared by the empty-command and invocation logging assertions.
+_ECHO_MESSAGE: typ.Final[str] = "Running external command: echo hello"
+_EMPTY_COMMAND_MESSAGE: typ.Final[str] = "Running external command: <empty command>"
+_EMPTY_WARNING_FRAGMENT: typ.Final[str] = "empty command sequence"
+
 
 def test_format_command_renders_shell_representation() -> None:
     """Commands should be rendered using shell quoting rules."""
@@ -32,73 +42,62 @@ def test_format_command_warns_on_empty_command(
     caplog: LogCaptureFixture,
 ) -> None:
     """An empty command should emit a warning and return an empty string."""
-    caplog.set_level(logging.WARNING, logger="lading.utils.process")
+    caplog.set_level(logging.WARNING, logger=_PROCESS_LOGGER_NAME)
 
     rendered = process.format_command(())
 
     assert rendered == ""
-    assert "empty command sequence" in caplog.text
+    assert any(
+        _EMPTY_WARNING_FRAGMENT in message for _, _, message in caplog.record_tuples
+    )
 
 
 def test_log_command_invocation_includes_cwd(
     tmp_path: Path, caplog: LogCaptureFixture
 ) -> None:
     """``log_command_invocation`` should render the working directory."""
-    logger = logging.getLogger("tests.utils.process")
-    caplog.set_level(logging.INFO, logger="tests.utils.process")
+    caplog.set_level(logging.INFO, logger=_TEST_LOGGER.name)
 
-    process.log_command_invocation(logger, ("echo", "hello"), tmp_path)
+    process.log_command_invocation(_TEST_LOGGER, ("echo", "hello"), tmp_path)
 
-    assert "Running external command: echo hello (cwd=" in caplog.text
+    assert any(
+        message.startswith(f"{_ECHO_MESSAGE} (cwd=")
+        for _, _, message in caplog.record_tuples
+    )
 
 
 def test_log_command_invocation_omits_cwd_when_absent(
     caplog: LogCaptureFixture,
 ) -> None:
     """The working directory should be omitted when ``cwd`` is ``None``."""
-    logger = logging.getLogger("tests.utils.process")
-    caplog.set_level(logging.INFO, logger="tests.utils.process")
+    caplog.set_level(logging.INFO, logger=_TEST_LOGGER.name)
 
-    process.log_command_invocation(logger, ("echo", "hello"), None)
+    process.log_command_invocation(_TEST_LOGGER, ("echo", "hello"), None)
 
-    assert "Running external command: echo hello" in caplog.messages
-    assert not any("(cwd=" in message for message in caplog.messages)
+    record_tuples = caplog.record_tuples
+    assert (_TEST_LOGGER.name, logging.INFO, _ECHO_MESSAGE) in record_tuples
+    assert not any("(cwd=" in message for _, _, message in record_tuples)
 
 
-def test_log_command_invocation_flags_empty_command() -> None:
+def test_log_command_invocation_flags_empty_command(
+    caplog: LogCaptureFixture,
+) -> None:
     """Empty commands should log a warning and a placeholder message."""
-    logger = logging.getLogger("tests.utils.process")
-    logger.setLevel(logging.INFO)
-    warning_logger = logging.getLogger("lading.utils.process")
-    warning_logger.setLevel(logging.WARNING)
-
-    class _RecordingHandler(logging.Handler):
-        def __init__(self) -> None:
-            super().__init__()
-            self.records: list[logging.LogRecord] = []
-
-        def emit(self, record: logging.LogRecord) -> None:
-            self.records.append(record)
-
-    info_handler = _RecordingHandler()
-    warning_handler = _RecordingHandler()
-    logger.addHandler(info_handler)
-    warning_logger.addHandler(warning_handler)
-    try:
-        process.log_command_invocation(logger, (), None)
-    finally:
-        logger.removeHandler(info_handler)
-        warning_logger.removeHandler(warning_handler)
+    # ``set_level`` also adjusts the capture handler, so the INFO level must be
+    # applied last to keep the placeholder message.
+    caplog.set_level(logging.WARNING, logger=_PROCESS_LOGGER_NAME)
+    caplog.set_level(logging.INFO, logger=_TEST_LOGGER.name)
+
+    process.log_command_invocation(_TEST_LOGGER, (), None)
 
     assert any(
-        record.levelno == logging.INFO
-        and record.getMessage() == "Running external command: <empty command>"
-        for record in info_handler.records
+        record.levelno == logging.INFO and record.getMessage() == _EMPTY_COMMAND_MESSAGE
+        for record in caplog.records
     )
     assert any(
         record.levelno == logging.WARNING
-        and "empty command sequence" in record.getMessage()
-        for record in warning_handler.records
+        and _EMPTY_WARNING_FRAGMENT in record.getMessage()
+        for record in caplog.records
     )
 
 